@@ -4,6 +4,7 @@ Contains inbound and outbound port definitions.
 """
 
 from forging_blocks.application.ports.inbound.message_handler import (
+    BatchMessageHandler,
     CommandHandler,
     EventHandler,
     MessageHandler,
@@ -20,6 +21,7 @@ from forging_blocks.application.ports.outbound.unit_of_work import (
 )
 
 __all__ = [
+    "BatchMessageHandler",
     "CommandSender",
     "CommandHandler",
     "EventHandler",
@@ -1,5 +1,6 @@
 """Inbound port for handling messages asynchronously."""
 
+from collections.abc import Sequence
 from typing import Protocol, TypeVar
 
 from forging_blocks.domain.messages.command import Command
@@ -36,6 +37,28 @@ class MessageHandler(InboundPort[MessageType, MessageHandlerResultType], Protoco
         ...
 
 
+class BatchMessageHandler(MessageHandler[MessageType, MessageHandlerResultType], Protocol):
+    """Inbound port for handlers that can also handle several messages in one call.
+
+    Message buses deliver a batch dispatch to ``handle_batch`` instead of calling
+    ``handle`` once per message, so implementations can, for example, write a
+    whole batch of events to a store in a single round trip.
+    """
+
+    async def handle_batch(
+        self, messages: Sequence[MessageType]
+    ) -> Sequence[MessageHandlerResultType]:
+        """Handle several messages asynchronously, in the order given.
+
+        Args:
+            messages: The messages to be handled.
+
+        Returns:
+            One result per message, in the same order.
+        """
+        ...
+
+
 CommandHandler = MessageHandler[Command, None]
 QueryHandler = MessageHandler[Query, QueryResultType]
 EventHandler = MessageHandler[Event, None]
@@ -1,5 +1,7 @@
 """Outbound port for sending commands asynchronously."""
 
+from collections.abc import Sequence
+
 from forging_blocks.application.ports.outbound.message_bus import MessageBus
 from forging_blocks.domain.messages.command import Command
 
@@ -20,3 +22,11 @@ class CommandSender:
     async def send(self, command: Command) -> None:
         """Send a command asynchronously."""
         await self._message_bus.dispatch(command)
+
+    async def send_many(self, commands: Sequence[Command]) -> None:
+        """Send several commands asynchronously in one batched dispatch.
+
+        Args:
+            commands: The commands to send, in order.
+        """
+        await self._message_bus.dispatch_many(commands)
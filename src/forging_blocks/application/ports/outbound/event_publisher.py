@@ -1,5 +1,7 @@
 """Outbound port for publishing domain events asynchronously."""
 
+from collections.abc import Sequence
+
 from forging_blocks.application.ports.outbound.message_bus import MessageBus
 from forging_blocks.domain.messages.event import Event
 
@@ -28,3 +30,14 @@ class EventPublisher:
             event: The domain event to be published.
         """
         await self._message_bus.dispatch(event)
+
+    async def publish_many(self, events: Sequence[Event]) -> None:
+        """Publish several events asynchronously in one batched dispatch.
+
+        Events are delivered to each handler in the order given, which keeps the
+        order of events collected from an aggregate.
+
+        Args:
+            events: The domain events to be published, in order.
+        """
+        await self._message_bus.dispatch_many(events)
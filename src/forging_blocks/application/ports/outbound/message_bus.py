@@ -1,5 +1,6 @@
 """Outbound port for a message bus."""
 
+from collections.abc import Sequence
 from typing import Generic, Protocol, TypeVar
 
 from forging_blocks.application.ports.inbound.message_handler import MessageHandler
@@ -15,6 +16,20 @@ class MessageBus(Protocol, Generic[MessageBusResponse]):
         """Dispatch a message asynchronously."""
         ...
 
+    async def dispatch_many(self, messages: Sequence[Message]) -> Sequence[MessageBusResponse]:
+        """Dispatch several messages asynchronously, grouped by handler.
+
+        Messages are delivered to each handler in the order given, and handlers
+        that implement ``BatchMessageHandler`` receive their messages in one call.
+        Every message is handled even when the handler of another one fails: the
+        failures of command and query handlers are raised together once all
+        messages were handled, with the outcome of every message attached.
+
+        Returns:
+            One response per message, in the order given.
+        """
+        ...
+
     async def register_handler(self, handler: MessageHandler) -> None:
         """Register a message handler asynchronously."""
         ...
@@ -1,5 +1,6 @@
 """Module for fetching queries via a message bus."""
 
+from collections.abc import Sequence
 from typing import Any
 
 from forging_blocks.application.ports.outbound.message_bus import MessageBus
@@ -29,3 +30,14 @@ class QueryFetcher:
             The result of the query.
         """
         return await self._message_bus.dispatch(query)
+
+    async def fetch_many(self, queries: Sequence[Query]) -> Sequence[Any]:
+        """Fetch several queries asynchronously in one batched dispatch.
+
+        Args:
+            queries: The queries to be fetched.
+
+        Returns:
+            The result of each query, in the order given.
+        """
+        return await self._message_bus.dispatch_many(queries)
@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 from abc import ABC
-from typing import Generic, Hashable, TypeVar
+from typing import Any, Generic, Hashable, Mapping, Sequence, TypeVar
 
 from forging_blocks.domain.entity import Entity
 from forging_blocks.domain.errors.entity_id_none_error import EntityIdNoneError
@@ -13,18 +13,21 @@ from forging_blocks.domain.value_object import ValueObject
 TId = TypeVar("TId", bound=Hashable)
 
 
-class AggregateVersion(ValueObject[int]):
+class AggregateVersion(ValueObject[int], cache_hash=True, interned=True):
     """Immutable value object representing the version of an aggregate root.
 
     Used for optimistic concurrency control to detect conflicting updates.
+    Versions are interned, so equal versions share a single instance.
     """
 
     def __init__(self, value: int) -> None:
+        super().__init__()
         if not isinstance(value, int):
             raise TypeError(f"Expected int, got {type(value).__name__}")
         if value < 0:
             raise ValueError("Version cannot be negative")
         self._value = value
+        self._freeze()
 
     @property
     def value(self) -> int:
@@ -35,6 +38,28 @@ class AggregateVersion(ValueObject[int]):
         """Return a new AggregateVersion incremented by one."""
         return AggregateVersion(self._value + 1)
 
+    @classmethod
+    def _validate_column(cls, raw_values: Sequence[Any]) -> Mapping[int, str]:
+        """Validate a column of raw versions in one pass."""
+        return {
+            index: (
+                "Version cannot be negative"
+                if isinstance(value, int)
+                else f"Expected int, got {type(value).__name__}"
+            )
+            for index, value in enumerate(raw_values)
+            if not isinstance(value, int) or value < 0
+        }
+
+    @classmethod
+    def _from_validated(cls, raw_value: int) -> AggregateVersion:
+        """Build a version from a value already accepted by ``_validate_column``."""
+        version = object.__new__(cls)
+        object.__setattr__(version, "_value", raw_value)
+        version._freeze()
+        pool = cls.intern_pool()
+        return version if pool is None else pool.intern(version)
+
     def _equality_components(self) -> tuple[Hashable, ...]:
         """Components used for equality comparison."""
         return (self._value,)
@@ -7,22 +7,80 @@ domain messages following Domain-Driven Design (DDD) and CQRS principles.
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
-from datetime import datetime, timezone
-from typing import Any, TypeVar
+from collections.abc import Callable
+from datetime import datetime, timedelta
+from typing import Any, Mapping, NoReturn, Self, TypeVar
 from uuid import UUID, uuid4
 
+from forging_blocks.domain.messages.message_context import current_metadata
+from forging_blocks.domain.messages.providers import Clock, IdProvider, system_clock
 from forging_blocks.domain.value_object import ValueObject
 
+_clock: Clock = system_clock
+_id_provider: IdProvider = uuid4
+
+# Per-instance caches, rebuilt on demand and never copied or pickled.
+_SNAPSHOT_ATTRIBUTES = frozenset({"_value_snapshot", "_payload_snapshot", "_dict_snapshot"})
+_ENCODED_FORMS = "_encoded_forms"
+
+
+class _ReadOnlyDict(dict[str, Any]):
+    """A ``dict`` refusing changes, so cached snapshots can be shared safely.
+
+    Being a real ``dict``, it is accepted by ``json``, ``pickle`` and ``copy``;
+    copies and unpickled instances are plain, mutable dictionaries.
+    """
+
+    def _refuse(self, *args: Any, **kwargs: Any) -> NoReturn:
+        raise TypeError(f"'{type(self).__name__}' object is read-only")
+
+    __setitem__ = __delitem__ = __ior__ = _refuse
+    update = pop = popitem = clear = setdefault = _refuse
+
+    def __reduce__(self) -> tuple[type[dict[str, Any]], tuple[dict[str, Any]]]:
+        return dict, (dict(self),)
+
 
 def now() -> datetime:
-    """Get the current UTC datetime."""
-    return datetime.now(timezone.utc)
+    """Get the current UTC datetime from the configured clock."""
+    return _clock()
+
+
+def set_clock(clock: Clock) -> Clock:
+    """Configure the clock used for message timestamps.
+
+    Args:
+        clock: A callable returning timezone-aware datetimes, such as
+            ``providers.CoarseClock()``.
+
+    Returns:
+        The previously configured clock.
+    """
+    global _clock
+    previous, _clock = _clock, clock
+    return previous
+
+
+def set_id_provider(id_provider: IdProvider) -> IdProvider:
+    """Configure the provider of message, correlation and causation IDs.
+
+    Args:
+        id_provider: A callable returning UUIDs, such as
+            ``providers.UuidV7Generator()``. Defaults to ``uuid4``.
+
+    Returns:
+        The previously configured ID provider.
+    """
+    global _id_provider
+    previous, _id_provider = _id_provider, id_provider
+    return previous
 
 
 MessageRawType = TypeVar("MessageRawType", covariant=True)
+CachedType = TypeVar("CachedType")
 
 
-class MessageMetadata(ValueObject[dict[str, Any]]):
+class MessageMetadata(ValueObject[Mapping[str, Any]], cache_hash=True):
     """Metadata associated with domain messages.
 
     Contains infrastructure-level information about messages such as:
@@ -35,6 +93,17 @@ class MessageMetadata(ValueObject[dict[str, Any]]):
     This separation allows messages to focus on domain data while keeping
     infrastructure concerns in metadata.
 
+    Identifiers that are not given follow the message being handled (see
+    ``message_context.handling``): correlation_id is inherited from it and
+    causation_id is its message_id. Outside of a handled message, both default to
+    the new message's own message_id. A missing message_id is generated on first
+    access with the ID provider configured through ``set_id_provider``, and
+    ``created_at`` defaults to the clock configured through ``set_clock``.
+
+    A message may carry a ``deadline`` after which nobody waits for it any more.
+    Messages derived from a handled message inherit its deadline, keeping the
+    earlier one when they are also given a deadline or ``ttl`` of their own.
+
     Example:
         >>> metadata = MessageMetadata(message_type="OrderCreated")
         >>> # Or with custom values
@@ -52,24 +121,50 @@ class MessageMetadata(ValueObject[dict[str, Any]]):
         created_at: datetime | None = None,
         correlation_id: UUID | None = None,
         causation_id: UUID | None = None,
+        deadline: datetime | None = None,
+        ttl: timedelta | None = None,
     ) -> None:
         """Initialize message metadata.
 
         Args:
             message_type: The type/name of the message.
-            message_id: Unique identifier for the message. If None, generates a
-                new UUID.
+            message_id: Unique identifier for the message. If None, a new UUID is
+                generated on first access.
             created_at: When the message was created. If None, uses current UTC time.
-            correlation_id: Identifier to correlate related messages. If None,
-                generates a new UUID.
+            correlation_id: Identifier to correlate related messages. If None, it is
+                inherited from the message being handled, or else equals message_id.
             causation_id: Identifier of the message that caused this one. If None,
-                generates a new UUID.
+                it is the message_id of the message being handled, or else equals
+                this message's own message_id.
+            deadline: When the message expires. None means it never does, unless
+                the message being handled has a deadline.
+            ttl: How long after ``created_at`` the message expires, as an
+                alternative to ``deadline``. The earlier of the two applies.
         """
+        super().__init__()
         self._message_type = message_type
-        self._message_id = message_id or uuid4()
-        self._created_at = created_at or now()
-        self._correlation_id = correlation_id or uuid4()
-        self._causation_id = causation_id or uuid4()
+        if message_id is not None:
+            self._message_id = message_id
+        self._created_at = created_at or _clock()
+        if ttl is not None:
+            deadline = _earliest(deadline, self._created_at + ttl)
+        if correlation_id is None or causation_id is None:
+            parent = current_metadata()
+            if parent is not None:
+                correlation_id = correlation_id or parent.correlation_id
+                causation_id = causation_id or parent.message_id
+                deadline = _earliest(deadline, parent.deadline)
+        self._deadline = deadline
+        if correlation_id is not None:
+            self._correlation_id = correlation_id
+        if causation_id is not None:
+            self._causation_id = causation_id
+        self._freeze()
+
+    def __getstate__(self) -> Any:
+        """Resolve any pending identifiers so copies and pickles keep them."""
+        self.correlation_id, self.causation_id  # noqa: B018
+        return _without_snapshots(super().__getstate__())
 
     @property
     def message_id(self) -> UUID:
@@ -78,7 +173,10 @@ class MessageMetadata(ValueObject[dict[str, Any]]):
         Returns:
             The unique message identifier.
         """
-        return self._message_id
+        try:
+            return self._message_id
+        except AttributeError:
+            return _remember(self, "_message_id", _id_provider())
 
     @property
     def causation_id(self) -> UUID:
@@ -87,7 +185,10 @@ class MessageMetadata(ValueObject[dict[str, Any]]):
         Returns:
             The causation identifier.
         """
-        return self._causation_id
+        try:
+            return self._causation_id
+        except AttributeError:
+            return _remember(self, "_causation_id", self.message_id)
 
     @property
     def created_at(self) -> datetime:
@@ -98,6 +199,15 @@ class MessageMetadata(ValueObject[dict[str, Any]]):
         """
         return self._created_at
 
+    @property
+    def deadline(self) -> datetime | None:
+        """Get when this message expires.
+
+        Returns:
+            The deadline, or None if the message never expires.
+        """
+        return self._deadline
+
     @property
     def correlation_id(self) -> UUID:
         """Get the correlation ID for this message.
@@ -105,7 +215,10 @@ class MessageMetadata(ValueObject[dict[str, Any]]):
         Returns:
             The correlation identifier.
         """
-        return self._correlation_id
+        try:
+            return self._correlation_id
+        except AttributeError:
+            return _remember(self, "_correlation_id", self.message_id)
 
     @property
     def message_type(self) -> str:
@@ -117,15 +230,25 @@ class MessageMetadata(ValueObject[dict[str, Any]]):
         return self._message_type
 
     @property
-    def value(self) -> dict[str, Any]:
-        """Get the raw dictionary representation of the metadata."""
-        return {
-            "created_at": self._created_at.isoformat(),
-            "correlation_id": str(self._correlation_id),
-            "causation_id": str(self._causation_id),
-            "message_id": str(self._message_id),
-            "message_type": self._message_type,
-        }
+    def value(self) -> Mapping[str, Any]:
+        """Get the raw dictionary representation of the metadata.
+
+        The representation is built once and returned as a read-only dictionary. It
+        only has a "deadline" entry when the message has a deadline.
+        """
+        try:
+            return self._value_snapshot  # type: ignore[attr-defined, no-any-return]
+        except AttributeError:
+            value = {
+                "created_at": self._created_at.isoformat(),
+                "correlation_id": str(self.correlation_id),
+                "causation_id": str(self.causation_id),
+                "message_id": str(self.message_id),
+                "message_type": self._message_type,
+            }
+            if self._deadline is not None:
+                value["deadline"] = self._deadline.isoformat()
+            return _remember(self, "_value_snapshot", _ReadOnlyDict(value))
 
     @classmethod
     def create(cls, message_type: str) -> MessageMetadata:
@@ -139,11 +262,34 @@ class MessageMetadata(ValueObject[dict[str, Any]]):
         """
         return cls(message_type=message_type)
 
-    def to_dict(self) -> dict[str, Any]:
+    @classmethod
+    def from_dict(cls, data: Mapping[str, Any]) -> MessageMetadata:
+        """Rebuild metadata from its dictionary representation.
+
+        The stored identifiers and timestamp are reused, so no new UUIDs are
+        generated.
+
+        Args:
+            data: A dictionary as returned by ``to_dict``.
+
+        Returns:
+            The MessageMetadata instance described by ``data``.
+        """
+        deadline = data.get("deadline")
+        return cls(
+            message_type=data["message_type"],
+            message_id=UUID(data["message_id"]),
+            created_at=datetime.fromisoformat(data["created_at"]),
+            correlation_id=UUID(data["correlation_id"]),
+            causation_id=UUID(data["causation_id"]),
+            deadline=None if deadline is None else datetime.fromisoformat(deadline),
+        )
+
+    def to_dict(self) -> Mapping[str, Any]:
         """Convert metadata to dictionary representation.
 
         Returns:
-            Dictionary representation of the metadata.
+            Read-only dictionary representation of the metadata.
         """
         return self.value
 
@@ -153,7 +299,7 @@ class MessageMetadata(ValueObject[dict[str, Any]]):
         Returns:
             Tuple containing message_id and created_at.
         """
-        return (self._message_id, self._created_at)
+        return (self.message_id, self._created_at)
 
 
 class Message(ValueObject[MessageRawType], ABC):
@@ -218,6 +364,25 @@ class Message(ValueObject[MessageRawType], ABC):
         """
         return self._metadata.created_at
 
+    def __getstate__(self) -> Any:
+        """Leave cached snapshots and encoded forms out of copies and pickles."""
+        return _without_snapshots(super().__getstate__())
+
+    @property
+    def payload(self) -> Mapping[str, Any]:
+        """Get the domain-specific data carried by this message.
+
+        The subclass ``_payload`` is read once and returned as a read-only dictionary.
+
+        Returns:
+            The message payload.
+        """
+        try:
+            return self._payload_snapshot  # type: ignore[attr-defined, no-any-return]
+        except AttributeError:
+            snapshot = _ReadOnlyDict(self._payload)
+            return _remember(self, "_payload_snapshot", snapshot)
+
     @property
     @abstractmethod
     def _payload(self) -> dict[str, Any]:
@@ -231,18 +396,67 @@ class Message(ValueObject[MessageRawType], ABC):
         """
         pass
 
-    def to_dict(self) -> dict[str, Any]:
+    @classmethod
+    def from_payload(cls, payload: Mapping[str, Any], metadata: MessageMetadata) -> Self:
+        """Rebuild a message from its payload and metadata, e.g. after decoding.
+
+        The default passes the payload entries as keyword arguments together with
+        ``metadata``, which matches subclasses whose ``__init__`` parameters are named
+        after their payload keys. Subclasses with a different signature override it.
+
+        Args:
+            payload: The domain data, as returned by ``payload``.
+            metadata: The original message metadata.
+
+        Returns:
+            The rebuilt message.
+        """
+        return cls(**payload, metadata=metadata)
+
+    @classmethod
+    def from_dict(cls, data: Mapping[str, Any]) -> Self:
+        """Rebuild a message from its dictionary representation.
+
+        Args:
+            data: A dictionary as returned by ``to_dict``.
+
+        Returns:
+            The rebuilt message.
+        """
+        return cls.from_payload(data["payload"], MessageMetadata.from_dict(data["metadata"]))
+
+    def to_dict(self) -> Mapping[str, Any]:
         """Convert the message to a dictionary representation.
 
-        Combines metadata, message type, and domain data.
+        Combines metadata, message type, and domain data. The representation is
+        built once and returned as a read-only dictionary.
+
+        Returns:
+            Complete, read-only dictionary representation of the message.
+        """
+        try:
+            return self._dict_snapshot  # type: ignore[attr-defined, no-any-return]
+        except AttributeError:
+            snapshot = _ReadOnlyDict(metadata=self._metadata.to_dict(), payload=self.payload)
+            return _remember(self, "_dict_snapshot", snapshot)
+
+    def encoded(self, encoder: Callable[[Self], bytes]) -> bytes:
+        """Encode the message with ``encoder``, reusing the result on later calls.
+
+        Codecs route their ``encode`` through this method so a message published to
+        several destinations with the same codec is serialized only once.
+
+        Args:
+            encoder: A callable producing the encoded form, used as the cache key.
 
         Returns:
-            Complete dictionary representation of the message.
+            The encoded message.
         """
-        return {
-            "metadata": self._metadata.to_dict(),
-            "payload": self._payload,
-        }
+        forms: dict[Callable[[Self], bytes], bytes] = _remember(self, _ENCODED_FORMS, {})
+        try:
+            return forms[encoder]
+        except KeyError:
+            return forms.setdefault(encoder, encoder(self))
 
     def _equality_components(self) -> tuple[Any, ...]:
         """Messages are equal if they have the same message ID.
@@ -253,3 +467,29 @@ class Message(ValueObject[MessageRawType], ABC):
             Tuple containing the message ID for equality comparison.
         """
         return (self._metadata.message_id,)
+
+
+def _remember(instance: object, attribute: str, value: CachedType) -> CachedType:
+    """Store ``value`` in ``attribute`` unless another thread stored one first.
+
+    ``dict.setdefault`` is atomic, so concurrent first reads agree on one value.
+    """
+    return instance.__dict__.setdefault(attribute, value)  # type: ignore[no-any-return]
+
+
+def _without_snapshots(state: Any) -> Any:
+    """Return pickle state without the cached snapshots and encoded forms."""
+    dict_state, slot_state = state if isinstance(state, tuple) else (state, None)
+    dict_state = {
+        name: value
+        for name, value in dict_state.items()
+        if name not in _SNAPSHOT_ATTRIBUTES and name != _ENCODED_FORMS
+    }
+    return (dict_state, slot_state) if slot_state is not None else dict_state
+
+
+def _earliest(first: datetime | None, second: datetime | None) -> datetime | None:
+    """Return the earlier of two optional deadlines."""
+    if first is None or second is None:
+        return first or second
+    return min(first, second)
@@ -0,0 +1,51 @@
+"""Context of the message currently being handled.
+
+While a message is handled inside ``handling``, every ``MessageMetadata`` created
+without explicit identifiers joins its causal chain: it inherits the handled
+message's ``correlation_id`` and ``deadline``, and uses its ``message_id`` as
+``causation_id``. The context is stored in a ``ContextVar``, so it follows asyncio
+tasks and is isolated between threads.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import TYPE_CHECKING, Any, cast
+
+if TYPE_CHECKING:
+    from forging_blocks.domain.messages.message import Message, MessageMetadata
+
+_handled_metadata: ContextVar[MessageMetadata | None] = ContextVar(
+    "forging_blocks_handled_metadata", default=None
+)
+
+
+def current_metadata() -> MessageMetadata | None:
+    """Return the metadata of the message being handled, if any."""
+    return _handled_metadata.get()
+
+
+@contextmanager
+def handling(message: Message[Any] | MessageMetadata) -> Iterator[MessageMetadata]:
+    """Mark ``message`` as the message being handled for the enclosed block.
+
+    Example:
+        >>> with handling(place_order):
+        ...     event = OrderPlaced(order_id=place_order.order_id)
+        >>> event.metadata.causation_id == place_order.message_id
+        True
+
+    Args:
+        message: The message, or its metadata, being handled.
+
+    Yields:
+        The metadata of the handled message.
+    """
+    metadata = cast("MessageMetadata", getattr(message, "metadata", message))
+    token = _handled_metadata.set(metadata)
+    try:
+        yield metadata
+    finally:
+        _handled_metadata.reset(token)
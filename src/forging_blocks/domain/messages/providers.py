@@ -0,0 +1,158 @@
+"""Identifier and clock providers for message metadata.
+
+``MessageMetadata`` takes its identifiers from an ID provider and its timestamps from
+a clock, both configured in the message module. This module defines the provider
+types and two implementations meant for high-rate producers: a monotonic,
+time-ordered UUID generator and a clock that caches the current time.
+"""
+
+from __future__ import annotations
+
+import os
+import threading
+import time
+from array import array
+from collections.abc import Callable
+from datetime import datetime, timedelta, timezone
+from uuid import UUID, SafeUUID
+
+IdProvider = Callable[[], UUID]
+Clock = Callable[[], datetime]
+
+_COUNTER_BITS = 42
+_COUNTER_LIMIT = 1 << _COUNTER_BITS
+_RANDOM_BITS = 32
+_RANDOM_MASK = (1 << _RANDOM_BITS) - 1
+_VERSION_7 = 0x7 << 76
+_VARIANT_RFC_9562 = 0b10 << 62
+
+
+def system_clock() -> datetime:
+    """Return the current UTC datetime."""
+    return datetime.now(timezone.utc)
+
+
+class UuidV7Generator:
+    """Monotonic generator of time-ordered, version 7 UUIDs (RFC 9562).
+
+    Each UUID holds the Unix time in milliseconds in its first 48 bits, followed by
+    a 42-bit counter split around the version and variant bits, and 32 random bits.
+    The counter starts at a random value every millisecond and is incremented for
+    every UUID within it, so UUIDs from one generator are strictly increasing even
+    when the system clock stalls or steps back. Random bits are read from
+    ``os.urandom`` for ``batch_size`` UUIDs at a time.
+
+    Example:
+        >>> generate = UuidV7Generator()
+        >>> first, second = generate(), generate()
+        >>> first < second
+        True
+    """
+
+    __slots__ = ("_batch_size", "_random", "_last_millis", "_counter", "_lock")
+
+    def __init__(self, batch_size: int = 256) -> None:
+        """Create a generator.
+
+        Args:
+            batch_size: How many UUIDs' worth of random bits to read per
+                ``os.urandom`` call.
+        """
+        if batch_size < 1:
+            raise ValueError("batch_size must be at least 1")
+        self._batch_size = batch_size
+        self._random: list[int] = []
+        self._last_millis = -1
+        self._counter = 0
+        self._lock = threading.Lock()
+
+    def __call__(self) -> UUID:
+        """Return the next UUID."""
+        with self._lock:
+            return _uuid_from_int(self._next_int())
+
+    def allocate(self, count: int) -> list[UUID]:
+        """Return ``count`` consecutive UUIDs, taking the lock once."""
+        with self._lock:
+            next_int = self._next_int
+            return [_uuid_from_int(next_int()) for _ in range(count)]
+
+    def _next_int(self) -> int:
+        """Return the integer value of the next UUID. The lock must be held."""
+        random_bits = self._random_word()
+        millis = time.time_ns() // 1_000_000
+        if millis > self._last_millis:
+            self._last_millis = millis
+            # A 32-bit seed leaves ample room to count up within the millisecond.
+            self._counter = random_bits >> _RANDOM_BITS
+        else:
+            self._counter += 1
+            if self._counter == _COUNTER_LIMIT:
+                # Counter exhausted: borrow the next millisecond.
+                self._last_millis += 1
+                self._counter = 0
+        counter = self._counter
+        return (
+            self._last_millis << 80
+            | _VERSION_7
+            | (counter >> 30) << 64
+            | _VARIANT_RFC_9562
+            | (counter & 0x3FFFFFFF) << _RANDOM_BITS
+            | random_bits & _RANDOM_MASK
+        )
+
+    def _random_word(self) -> int:
+        """Return 64 random bits, refilling the batch when it is used up."""
+        if not self._random:
+            self._random = array("Q", os.urandom(8 * self._batch_size)).tolist()
+        return self._random.pop()
+
+
+class CoarseClock:
+    """Clock that reuses the last reading until ``resolution`` has elapsed.
+
+    Reading ``time.monotonic_ns`` is much cheaper than building a new ``datetime``,
+    so producers creating many messages per millisecond share one timestamp. The
+    returned time can lag the real time by up to ``resolution``.
+
+    Example:
+        >>> clock = CoarseClock(resolution=timedelta(milliseconds=1))
+        >>> clock() == clock()
+        True
+    """
+
+    __slots__ = ("_clock", "_resolution_ns", "_expires_at", "_now")
+
+    def __init__(
+        self, resolution: timedelta = timedelta(milliseconds=1), clock: Clock = system_clock
+    ) -> None:
+        """Create a coarse clock.
+
+        Args:
+            resolution: How long a reading is reused.
+            clock: The underlying clock that is read when a reading expires.
+        """
+        self._clock = clock
+        self._resolution_ns = resolution // timedelta(microseconds=1) * 1_000
+        self._now = clock()
+        self._expires_at = time.monotonic_ns() + self._resolution_ns
+
+    def __call__(self) -> datetime:
+        """Return the cached reading, refreshing it once it has expired."""
+        tick = time.monotonic_ns()
+        if tick >= self._expires_at:
+            self._now = self._clock()
+            self._expires_at = tick + self._resolution_ns
+        return self._now
+
+
+def _uuid_from_int(value: int) -> UUID:
+    """Build a UUID from a 128-bit integer known to be in range.
+
+    Skips the argument parsing and range checks of ``UUID.__init__``, which cost
+    more than generating the value itself.
+    """
+    uuid = object.__new__(UUID)
+    object.__setattr__(uuid, "int", value)
+    object.__setattr__(uuid, "is_safe", SafeUUID.unknown)
+    return uuid
@@ -6,11 +6,86 @@ following the principles of Domain-Driven Design (DDD).
 
 from __future__ import annotations
 
-from abc import ABC, abstractmethod
-from collections.abc import Hashable
-from typing import Any, Generic, TypeVar
+from abc import ABC, ABCMeta, abstractmethod
+from collections.abc import Callable, Hashable, Iterable, Mapping, Sequence
+from typing import Any, Generic, Self, TypeVar, cast
+from weakref import WeakValueDictionary
+
+from forging_blocks.foundation.errors.base import Error
+from forging_blocks.foundation.errors.validation_error import (
+    CombinedValidationErrors,
+    ValidationError,
+)
+from forging_blocks.foundation.result import Err, Ok, Result
 
 RawValueType = TypeVar("RawValueType", covariant=True)
+InternedType = TypeVar("InternedType", bound="ValueObject[Any]")
+
+
+class InternPool(Generic[InternedType]):
+    """Weak-reference pool holding the canonical instance of each distinct value.
+
+    Instances are keyed by their equality components, each paired with its type so
+    that equal values of different types such as ``True``, ``1`` and ``1.0`` keep
+    canonical instances of their own, and dropped from the pool as soon as nothing
+    else references them. Hit and miss counters show how many constructions were
+    served by an existing instance.
+    """
+
+    __slots__ = ("_instances", "_hits", "_misses")
+
+    def __init__(self) -> None:
+        self._instances: WeakValueDictionary[tuple[tuple[type, Hashable], ...], InternedType] = (
+            WeakValueDictionary()
+        )
+        self._hits = 0
+        self._misses = 0
+
+    def __len__(self) -> int:
+        """Return the number of canonical instances currently alive."""
+        return len(self._instances)
+
+    @property
+    def hits(self) -> int:
+        """Number of constructions that returned an existing canonical instance."""
+        return self._hits
+
+    @property
+    def misses(self) -> int:
+        """Number of constructions that registered a new canonical instance."""
+        return self._misses
+
+    def intern(self, instance: InternedType) -> InternedType:
+        """Return the canonical instance equal to ``instance``, registering it if new."""
+        key = tuple((type(component), component) for component in _cached_components(instance))
+        canonical = self._instances.get(key)
+        if canonical is not None:
+            self._hits += 1
+            return canonical
+        self._instances[key] = instance
+        self._misses += 1
+        return instance
+
+    def clear(self) -> None:
+        """Forget all canonical instances and reset the counters."""
+        self._instances.clear()
+        self._hits = 0
+        self._misses = 0
+
+
+class _InterningValueObjectMeta(ABCMeta):
+    """Metaclass given to interned value object classes.
+
+    Only interned classes use it, so construction of every other value object keeps
+    the plain ``type.__call__`` path.
+    """
+
+    def __call__(cls, *args: Any, **kwargs: Any) -> Any:
+        instance = super().__call__(*args, **kwargs)
+        pool = cls._ValueObject__intern_pool  # type: ignore[attr-defined]
+        if pool is None:
+            return instance
+        return pool.intern(instance)
 
 
 class ValueObject(ABC, Generic[RawValueType]):
@@ -40,9 +115,89 @@ class ValueObject(ABC, Generic[RawValueType]):
         ...
         ...     def _equality_components(self) -> tuple[Hashable, ...]:
         ...         return (self._value,)
+
+    Subclasses that are hashed or compared often (dict keys, set members) can opt
+    into cached hashing with the ``cache_hash`` class keyword. The equality
+    components and their hash are then computed once in ``_freeze()`` and reused,
+    and ``__eq__``/``__hash__`` are generated for the subclass when it is created.
+    The option is inherited by further subclasses.
+
+    Example:
+        >>> class CurrencyCode(ValueObject[str], cache_hash=True):
+        ...     def __init__(self, value: str):
+        ...         super().__init__()
+        ...         self._value = value
+        ...         self._freeze()
+        ...
+        ...     @property
+        ...     def value(self) -> str:
+        ...         return self._value
+        ...
+        ...     def _equality_components(self) -> tuple[Hashable, ...]:
+        ...         return (self._value,)
+
+    Subclasses held in very large numbers can be declared with ``compact=True``.
+    They must declare ``__slots__`` (so instances carry no ``__dict__``), attribute
+    writes before ``_freeze()`` go straight to ``object.__setattr__``, and
+    ``_freeze()`` switches the instance to a generated frozen subclass that rejects
+    every write. Frozen instances keep the class name, so use ``isinstance`` rather
+    than ``type(...) is`` checks with compact value objects.
+
+    Subclasses whose instances are mostly duplicates (currency codes, statuses,
+    small versions) can be declared with ``interned=True``. Constructing a value
+    equal to a live instance then returns that canonical instance, tracked in a
+    weak-reference :class:`InternPool` exposed through ``intern_pool()``. Interned
+    classes must be frozen in ``__init__`` and support weak references.
+
+    Example:
+        >>> class Cents(ValueObject[int], compact=True):
+        ...     __slots__ = ("_value",)
+        ...
+        ...     def __init__(self, value: int):
+        ...         self._value = value
+        ...         self._freeze()
+        ...
+        ...     @property
+        ...     def value(self) -> int:
+        ...         return self._value
+        ...
+        ...     def _equality_components(self) -> tuple[Hashable, ...]:
+        ...         return (self._value,)
     """
 
-    __is_frozen: bool = False
+    __slots__ = ("__is_frozen", "__components", "__hash")
+
+    __cache_hash: bool = False
+    __compact: bool = False
+    __interned: bool = False
+    __frozen_class: type[ValueObject[Any]]
+    __intern_pool: InternPool[Any] | None = None
+
+    def __init_subclass__(
+        cls,
+        cache_hash: bool | None = None,
+        compact: bool | None = None,
+        interned: bool | None = None,
+        **kwargs: Any,
+    ) -> None:
+        """Configure cached hashing, compact storage and interning for the subclass."""
+        super().__init_subclass__(**kwargs)
+        if cls.__dict__.get("_ValueObject__is_frozen_class", False):
+            return
+        if cache_hash is not None:
+            cls.__cache_hash = cache_hash
+        if compact is not None:
+            cls.__compact = compact
+        if interned is not None:
+            cls.__interned = interned
+        cls.__intern_pool = _build_intern_pool(cls) if cls.__interned else None
+        if cls.__cache_hash:
+            if "__eq__" not in cls.__dict__ and _is_generated_or_default(cls.__eq__):
+                cls.__eq__ = _compile_cached_eq(cls)  # type: ignore[method-assign]
+            if "__hash__" not in cls.__dict__ and _is_generated_or_default(cls.__hash__):
+                cls.__hash__ = _cached_hash  # type: ignore[method-assign]
+        if cls.__compact:
+            cls.__frozen_class = _build_frozen_class(cls)
 
     def __init__(self) -> None:
         """Initialize the value object in a mutable state (for setup)."""
@@ -50,13 +205,25 @@ class ValueObject(ABC, Generic[RawValueType]):
 
     def __setattr__(self, name: str, value: Any) -> None:
         """Prevent modification once frozen."""
-        immutability_error_message = (
-            f"{self.__class__.__name__} is immutable: cannot modify '{name}' after initialization"
-        )
         if getattr(self, "_ValueObject__is_frozen", False):
-            raise AttributeError(immutability_error_message)
+            raise AttributeError(
+                f"{self.__class__.__name__} is immutable: "
+                f"cannot modify '{name}' after initialization"
+            )
         object.__setattr__(self, name, value)
 
+    def __setstate__(self, state: Any) -> None:
+        """Restore pickled or copied state without going through ``__setattr__``.
+
+        Cached hashes are not restored: string hashes differ between processes, so
+        they are recomputed on first use instead.
+        """
+        dict_state, slot_state = state if isinstance(state, tuple) else (state, None)
+        for attributes in (dict_state, slot_state):
+            for name, value in (attributes or {}).items():
+                if name not in _CACHE_ATTRIBUTES:
+                    object.__setattr__(self, name, value)
+
     def __eq__(self, other: object) -> bool:
         """Check equality based on equality components."""
         if not isinstance(other, self.__class__):
@@ -78,17 +245,220 @@ class ValueObject(ABC, Generic[RawValueType]):
         """Return a developer-friendly string representation."""
         return self.__str__()
 
+    @classmethod
+    def construct_many(
+        cls, raw_values: Iterable[Any]
+    ) -> Result[list[Self], CombinedValidationErrors]:
+        """Build one instance per raw value, validating the whole column first.
+
+        The column goes through ``_validate_column`` in a single pass. If it is valid,
+        instances are built with ``_from_validated``; errors raised there are collected
+        as well, so a failing batch is always reported as a whole.
+
+        Args:
+            raw_values: The raw values to wrap, one per instance.
+
+        Returns:
+            Ok with the instances in input order, or Err with one
+            ``ValidationFieldErrors`` per failing row, referenced by its index.
+        """
+        values = raw_values if isinstance(raw_values, Sequence) else list(raw_values)
+        failures = _column_failures(cls, values)
+        if failures:
+            return Err(CombinedValidationErrors.for_rows(failures))
+
+        instances: list[Self] = []
+        append = instances.append
+        from_validated = cls._from_validated
+        for index, raw_value in enumerate(values):
+            try:
+                append(from_validated(raw_value))
+            except Error as error:
+                failures[index] = error
+            except (TypeError, ValueError) as error:
+                failures[index] = ValidationError.for_row(raw_value, index, str(error))
+        if failures:
+            return Err(CombinedValidationErrors.for_rows(failures))
+        return Ok(instances)
+
+    @classmethod
+    def validate_many(cls, raw_values: Sequence[Any]) -> Result[None, CombinedValidationErrors]:
+        """Validate a column of raw values without keeping any instance.
+
+        Subclasses with a vectorized ``_validate_column`` are validated in one pass;
+        the others are validated by constructing each value once.
+
+        Args:
+            raw_values: The raw values to validate.
+
+        Returns:
+            Ok(None) if every value is valid, or Err indexing the failing rows.
+        """
+        if _validates_columns(cls):
+            failures = _column_failures(cls, raw_values)
+            return Err(CombinedValidationErrors.for_rows(failures)) if failures else Ok(None)
+        result = cls.construct_many(raw_values)
+        if result.is_ok:
+            return Ok(None)
+        return Err(cast(CombinedValidationErrors, result.error))
+
+    @classmethod
+    def intern_pool(cls) -> InternPool[Self] | None:
+        """Return the interning pool of this class, or None if it is not interned."""
+        return cls.__intern_pool
+
     @property
     @abstractmethod
     def value(self) -> RawValueType:
         """Get the primary raw value encapsulated by the ValueObject."""
         pass
 
+    @classmethod
+    def _validate_column(cls, raw_values: Sequence[Any]) -> Mapping[int, str]:
+        """Validate a column of raw values in one pass for ``construct_many``.
+
+        Subclasses override this with a vectorized check, together with
+        ``_from_validated``, to skip per-row validation. The default reports nothing
+        and leaves validation to the constructor.
+
+        Returns:
+            The error message of each failing row, keyed by its index.
+        """
+        return {}
+
+    @classmethod
+    def _from_validated(cls, raw_value: Any) -> Self:
+        """Build an instance from a raw value already accepted by ``_validate_column``."""
+        return cls(raw_value)  # type: ignore[call-arg]
+
     def _freeze(self) -> None:
-        """Freeze the object to enforce immutability."""
+        """Freeze the object to enforce immutability.
+
+        For subclasses declared with ``cache_hash=True`` the equality components and
+        their hash are cached on first use after freezing, so attributes that are
+        computed lazily stay lazy until the object is compared or hashed. Compact
+        subclasses are frozen by switching the instance to their generated frozen class.
+        """
         object.__setattr__(self, "_ValueObject__is_frozen", True)
+        if self.__compact:
+            object.__setattr__(self, "__class__", self.__frozen_class)
 
     @abstractmethod
     def _equality_components(self) -> tuple[Hashable, ...]:
         """Return the components used for equality comparison."""
         pass
+
+
+def _validates_columns(cls: type[ValueObject[Any]]) -> bool:
+    """Return True if ``cls`` overrides the default, empty ``_validate_column``."""
+    return cls._validate_column.__func__ is not ValueObject._validate_column.__func__  # type: ignore[attr-defined]
+
+
+def _column_failures(cls: type[ValueObject[Any]], raw_values: Sequence[Any]) -> dict[int, Error]:
+    """Run the vectorized column validation of ``cls`` and build per-row errors."""
+    return {
+        index: ValidationError.for_row(raw_values[index], index, message)
+        for index, message in cls._validate_column(raw_values).items()
+    }
+
+
+_CACHE_ATTRIBUTES = frozenset({"_ValueObject__components", "_ValueObject__hash"})
+
+
+def _build_intern_pool(cls: type[ValueObject[Any]]) -> InternPool[Any]:
+    """Switch ``cls`` to the interning metaclass and return its own, empty pool."""
+    if not cls.__weakrefoffset__:
+        raise TypeError(
+            f"{cls.__name__}: interned value objects must support weak references "
+            "(add '__weakref__' to __slots__)"
+        )
+    if type(cls) is ABCMeta:
+        cls.__class__ = _InterningValueObjectMeta  # type: ignore[method-assign, assignment]
+    elif not isinstance(cls, _InterningValueObjectMeta):
+        raise TypeError(f"{cls.__name__}: interned value objects cannot use a custom metaclass")
+    return InternPool()
+
+
+def _build_frozen_class(cls: type[ValueObject[Any]]) -> type[ValueObject[Any]]:
+    """Build the frozen twin of a compact value object class.
+
+    The twin adds no storage, so instances can switch to it with ``__class__``
+    assignment. Its qualified name resolves through the mutable class, which keeps
+    frozen instances picklable.
+    """
+    if cls.__dictoffset__:
+        raise TypeError(
+            f"{cls.__name__}: compact value objects must declare __slots__ "
+            "in every class of their hierarchy"
+        )
+    if "__setattr__" not in cls.__dict__:
+        cls.__setattr__ = object.__setattr__  # type: ignore[assignment]
+    namespace = {
+        "__slots__": (),
+        "__module__": cls.__module__,
+        "__qualname__": f"{cls.__qualname__}._ValueObject__frozen_class",
+        "__doc__": cls.__doc__,
+        "__setattr__": _reject_frozen_write,
+        "__delattr__": _reject_frozen_write,
+        "_ValueObject__is_frozen_class": True,
+    }
+    metaclass: Callable[..., type[ValueObject[Any]]] = type(cls)
+    return metaclass(cls.__name__, (cls,), namespace)
+
+
+def _reject_frozen_write(self: ValueObject[Any], name: str, *_: Any) -> None:
+    """Reject attribute writes and deletions on frozen compact value objects."""
+    raise AttributeError(
+        f"{self.__class__.__name__} is immutable: cannot modify '{name}' after initialization"
+    )
+
+
+def _is_generated_or_default(method: Any) -> bool:
+    """Return True if ``method`` may be replaced by a generated cached implementation."""
+    return method in (ValueObject.__eq__, ValueObject.__hash__, _cached_hash) or getattr(
+        method, "__cached_eq__", False
+    )
+
+
+def _compile_cached_eq(cls: type[ValueObject[Any]]) -> Callable[[Any, object], bool]:
+    """Build an ``__eq__`` bound to ``cls`` that compares the cached components."""
+
+    def __eq__(self: ValueObject[Any], other: object) -> bool:
+        if self is other:
+            return True
+        if not isinstance(other, cls):
+            return False
+        try:
+            return bool(
+                self._ValueObject__hash == other._ValueObject__hash  # type: ignore[attr-defined]
+                and self._ValueObject__components  # type: ignore[attr-defined]
+                == other._ValueObject__components  # type: ignore[attr-defined]
+            )
+        except AttributeError:
+            # One side has not been hashed or compared since it was frozen.
+            return _cached_components(self) == _cached_components(other)
+
+    __eq__.__cached_eq__ = True  # type: ignore[attr-defined]
+    __eq__.__qualname__ = f"{cls.__qualname__}.__eq__"
+    return __eq__
+
+
+def _cached_hash(self: ValueObject[Any]) -> int:
+    """Return the cached hash, filling the cache first if the object is frozen."""
+    try:
+        return self._ValueObject__hash  # type: ignore[attr-defined, no-any-return]
+    except AttributeError:
+        components = _cached_components(self)
+    return getattr(self, "_ValueObject__hash", None) or hash(components)
+
+
+def _cached_components(self: ValueObject[Any]) -> tuple[Hashable, ...]:
+    """Return the equality components, caching them with their hash once frozen."""
+    try:
+        return self._ValueObject__components  # type: ignore[attr-defined, no-any-return]
+    except AttributeError:
+        components = self._equality_components()
+    if getattr(self, "_ValueObject__is_frozen", False):
+        object.__setattr__(self, "_ValueObject__components", components)
+        object.__setattr__(self, "_ValueObject__hash", hash(components))
+    return components
@@ -0,0 +1,212 @@
+"""Array-backed columnar storage for numeric value objects.
+
+This module provides ValueObjectArray, a compact sequence of value objects whose
+``value`` is an ``int`` or ``float`` (e.g. AggregateVersion, monetary amounts).
+"""
+
+from __future__ import annotations
+
+from array import array
+from collections.abc import Iterable, Iterator
+from typing import Any, Generic, TypeVar, cast, overload
+
+from forging_blocks.domain.value_object import ValueObject
+from forging_blocks.foundation.errors.validation_error import (
+    CombinedValidationErrors,
+    ValidationError,
+)
+from forging_blocks.foundation.result import Err, Ok, Result
+
+NumericValueObject = TypeVar("NumericValueObject", bound=ValueObject[Any])
+
+
+class ValueObjectArray(Generic[NumericValueObject]):
+    """Contiguous column of numeric value objects stored as raw values.
+
+    Raw values live in a stdlib ``array`` with the given typecode (``"q"`` for
+    signed 64-bit integers by default, ``"d"`` for floats). Value object wrappers
+    are only created, through the value type's ``_from_validated``, when an element
+    is read. Slicing, comparison, ``min``/``max`` and sorting work on the raw values
+    and never build a wrapper per element.
+
+    Example:
+        >>> versions = ValueObjectArray.from_raw(AggregateVersion, [3, 1, 2]).value
+        >>> versions.sort()
+        >>> versions.max()
+        AggregateVersion(3)
+    """
+
+    __slots__ = ("_value_type", "_values")
+
+    def __init__(
+        self,
+        value_type: type[NumericValueObject],
+        items: Iterable[NumericValueObject] = (),
+        typecode: str = "q",
+    ) -> None:
+        """Create an array holding the raw values of already-built value objects.
+
+        Args:
+            value_type: The value object class stored in the array.
+            items: Value objects to store, in order.
+            typecode: The ``array`` typecode used for the raw values.
+        """
+        self._value_type = value_type
+        self._values = array(typecode)
+        self.extend(items)
+
+    @classmethod
+    def from_raw(
+        cls,
+        value_type: type[NumericValueObject],
+        raw_values: Iterable[Any],
+        typecode: str = "q",
+    ) -> Result[ValueObjectArray[NumericValueObject], CombinedValidationErrors]:
+        """Create an array from raw values, validated as one column.
+
+        Args:
+            value_type: The value object class stored in the array.
+            raw_values: The raw numeric values, in order.
+            typecode: The ``array`` typecode used for the raw values.
+
+        Returns:
+            Ok with the array, or Err indexing the failing values, which are the
+            values the type rejects or, once they are all valid, the values the
+            typecode cannot store.
+        """
+        values = list(raw_values)
+        validation = value_type.validate_many(values)
+        if validation.is_err:
+            return Err(cast(CombinedValidationErrors, validation.error))
+        try:
+            return Ok(cls._wrap(value_type, array(typecode, values)))
+        except (OverflowError, TypeError):
+            return Err(_storage_failures(values, typecode))
+
+    @classmethod
+    def _wrap(
+        cls, value_type: type[NumericValueObject], values: array[Any]
+    ) -> ValueObjectArray[NumericValueObject]:
+        """Create an array around raw values that are already valid."""
+        instance = cls.__new__(cls)
+        instance._value_type = value_type
+        instance._values = values
+        return instance
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+    @overload
+    def __getitem__(self, index: int) -> NumericValueObject: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> ValueObjectArray[NumericValueObject]: ...
+
+    def __getitem__(
+        self, index: int | slice
+    ) -> NumericValueObject | ValueObjectArray[NumericValueObject]:
+        """Return the value object at ``index``, or a new array for a slice."""
+        if isinstance(index, slice):
+            return self._wrap(self._value_type, self._values[index])
+        return self._value_type._from_validated(self._values[index])
+
+    def __iter__(self) -> Iterator[NumericValueObject]:
+        """Iterate over the elements, wrapping each one as it is reached."""
+        from_validated = self._value_type._from_validated
+        return (from_validated(raw_value) for raw_value in self._values)
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, ValueObjectArray):
+            return NotImplemented
+        return self._value_type is other._value_type and self._values == other._values
+
+    def __lt__(self, other: object) -> bool:
+        if not isinstance(other, ValueObjectArray) or other._value_type is not self._value_type:
+            return NotImplemented
+        return self._values < other._values
+
+    def __le__(self, other: object) -> bool:
+        if not isinstance(other, ValueObjectArray) or other._value_type is not self._value_type:
+            return NotImplemented
+        return self._values <= other._values
+
+    def __gt__(self, other: object) -> bool:
+        if not isinstance(other, ValueObjectArray) or other._value_type is not self._value_type:
+            return NotImplemented
+        return self._values > other._values
+
+    def __ge__(self, other: object) -> bool:
+        if not isinstance(other, ValueObjectArray) or other._value_type is not self._value_type:
+            return NotImplemented
+        return self._values >= other._values
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        return f"ValueObjectArray({self._value_type.__name__}, {self._values.tolist()!r})"
+
+    @property
+    def value_type(self) -> type[NumericValueObject]:
+        """The value object class stored in the array."""
+        return self._value_type
+
+    @property
+    def typecode(self) -> str:
+        """The ``array`` typecode used for the raw values."""
+        return self._values.typecode
+
+    @property
+    def raw(self) -> memoryview:
+        """Read-only, zero-copy view of the raw values.
+
+        The array cannot grow while a view is alive: ``append`` and ``extend``
+        raise ``BufferError`` until the view is released, e.g. by using it in a
+        ``with`` block or calling its ``release`` method.
+        """
+        return memoryview(self._values).toreadonly()
+
+    def append(self, item: NumericValueObject) -> None:
+        """Append the raw value of a value object."""
+        self._values.append(self._raw_value_of(item))
+
+    def extend(self, items: Iterable[NumericValueObject]) -> None:
+        """Append the raw values of several value objects."""
+        raw_value_of = self._raw_value_of
+        self._values.extend(raw_value_of(item) for item in items)
+
+    def min(self) -> NumericValueObject:
+        """Return the smallest element.
+
+        Raises:
+            ValueError: If the array is empty.
+        """
+        return self._value_type._from_validated(min(self._values))
+
+    def max(self) -> NumericValueObject:
+        """Return the largest element.
+
+        Raises:
+            ValueError: If the array is empty.
+        """
+        return self._value_type._from_validated(max(self._values))
+
+    def sort(self, reverse: bool = False) -> None:
+        """Sort the raw values in place."""
+        self._values = array(self._values.typecode, sorted(self._values, reverse=reverse))
+
+    def _raw_value_of(self, item: NumericValueObject) -> Any:
+        """Return the raw value of ``item``, checking it has the stored type."""
+        if not isinstance(item, self._value_type):
+            raise TypeError(f"Expected {self._value_type.__name__}, got {type(item).__name__}")
+        return item.value
+
+
+def _storage_failures(values: list[Any], typecode: str) -> CombinedValidationErrors:
+    """Index the values an ``array`` with ``typecode`` cannot store."""
+    failures = {}
+    for index, raw_value in enumerate(values):
+        try:
+            array(typecode, (raw_value,))
+        except (OverflowError, TypeError) as error:
+            failures[index] = ValidationError.for_row(raw_value, index, str(error))
+    return CombinedValidationErrors.for_rows(failures)
@@ -62,6 +62,15 @@ class Error(Exception, Debuggable):
             f"context={self._metadata.context!r}>"
         )
 
+    def __reduce__(self) -> tuple[Any, ...]:
+        """Pickle the error by its state rather than by its constructor arguments.
+
+        Subclasses build their message in ``__init__`` from various arguments, which
+        ``Exception`` pickling would not pass back, so errors are restored without
+        calling ``__init__``, e.g. when returned from a worker process.
+        """
+        return _restore_error, (type(self), self.args), self.__dict__
+
     @property
     def message(self) -> ErrorMessage:
         """Structured error message."""
@@ -193,3 +202,8 @@ class CombinedErrors(Error, Generic[ErrorType]):
     def _get_title_prefix(self) -> str:
         """Get the title prefix for this combined error type."""
         return self.__class__.__name__
+
+
+def _restore_error(cls: type[Error], args: tuple[Any, ...]) -> Error:
+    """Create an unpickled error, whose state is set afterwards."""
+    return cls.__new__(cls, *args)
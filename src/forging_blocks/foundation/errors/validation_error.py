@@ -3,12 +3,26 @@
 Defines error classes related to validation failures within the system.
 """
 
+from __future__ import annotations
+
+from collections.abc import Mapping
+from typing import Any
+
 from forging_blocks.foundation.errors.base import CombinedErrors, Error, FieldErrors
+from forging_blocks.foundation.errors.core import ErrorMessage, ErrorMetadata, FieldReference
 
 
 class ValidationError(Error):
     """Base class for validation errors."""
 
+    @classmethod
+    def for_row(cls, raw_value: Any, index: int, message: str) -> ValidationError:
+        """Create the error for row ``index`` of a column, holding ``raw_value``."""
+        return cls(
+            ErrorMessage(message),
+            ErrorMetadata(context={"row": index, "value": raw_value}),
+        )
+
 
 class ValidationFieldErrors(FieldErrors):
     """Validation errors associated with a specific field."""
@@ -16,3 +30,11 @@ class ValidationFieldErrors(FieldErrors):
 
 class CombinedValidationErrors(CombinedErrors[ValidationFieldErrors]):
     """Aggregates multiple validation errors for easier handling and reporting."""
+
+    @classmethod
+    def for_rows(cls, failures: Mapping[int, Error]) -> CombinedValidationErrors:
+        """Combine the errors of the failing rows of a column, referenced by index."""
+        return cls(
+            ValidationFieldErrors(FieldReference(str(index)), (failures[index],))
+            for index in sorted(failures)
+        )
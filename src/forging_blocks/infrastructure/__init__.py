@@ -0,0 +1 @@
+"""ForgingBlocks for infrastructure modules."""
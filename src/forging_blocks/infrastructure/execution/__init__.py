@@ -0,0 +1,4 @@
+"""Infrastructure execution package.
+
+Contains adapters running blocking code off the event loop.
+"""
@@ -0,0 +1,159 @@
+"""Bounded thread pool running blocking callables for asyncio code."""
+
+from __future__ import annotations
+
+import asyncio
+import contextvars
+import threading
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any, TypeVar
+
+CallResult = TypeVar("CallResult")
+
+_cancellation: contextvars.ContextVar[threading.Event] = contextvars.ContextVar("cancellation")
+
+
+def cancellation_requested() -> bool:
+    """Return whether the awaiter of the current ``ThreadPool.run`` call was cancelled.
+
+    Threads cannot be interrupted, so long-running blocking code should check this
+    between steps and stop early when it returns True.
+    """
+    token = _cancellation.get(None)
+    return token is not None and token.is_set()
+
+
+@dataclass(frozen=True, slots=True)
+class ThreadPoolMetrics:
+    """Snapshot of the activity of a ``ThreadPool``.
+
+    Attributes:
+        name: The name of the pool.
+        max_workers: The number of threads of the pool.
+        queued: Calls waiting for a free thread.
+        running: Calls running in a thread.
+        completed: Calls that returned.
+        failed: Calls that raised.
+        cancelled: Calls whose awaiter was cancelled, whether they had started or not.
+    """
+
+    name: str
+    max_workers: int
+    queued: int
+    running: int
+    completed: int
+    failed: int
+    cancelled: int
+
+
+class ThreadPool:
+    """Bounded pool of threads running blocking callables on behalf of coroutines.
+
+    ``run`` awaits a callable executed in one of ``max_workers`` threads, so that
+    blocking code such as a legacy database driver does not stall the event loop.
+    The callable runs in a copy of the caller's context, so context variables, and
+    with them the message being handled, are visible to it.
+
+    Cancelling the awaiting task propagates to the call: a call still queued never
+    runs, and a running one sees ``cancellation_requested()`` return True.
+
+    Example:
+        >>> pool = ThreadPool(max_workers=4, name="ledger-db")
+        >>> rows = await pool.run(connection.execute, "SELECT * FROM ledger")
+        >>> pool.metrics().queued
+        0
+    """
+
+    def __init__(self, max_workers: int = 4, name: str = "thread-pool") -> None:
+        """Create a pool.
+
+        Args:
+            max_workers: The number of threads.
+            name: Names the pool in its metrics and prefixes its thread names.
+        """
+        if max_workers < 1:
+            raise ValueError("max_workers must be at least 1")
+        self._name = name
+        self._max_workers = max_workers
+        self._executor = ThreadPoolExecutor(max_workers, thread_name_prefix=name)
+        self._lock = threading.Lock()
+        self._queued = 0
+        self._running = 0
+        self._completed = 0
+        self._failed = 0
+        self._cancelled = 0
+
+    @property
+    def name(self) -> str:
+        """The name of the pool."""
+        return self._name
+
+    @property
+    def queue_depth(self) -> int:
+        """The number of calls waiting for a free thread."""
+        return self._queued
+
+    def metrics(self) -> ThreadPoolMetrics:
+        """Return a snapshot of the pool's activity."""
+        with self._lock:
+            return ThreadPoolMetrics(
+                self._name,
+                self._max_workers,
+                self._queued,
+                self._running,
+                self._completed,
+                self._failed,
+                self._cancelled,
+            )
+
+    async def run(self, function: Callable[..., CallResult], /, *args: Any) -> CallResult:
+        """Call ``function(*args)`` in a thread of the pool and return its result.
+
+        Raises:
+            asyncio.CancelledError: If the awaiting task is cancelled. The call is
+                dropped if it has not started, and notified otherwise.
+        """
+        token = threading.Event()
+        context = contextvars.copy_context()
+        with self._lock:
+            self._queued += 1
+        future = self._executor.submit(context.run, self._call, token, function, args)
+        try:
+            return await asyncio.wrap_future(future)
+        except asyncio.CancelledError:
+            token.set()
+            with self._lock:
+                self._cancelled += 1
+                if future.cancel():
+                    self._queued -= 1
+            raise
+
+    def shutdown(self, wait: bool = True) -> None:
+        """Stop the threads once the calls already submitted are done.
+
+        Args:
+            wait: Whether to block until they are done.
+        """
+        self._executor.shutdown(wait)
+
+    def _call(
+        self, token: threading.Event, function: Callable[..., CallResult], args: tuple[Any, ...]
+    ) -> CallResult:
+        """Run a call in a worker thread, within the caller's copied context."""
+        with self._lock:
+            self._queued -= 1
+            self._running += 1
+        _cancellation.set(token)
+        try:
+            result = function(*args)
+        except BaseException:
+            with self._lock:
+                self._running -= 1
+                self._failed += 1
+            raise
+        with self._lock:
+            self._running -= 1
+            self._completed += 1
+        return result
@@ -0,0 +1,92 @@
+"""Adapters exposing blocking handlers and use cases through the async ports."""
+
+from __future__ import annotations
+
+from typing import Any, Generic, Protocol, TypeVar
+
+from forging_blocks.infrastructure.execution.thread_pool import ThreadPool
+
+InputType = TypeVar("InputType", contravariant=True)
+OutputType = TypeVar("OutputType", covariant=True)
+AdaptedInput = TypeVar("AdaptedInput")
+AdaptedOutput = TypeVar("AdaptedOutput")
+
+
+class SyncMessageHandler(Protocol[InputType, OutputType]):
+    """Blocking counterpart of the ``MessageHandler`` port."""
+
+    def handle(self, message: InputType) -> OutputType:
+        """Handle a message, blocking the calling thread."""
+        ...
+
+
+class SyncUseCase(Protocol[InputType, OutputType]):
+    """Blocking counterpart of the ``UseCase`` port."""
+
+    def execute(self, request: InputType) -> OutputType:
+        """Execute the use case, blocking the calling thread."""
+        ...
+
+
+class ThreadedMessageHandler(Generic[AdaptedInput, AdaptedOutput]):
+    """``MessageHandler`` running a blocking handler in a thread pool.
+
+    Each adapter gets its own single-thread pool unless one is given, so a slow
+    handler cannot starve the others and handlers that are not thread safe are
+    never called concurrently. The message type of the adapter cannot be inferred,
+    so pass ``message_type`` when registering it on a bus.
+
+    Example:
+        >>> handler = ThreadedMessageHandler(LegacyInvoiceWriter(connection))
+        >>> await bus.register_handler(handler, message_type=InvoiceIssued)
+        >>> handler.pool.metrics().queued
+        0
+    """
+
+    def __init__(
+        self,
+        handler: SyncMessageHandler[AdaptedInput, AdaptedOutput],
+        pool: ThreadPool | None = None,
+    ) -> None:
+        """Wrap ``handler``, running it in ``pool`` or in a pool of its own."""
+        self._handler = handler
+        self._pool = pool or ThreadPool(max_workers=1, name=type(handler).__qualname__)
+
+    @property
+    def pool(self) -> ThreadPool:
+        """The pool running the handler."""
+        return self._pool
+
+    async def handle(self, message: Any) -> AdaptedOutput:
+        """Handle ``message`` in a thread of the pool."""
+        return await self._pool.run(self._handler.handle, message)
+
+
+class ThreadedUseCase(Generic[AdaptedInput, AdaptedOutput]):
+    """``UseCase`` running a blocking use case in a thread pool.
+
+    Like ``ThreadedMessageHandler``, each adapter gets its own single-thread pool
+    unless one is given.
+
+    Example:
+        >>> export_report = ThreadedUseCase(ExportReportToDisk(), ThreadPool(4, "exports"))
+        >>> path = await export_report.execute(ExportReport(month="2024-05"))
+    """
+
+    def __init__(
+        self,
+        use_case: SyncUseCase[AdaptedInput, AdaptedOutput],
+        pool: ThreadPool | None = None,
+    ) -> None:
+        """Wrap ``use_case``, running it in ``pool`` or in a pool of its own."""
+        self._use_case = use_case
+        self._pool = pool or ThreadPool(max_workers=1, name=type(use_case).__qualname__)
+
+    @property
+    def pool(self) -> ThreadPool:
+        """The pool running the use case."""
+        return self._pool
+
+    async def execute(self, request: AdaptedInput) -> AdaptedOutput:
+        """Execute the use case in a thread of the pool."""
+        return await self._pool.run(self._use_case.execute, request)
@@ -0,0 +1,4 @@
+"""Infrastructure messaging package.
+
+Contains in-process implementations of the application ``MessageBus`` port.
+"""
@@ -0,0 +1,86 @@
+"""Deadlines of messages, enforced by cancelling the work that outlives them."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Awaitable, Callable
+from typing import Any, Generic, TypeVar
+
+from forging_blocks.application.ports.inbound.use_case import UseCase
+from forging_blocks.domain.messages.message import Message, MessageMetadata, now
+from forging_blocks.domain.messages.message_context import current_metadata
+from forging_blocks.infrastructure.messaging.errors import DeadlineExceededError
+
+Outcome = TypeVar("Outcome")
+Request = TypeVar("Request")
+Response = TypeVar("Response")
+
+
+def seconds_left(metadata: MessageMetadata) -> float | None:
+    """Return the seconds until the deadline of a message, or None if it has none.
+
+    The result is zero or negative once the deadline has passed. Time is read
+    from the clock configured through ``message.set_clock``.
+    """
+    deadline = metadata.deadline
+    return None if deadline is None else (deadline - now()).total_seconds()
+
+
+def expired(message: Message[Any]) -> bool:
+    """Tell whether the deadline of ``message`` has passed."""
+    left = seconds_left(message.metadata)
+    return left is not None and left <= 0
+
+
+async def before_deadline(
+    metadata: MessageMetadata | None, call: Callable[[], Awaitable[Outcome]]
+) -> Outcome:
+    """Await ``call()`` unless the deadline of ``metadata`` has passed.
+
+    The call is cancelled if it is still running when the deadline passes.
+    Without ``metadata`` or a deadline, it is awaited as is.
+
+    Raises:
+        DeadlineExceededError: If the deadline passed before or during the call.
+    """
+    if metadata is None or (left := seconds_left(metadata)) is None:
+        return await call()
+    if left <= 0:
+        raise DeadlineExceededError.for_metadata(metadata)
+    timeout = asyncio.timeout(left)
+    try:
+        async with timeout:
+            return await call()
+    except TimeoutError as error:
+        if not timeout.expired():
+            raise
+        raise DeadlineExceededError.for_metadata(metadata) from error
+
+
+class DeadlineUseCase(Generic[Request, Response]):
+    """``UseCase`` refusing to start, or cancelled, once its deadline has passed.
+
+    The deadline is that of the request when it is a message, and otherwise
+    that of the message being handled, so a use case executed by a handler
+    stops when the caller that sent the message has given up. Blocking use
+    cases wrapped in ``ThreadedUseCase`` are told through
+    ``cancellation_requested``.
+
+    Example:
+        >>> search = DeadlineUseCase(SearchProducts(index))
+        >>> with handling(query):
+        ...     await search.execute(query.criteria)
+    """
+
+    def __init__(self, use_case: UseCase[Request, Response]) -> None:
+        """Wrap ``use_case``."""
+        self._use_case = use_case
+
+    async def execute(self, request: Request) -> Response:
+        """Execute the use case within the deadline.
+
+        Raises:
+            DeadlineExceededError: If the deadline passed before or during execution.
+        """
+        metadata = request.metadata if isinstance(request, Message) else current_metadata()
+        return await before_deadline(metadata, lambda: self._use_case.execute(request))
@@ -0,0 +1,228 @@
+"""Errors raised by the in-process message buses."""
+
+from __future__ import annotations
+
+from collections.abc import Iterable, Sequence
+from typing import Any
+
+from forging_blocks.domain.messages.message import Message, MessageMetadata
+from forging_blocks.foundation.errors.base import CombinedErrors, Error
+from forging_blocks.foundation.errors.core import ErrorMessage, ErrorMetadata
+
+
+class HandlerNotFoundError(Error):
+    """Raised when a command or query is dispatched without a registered handler."""
+
+    @classmethod
+    def for_message(cls, message: Message[Any]) -> HandlerNotFoundError:
+        """Create the error for a message nobody handles."""
+        message_type = message.metadata.message_type
+        return cls(
+            ErrorMessage(f"No handler registered for message type '{message_type}'."),
+            ErrorMetadata(
+                context={
+                    "message_type": message_type,
+                    "message_class": type(message).__qualname__,
+                    "message_id": str(message.message_id),
+                }
+            ),
+        )
+
+
+class HandlerFailedError(Error):
+    """Wraps an exception raised by a handler so it can be returned in an ``Err``."""
+
+    @classmethod
+    def from_exception(
+        cls, handler: object, message: Message[Any], exception: Exception
+    ) -> HandlerFailedError:
+        """Create the error for ``exception``, raised while handling ``message``."""
+        handler_name = type(handler).__qualname__
+        error = cls(
+            ErrorMessage(f"Handler '{handler_name}' failed: {exception}"),
+            ErrorMetadata(
+                context={
+                    "handler": handler_name,
+                    "message_type": message.metadata.message_type,
+                    "message_id": str(message.message_id),
+                    "exception_type": type(exception).__qualname__,
+                }
+            ),
+        )
+        error.__cause__ = exception
+        return error
+
+
+class DispatchFailedError(CombinedErrors[Error]):
+    """Raised by ``dispatch_many`` once every message was handled, if some handlers failed.
+
+    It combines the errors of the failed commands and queries, in the order they
+    were given, while ``results`` keeps the outcome of every message.
+    """
+
+    def __init__(self, results: Sequence[Any], failed: Iterable[int]) -> None:
+        """Create the error.
+
+        Args:
+            results: One entry per message, as ``dispatch_many`` returns them,
+                with an ``Err`` for each failed command or query.
+            failed: The indexes of the failed messages.
+        """
+        self._failed = tuple(sorted(failed))
+        super().__init__(results[index].error for index in self._failed)
+        self._results = tuple(results)
+
+    @property
+    def results(self) -> Sequence[Any]:
+        """The outcome of every message dispatched, in the order given."""
+        return self._results
+
+    @property
+    def failed(self) -> Sequence[int]:
+        """The indexes of the failed messages, in the order given."""
+        return self._failed
+
+
+class QueueFullError(Error):
+    """Raised when a message is rejected because the bus queue is saturated."""
+
+    @classmethod
+    def for_message(cls, message: Message[Any], depth: int) -> QueueFullError:
+        """Create the error for a message arriving at a queue holding ``depth`` messages."""
+        return cls(
+            ErrorMessage(f"Queue is full; rejected message '{message.metadata.message_type}'."),
+            ErrorMetadata(
+                context={
+                    "message_type": message.metadata.message_type,
+                    "message_id": str(message.message_id),
+                    "depth": depth,
+                }
+            ),
+        )
+
+
+class MessageDroppedError(Error):
+    """Raised to the caller awaiting a message dropped to make room in a full queue."""
+
+    @classmethod
+    def for_message(cls, message: Message[Any]) -> MessageDroppedError:
+        """Create the error for a dropped message."""
+        return cls(
+            ErrorMessage(f"Message '{message.metadata.message_type}' was dropped from the queue."),
+            ErrorMetadata(
+                context={
+                    "message_type": message.metadata.message_type,
+                    "message_id": str(message.message_id),
+                }
+            ),
+        )
+
+
+class RetriesExhaustedError(Error):
+    """Records why a message was sent to the dead letters after its last attempt."""
+
+    @classmethod
+    def from_exception(
+        cls, message: Message[Any], attempts: int, exception: Exception
+    ) -> RetriesExhaustedError:
+        """Create the error for ``message``, whose last attempt raised ``exception``."""
+        message_type = message.metadata.message_type
+        error = cls(
+            ErrorMessage(f"Gave up on message '{message_type}' after {attempts} attempts."),
+            ErrorMetadata(
+                context={
+                    "message_type": message_type,
+                    "message_id": str(message.message_id),
+                    "attempts": attempts,
+                    "exception_type": type(exception).__qualname__,
+                    "exception": str(exception),
+                }
+            ),
+        )
+        error.__cause__ = exception
+        return error
+
+
+class CircuitOpenError(Error):
+    """Returned instead of calling a handler whose circuit breaker is open."""
+
+    @classmethod
+    def for_handler(
+        cls, handler: object, message: Message[Any], retry_in: float
+    ) -> CircuitOpenError:
+        """Create the error for ``message``, rejected ``retry_in`` seconds before a probe."""
+        handler_name = type(handler).__qualname__
+        return cls(
+            ErrorMessage(f"Circuit of handler '{handler_name}' is open."),
+            ErrorMetadata(
+                context={
+                    "handler": handler_name,
+                    "message_type": message.metadata.message_type,
+                    "message_id": str(message.message_id),
+                    "retry_in": retry_in,
+                }
+            ),
+        )
+
+
+class ConcurrencyLimitError(Error):
+    """Returned instead of calling a handler already running at its concurrency limit."""
+
+    @classmethod
+    def for_handler(
+        cls, handler: object, message: Message[Any], limit: int
+    ) -> ConcurrencyLimitError:
+        """Create the error for ``message``, rejected while ``limit`` calls were running."""
+        handler_name = type(handler).__qualname__
+        return cls(
+            ErrorMessage(f"Handler '{handler_name}' is at its concurrency limit of {limit}."),
+            ErrorMetadata(
+                context={
+                    "handler": handler_name,
+                    "message_type": message.metadata.message_type,
+                    "message_id": str(message.message_id),
+                    "limit": limit,
+                }
+            ),
+        )
+
+
+class RateLimitExceededError(Error):
+    """Returned instead of dispatching a message shed by a rate limit."""
+
+    @classmethod
+    def for_message(
+        cls, message: Message[Any], limit: str, retry_in: float
+    ) -> RateLimitExceededError:
+        """Create the error for ``message``, shed by the ``limit`` rate limit."""
+        message_type = message.metadata.message_type
+        return cls(
+            ErrorMessage(f"Rate limit '{limit}' exceeded; shed message '{message_type}'."),
+            ErrorMetadata(
+                context={
+                    "limit": limit,
+                    "message_type": message_type,
+                    "message_id": str(message.message_id),
+                    "retry_in": retry_in,
+                }
+            ),
+        )
+
+
+class DeadlineExceededError(Error):
+    """Raised for a message whose deadline passed before or while it was handled."""
+
+    @classmethod
+    def for_metadata(cls, metadata: MessageMetadata) -> DeadlineExceededError:
+        """Create the error for the message described by ``metadata``."""
+        deadline = metadata.deadline
+        return cls(
+            ErrorMessage(f"Deadline of message '{metadata.message_type}' exceeded."),
+            ErrorMetadata(
+                context={
+                    "message_type": metadata.message_type,
+                    "message_id": str(metadata.message_id),
+                    "deadline": None if deadline is None else deadline.isoformat(),
+                }
+            ),
+        )
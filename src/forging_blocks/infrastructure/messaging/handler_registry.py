@@ -0,0 +1,116 @@
+"""Registry resolving the handlers of a message, with a cached dispatch table.
+
+Handlers are registered for a ``Message`` class or for a ``message_type`` string.
+The handlers of a message are those registered for any class in its MRO, most
+specific first, followed by those registered for its ``message_type``. The result
+is computed once per (class, message_type) pair and cached until the next
+registration, so resolution costs one dictionary lookup regardless of how many
+handlers are registered.
+"""
+
+from __future__ import annotations
+
+import inspect
+import types
+from typing import Any, Union, get_args, get_origin, get_type_hints
+
+from forging_blocks.application.ports.inbound.message_handler import MessageHandler
+from forging_blocks.domain.messages.message import Message
+
+HandledType = type[Message[Any]] | str
+DispatchKey = tuple[type[Message[Any]], str]
+
+
+class HandlerRegistry:
+    """Handlers indexed by message class and by ``message_type`` string.
+
+    Example:
+        >>> registry = HandlerRegistry()
+        >>> registry.register(SendWelcomeEmail())  # handles UserRegistered
+        >>> registry.register(AuditTrail())  # handles Event
+        >>> registry.handlers_for(UserRegistered(...))
+        (<SendWelcomeEmail>, <AuditTrail>)
+    """
+
+    def __init__(self) -> None:
+        self._by_class: dict[type[Message[Any]], list[MessageHandler[Any, Any]]] = {}
+        self._by_name: dict[str, list[MessageHandler[Any, Any]]] = {}
+        self._dispatch_table: dict[DispatchKey, tuple[MessageHandler[Any, Any], ...]] = {}
+
+    def register(
+        self,
+        handler: MessageHandler[Any, Any],
+        message_type: HandledType | None = None,
+    ) -> tuple[HandledType, ...]:
+        """Register ``handler`` and invalidate the dispatch table.
+
+        Args:
+            handler: The handler to register.
+            message_type: The message class or ``message_type`` string it handles.
+                Defaults to the annotation of the ``message`` parameter of
+                ``handler.handle``; a union annotation registers every member.
+
+        Returns:
+            The message classes or names the handler was registered for.
+
+        Raises:
+            TypeError: If the handled type is not given and cannot be inferred.
+        """
+        handled = (message_type,) if message_type is not None else handled_types(handler)
+        for handled_type in handled:
+            if isinstance(handled_type, str):
+                self._by_name.setdefault(handled_type, []).append(handler)
+            else:
+                self._by_class.setdefault(handled_type, []).append(handler)
+        self._dispatch_table.clear()
+        return handled
+
+    def handlers_for(self, message: Message[Any]) -> tuple[MessageHandler[Any, Any], ...]:
+        """Return the handlers of ``message``, most specific first."""
+        key = (type(message), message.metadata.message_type)
+        try:
+            return self._dispatch_table[key]
+        except KeyError:
+            return self._dispatch_table.setdefault(key, self._resolve(*key))
+
+    def _resolve(
+        self, message_class: type[Message[Any]], message_type: str
+    ) -> tuple[MessageHandler[Any, Any], ...]:
+        """Collect the handlers of a message class and name, without duplicates."""
+        handlers: dict[int, MessageHandler[Any, Any]] = {}
+        for cls in message_class.__mro__:
+            for handler in self._by_class.get(cls, ()):
+                handlers.setdefault(id(handler), handler)
+        for handler in self._by_name.get(message_type, ()):
+            handlers.setdefault(id(handler), handler)
+        return tuple(handlers.values())
+
+
+def handled_types(handler: MessageHandler[Any, Any]) -> tuple[HandledType, ...]:
+    """Infer the message classes ``handler`` handles from ``handle``'s annotation.
+
+    Raises:
+        TypeError: If ``handle`` has no message parameter annotated with a
+            ``Message`` subclass (or a union of them).
+    """
+    handle = type(handler).handle
+    parameters = list(inspect.signature(handle).parameters.values())[1:]
+    if not parameters:
+        raise TypeError(f"{type(handler).__qualname__}.handle takes no message parameter")
+    annotation = get_type_hints(handle).get(parameters[0].name)
+    members = get_args(annotation) if _is_union(annotation) else (annotation,)
+    handled = tuple(get_origin(member) or member for member in members)
+    if not handled or not all(_is_message_class(member) for member in handled):
+        raise TypeError(
+            f"Cannot infer the message type handled by {type(handler).__qualname__}; "
+            "annotate the message parameter of handle() or pass message_type explicitly"
+        )
+    return handled
+
+
+def _is_union(annotation: Any) -> bool:
+    return get_origin(annotation) in (Union, types.UnionType)
+
+
+def _is_message_class(candidate: Any) -> bool:
+    return isinstance(candidate, type) and issubclass(candidate, Message)
@@ -0,0 +1,376 @@
+"""In-process implementation of the ``MessageBus`` port."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Callable, Iterable, Iterator, Sequence
+from typing import Any
+
+from forging_blocks.application.ports.inbound.message_handler import MessageHandler
+from forging_blocks.domain.messages.command import Command
+from forging_blocks.domain.messages.event import Event
+from forging_blocks.domain.messages.message import Message
+from forging_blocks.domain.messages.message_context import handling
+from forging_blocks.domain.messages.query import Query
+from forging_blocks.foundation.errors.base import Error
+from forging_blocks.foundation.result import Err, Ok, Result
+from forging_blocks.infrastructure.messaging.deadlines import before_deadline, expired
+from forging_blocks.infrastructure.messaging.errors import (
+    DeadlineExceededError,
+    DispatchFailedError,
+    HandlerFailedError,
+    HandlerNotFoundError,
+)
+from forging_blocks.infrastructure.messaging.handler_registry import (
+    HandledType,
+    HandlerRegistry,
+    handled_types,
+)
+from forging_blocks.infrastructure.messaging.middleware import (
+    MessageTypes,
+    Middleware,
+    NextHandler,
+    PerHandlerMiddleware,
+    compose,
+)
+
+
+class InMemoryMessageBus:
+    """Message bus dispatching to handlers registered in the same process.
+
+    Commands, queries and any other non-event messages go to their most specific
+    handler, whose result is returned. Events are delivered to every handler whose
+    registered class is in the event's MRO (so a handler of ``Event`` receives all
+    events) or whose registered name is the event's ``message_type``. Event handlers
+    run concurrently, at most ``max_concurrency`` at a time, and each outcome is
+    returned as a ``Result`` so one failing subscriber does not hide the others.
+    Handlers run inside ``message_context.handling``, so messages they create join
+    the causal chain of the message being handled.
+
+    ``dispatch_many`` groups messages by handler and delivers each group in the
+    order given, with a single ``handle_batch`` call for handlers that implement
+    ``BatchMessageHandler`` and that no middleware applies to.
+
+    Middlewares are composed around each handler when it is registered, leaving
+    out those that do not apply to the message types it handles, so dispatching
+    does not walk the middleware list.
+
+    Messages of the ``deadline_types`` whose ``metadata.deadline`` has passed
+    fail with ``DeadlineExceededError`` without reaching their handlers, and
+    handlers still running at the deadline are cancelled. Only commands and
+    queries are concerned by default: events record facts, which should not be
+    lost because the caller of the request that raised them stopped waiting.
+
+    Example:
+        >>> bus = InMemoryMessageBus()
+        >>> await bus.register_handler(RegisterUserHandler())
+        >>> await bus.register_handler(AuditTrail(), message_type=Event)
+        >>> await bus.dispatch(RegisterUser(email="ada@example.com"))
+    """
+
+    def __init__(
+        self,
+        registry: HandlerRegistry | None = None,
+        max_concurrency: int | None = None,
+        middlewares: Sequence[Middleware | PerHandlerMiddleware] = (),
+        deadline_types: MessageTypes = (Command, Query),
+    ) -> None:
+        """Create a bus.
+
+        Args:
+            registry: The handler registry to use. Defaults to an empty registry.
+            max_concurrency: How many handlers of one event may run at the same
+                time. None means no limit.
+            middlewares: Wrap every handler they apply to, the first one being
+                the outermost. A ``PerHandlerMiddleware`` contributes the
+                middleware it creates for each handler.
+            deadline_types: The message classes whose deadlines are enforced.
+        """
+        if max_concurrency is not None and max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1")
+        self._registry = registry or HandlerRegistry()
+        self._max_concurrency = max_concurrency
+        self._middlewares = tuple(middlewares)
+        self._pipelines: dict[int, _PipelineHandler] = {}
+        self._deadline_types = deadline_types
+
+    @property
+    def registry(self) -> HandlerRegistry:
+        """The registry resolving the handlers of each message."""
+        return self._registry
+
+    async def register_handler(
+        self,
+        handler: MessageHandler[Any, Any],
+        message_type: HandledType | None = None,
+    ) -> None:
+        """Register a handler.
+
+        Args:
+            handler: The handler to register.
+            message_type: The message class or ``message_type`` string it handles.
+                Inferred from the annotation of ``handler.handle`` when omitted.
+        """
+        if not self._middlewares:
+            self._registry.register(handler, message_type)
+            return
+        handled = handled_types(handler) if message_type is None else (message_type,)
+        pipeline = self._pipelines.get(id(handler))
+        if pipeline is None:
+            pipeline = self._pipelines[id(handler)] = _PipelineHandler(handler)
+        pipeline.compile(self._middlewares, handled)
+        for each in handled:
+            self._registry.register(pipeline, each)
+
+    async def dispatch(self, message: Message[Any]) -> Any:
+        """Dispatch a message to its handlers.
+
+        Returns:
+            The result of the handler for commands and queries. For events, one
+            ``Result`` per handler, in registration order: ``Ok`` with the handler's
+            return value, or ``Err`` with the ``Error`` it raised (other exceptions
+            are wrapped in ``HandlerFailedError``).
+
+        Raises:
+            HandlerNotFoundError: If a non-event message has no handler.
+            DeadlineExceededError: If a non-event message's deadline passes before
+                or while it is handled.
+        """
+        handlers = self._targets(message)
+        with handling(message):
+            if isinstance(message, Event):
+                return await self._fan_out(handlers, message)
+            if self._bounded(message):
+                handler = handlers[0]
+                return await before_deadline(message.metadata, lambda: handler.handle(message))
+            return await handlers[0].handle(message)
+
+    async def dispatch_many(self, messages: Sequence[Message[Any]]) -> list[Any]:
+        """Dispatch several messages, grouped by handler.
+
+        Every handler receives its messages in the order given, which preserves the
+        order of events collected from one aggregate. Handlers implementing
+        ``BatchMessageHandler`` receive them in a single ``handle_batch`` call; batch
+        calls run outside of ``message_context.handling``, since they cover several
+        messages, and are not cancelled at the deadline of any of them; expired
+        messages are left out of them.
+
+        Every message is handled even when the handler of another one fails.
+
+        Returns:
+            One entry per message, in the order given: the handler result for
+            commands and queries, and for events the list of per-handler
+            ``Result`` values, as returned by ``dispatch``. A batch call that
+            fails, or does not return one result per message, yields an ``Err``
+            for every message in the batch.
+
+        Raises:
+            HandlerNotFoundError: If a non-event message has no handler. Raised
+                before any message is handled.
+            DispatchFailedError: If the handlers of commands or queries failed,
+                once every message was handled. Its ``results`` hold the entries
+                above, with an ``Err`` for each failed command or query.
+        """
+        groups: dict[int, tuple[MessageHandler[Any, Any], list[int]]] = {}
+        for index, message in enumerate(messages):
+            for handler in self._targets(message):
+                groups.setdefault(id(handler), (handler, []))[1].append(index)
+
+        results: list[Any] = [[] if isinstance(message, Event) else None for message in messages]
+        failed: list[int] = []
+        for handler, indexes in groups.values():
+            batch = [messages[index] for index in indexes]
+            outcomes = await _handle_group(handler, batch, self._bounded)
+            for index, outcome in zip(indexes, outcomes, strict=True):
+                if isinstance(messages[index], Event):
+                    results[index].append(outcome)
+                elif outcome.is_ok:
+                    results[index] = outcome.value
+                else:
+                    results[index] = outcome
+                    failed.append(index)
+        if failed:
+            raise DispatchFailedError(results, failed)
+        return results
+
+    def check_handled(self, messages: Iterable[Message[Any]]) -> None:
+        """Check that every command and query among ``messages`` has a handler.
+
+        Raises:
+            HandlerNotFoundError: For the first non-event message without a handler.
+        """
+        for message in messages:
+            self._targets(message)
+
+    async def _fan_out(
+        self, handlers: Sequence[MessageHandler[Any, Any]], event: Event[Any]
+    ) -> list[Result[Any, Error]]:
+        """Run the handlers of ``event`` concurrently, collecting their outcomes."""
+        bounded = self._bounded(event)
+        if len(handlers) <= 1:
+            return [await _deliver(handler, event, bounded) for handler in handlers]
+        limit = self._max_concurrency
+        if limit is None or limit >= len(handlers):
+            async with asyncio.TaskGroup() as group:
+                tasks = [
+                    group.create_task(_deliver(handler, event, bounded)) for handler in handlers
+                ]
+        else:
+            semaphore = asyncio.Semaphore(limit)
+
+            async def deliver_limited(handler: MessageHandler[Any, Any]) -> Result[Any, Error]:
+                async with semaphore:
+                    return await _deliver(handler, event, bounded)
+
+            async with asyncio.TaskGroup() as group:
+                tasks = [group.create_task(deliver_limited(handler)) for handler in handlers]
+        return [task.result() for task in tasks]
+
+    def _bounded(self, message: Message[Any]) -> bool:
+        """Tell whether the deadline of ``message`` is enforced."""
+        return message.metadata.deadline is not None and isinstance(message, self._deadline_types)
+
+    def _targets(self, message: Message[Any]) -> tuple[MessageHandler[Any, Any], ...]:
+        """Return every handler of an event, or the single handler of other messages.
+
+        Raises:
+            HandlerNotFoundError: If a non-event message has no handler.
+        """
+        handlers = self._registry.handlers_for(message)
+        if isinstance(message, Event):
+            return handlers
+        if not handlers:
+            raise HandlerNotFoundError.for_message(message)
+        return handlers[:1]
+
+
+class _PipelineHandler:
+    """Handler running the middlewares composed around another handler."""
+
+    def __init__(self, handler: MessageHandler[Any, Any]) -> None:
+        self._handler = handler
+        self._handled: tuple[HandledType, ...] = ()
+        self._pipeline: NextHandler = handler.handle
+
+    def compile(
+        self,
+        middlewares: Sequence[Middleware | PerHandlerMiddleware],
+        handled: Sequence[HandledType],
+    ) -> None:
+        """Compose the pipeline for the message types handled so far and ``handled``.
+
+        When no middleware applies, batches still go to the handler's ``handle_batch``.
+        """
+        self._handled += tuple(each for each in handled if each not in self._handled)
+        bare = self._handler.handle
+        own = [
+            each.for_handler(self._handler) if isinstance(each, PerHandlerMiddleware) else each
+            for each in middlewares
+        ]
+        self._pipeline = compose(bare, own, self._handled)
+        handle_batch = getattr(self._handler, "handle_batch", None)
+        if self._pipeline is bare and handle_batch is not None:
+            self.handle_batch = handle_batch
+        else:
+            self.__dict__.pop("handle_batch", None)
+
+    @property
+    def handler(self) -> MessageHandler[Any, Any]:
+        """The handler at the end of the pipeline."""
+        return self._handler
+
+    async def handle(self, message: Message[Any]) -> Any:
+        """Handle ``message`` through the pipeline."""
+        return await self._pipeline(message)
+
+
+async def _deliver(
+    handler: MessageHandler[Any, Any], message: Message[Any], bounded: bool = False
+) -> Result[Any, Error]:
+    """Handle ``message``, within its deadline if ``bounded``, returning the outcome."""
+    try:
+        if bounded:
+            return Ok(await before_deadline(message.metadata, lambda: handler.handle(message)))
+        return Ok(await handler.handle(message))
+    except Exception as exception:
+        return Err(_as_error(handler, message, exception))
+
+
+async def _handle_group(
+    handler: MessageHandler[Any, Any],
+    messages: list[Message[Any]],
+    bounded: Callable[[Message[Any]], bool],
+) -> list[Result[Any, Error]]:
+    """Deliver ``messages`` to ``handler`` in order, as one batch when supported."""
+    handle_batch = getattr(handler, "handle_batch", None)
+    if handle_batch is None:
+        outcomes = []
+        for message in messages:
+            with handling(message):
+                outcomes.append(await _deliver(handler, message, bounded(message)))
+        return outcomes
+    late: list[Result[Any, Error] | None] = [
+        Err(DeadlineExceededError.for_metadata(message.metadata))
+        if bounded(message) and expired(message)
+        else None
+        for message in messages
+    ]
+    live = [message for message, outcome in zip(messages, late, strict=True) if outcome is None]
+    if not live:
+        return [outcome for outcome in late if outcome is not None]
+    handled: Iterator[Result[Any, Error]]
+    try:
+        results = await handle_batch(live)
+        if len(results) != len(live):
+            raise ValueError("handle_batch must return one result per message")
+        handled = iter([Ok(value) for value in results])
+    except Exception as exception:
+        handled = iter([Err(_as_error(handler, message, exception)) for message in live])
+    return [outcome if outcome is not None else next(handled) for outcome in late]
+
+
+def merge_results(
+    size: int, parts: Iterable[tuple[Sequence[int], Sequence[Any] | BaseException]]
+) -> list[Any]:
+    """Merge the outcomes of ``dispatch_many`` calls over parts of a batch.
+
+    Args:
+        size: The number of messages in the batch.
+        parts: The indexes in the batch of the messages of each part, with what
+            ``dispatch_many`` returned for the part or the exception it raised. A
+            part failing with an ``Error`` other than ``DispatchFailedError``, such
+            as one dropped from a queue, fails every message in it.
+
+    Returns:
+        One entry per message of the batch, as ``dispatch_many`` returns them.
+
+    Raises:
+        DispatchFailedError: If messages of some parts failed, with the results
+            of the whole batch.
+        BaseException: What a part raised, if it is not an ``Error``.
+    """
+    results: list[Any] = [None] * size
+    failed: list[int] = []
+    for indexes, outcome in parts:
+        if isinstance(outcome, DispatchFailedError):
+            failed.extend(indexes[index] for index in outcome.failed)
+            outcome = outcome.results
+        elif isinstance(outcome, Error):
+            failed.extend(indexes)
+            outcome = [Err(outcome)] * len(indexes)
+        elif isinstance(outcome, BaseException):
+            raise outcome
+        for index, result in zip(indexes, outcome, strict=True):
+            results[index] = result
+    if failed:
+        raise DispatchFailedError(results, failed)
+    return results
+
+
+def _as_error(handler: object, message: Message[Any], exception: Exception) -> Error:
+    """Return ``exception`` if it is an ``Error``, or wrap it in ``HandlerFailedError``."""
+    if isinstance(exception, Error):
+        return exception
+    if isinstance(handler, _PipelineHandler):
+        handler = handler.handler
+    return HandlerFailedError.from_exception(handler, message, exception)
@@ -0,0 +1,138 @@
+"""Adapter delivering events to a batch handler in size- or time-bounded batches."""
+
+from __future__ import annotations
+
+import asyncio
+import contextvars
+from collections.abc import Sequence
+from typing import Any
+
+from forging_blocks.application.ports.inbound.message_handler import BatchMessageHandler
+from forging_blocks.domain.messages.message import Message
+from forging_blocks.domain.messages.message_context import handling
+
+_Pending = tuple[Message[Any], "asyncio.Future[Any]"]
+
+
+class MicroBatchingHandler:
+    """Handler collecting events into micro-batches for a ``BatchMessageHandler``.
+
+    Each ``handle`` call adds its event to the pending batch and waits for that
+    batch to be flushed, which happens once ``max_batch_size`` events are pending
+    or ``max_delay`` seconds after the first of them arrived, whichever comes
+    first. Batches are handled one at a time, in the order they were flushed, and
+    outside of ``message_context.handling``, since they cover several events.
+    Batches only grow when events arrive concurrently, as with ``dispatch_many``,
+    several producers or the workers of a ``QueuedMessageBus``; a caller awaiting
+    one event at a time gets batches of one, each delayed by ``max_delay``.
+
+    When ``handle_batch`` raises, the events of the batch are handled again one
+    by one with ``handle``, so each caller gets the outcome of its own event and a
+    single bad event does not fail its neighbours. The message type of the
+    adapter cannot be inferred, so pass ``message_type`` when registering it.
+
+    Example:
+        >>> projection = MicroBatchingHandler(OrderProjection(), 500, max_delay=0.02)
+        >>> await bus.register_handler(projection, message_type=OrderEvent)
+    """
+
+    def __init__(
+        self,
+        handler: BatchMessageHandler[Any, Any],
+        max_batch_size: int = 100,
+        max_delay: float = 0.01,
+    ) -> None:
+        """Wrap ``handler``.
+
+        Args:
+            handler: Receives the batches.
+            max_batch_size: The number of pending events that triggers a flush.
+            max_delay: How long, in seconds, the first pending event may wait.
+        """
+        if max_batch_size < 1:
+            raise ValueError("max_batch_size must be at least 1")
+        self._handler = handler
+        self._max_batch_size = max_batch_size
+        self._max_delay = max_delay
+        self._pending: list[_Pending] = []
+        self._timer: asyncio.TimerHandle | None = None
+        self._flushing: asyncio.Lock | None = None
+        self._flushes: set[asyncio.Task[None]] = set()
+
+    @property
+    def pending(self) -> int:
+        """The number of events waiting for their batch to be flushed."""
+        return len(self._pending)
+
+    async def handle(self, message: Message[Any]) -> Any:
+        """Add ``message`` to the pending batch and return its result once flushed."""
+        future = self._add(message)
+        return await future
+
+    async def handle_batch(self, messages: Sequence[Message[Any]]) -> list[Any]:
+        """Add ``messages`` to the pending batches and return their results."""
+        futures = [self._add(message) for message in messages]
+        return list(await asyncio.gather(*futures))
+
+    async def flush(self) -> None:
+        """Flush the pending events now and wait for every flushed batch."""
+        self._flush()
+        while self._flushes:
+            await asyncio.gather(*self._flushes)
+
+    def _add(self, message: Message[Any]) -> asyncio.Future[Any]:
+        """Queue ``message``, flushing or arming the timer as needed."""
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._pending.append((message, future))
+        if len(self._pending) >= self._max_batch_size:
+            self._flush()
+        elif self._timer is None:
+            self._timer = loop.call_later(self._max_delay, self._flush)
+        return future
+
+    def _flush(self) -> None:
+        """Start handling the pending events as one batch."""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        if not self._pending:
+            return
+        batch, self._pending = self._pending, []
+        # A batch covers several events, so it must not run in the message context
+        # of the one whose arrival flushed it.
+        task = asyncio.get_running_loop().create_task(
+            self._run(batch), context=contextvars.Context()
+        )
+        self._flushes.add(task)
+        task.add_done_callback(self._flushes.discard)
+
+    async def _run(self, batch: list[_Pending]) -> None:
+        """Handle one batch after the batches flushed before it."""
+        if self._flushing is None:
+            self._flushing = asyncio.Lock()
+        async with self._flushing:
+            messages = [message for message, _ in batch]
+            try:
+                results = await self._handler.handle_batch(messages)
+                if len(results) != len(batch):
+                    raise ValueError("handle_batch must return one result per message")
+            except Exception:
+                await self._run_one_by_one(batch)
+                return
+            for (_, future), result in zip(batch, results, strict=True):
+                if not future.done():
+                    future.set_result(result)
+
+    async def _run_one_by_one(self, batch: list[_Pending]) -> None:
+        """Handle the events of a failed batch individually, in order."""
+        for message, future in batch:
+            try:
+                with handling(message):
+                    result = await self._handler.handle(message)
+            except Exception as error:
+                if not future.done():
+                    future.set_exception(error)
+            else:
+                if not future.done():
+                    future.set_result(result)
@@ -0,0 +1,294 @@
+"""Middlewares wrapping message handlers, composed once per handler."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable, Sequence
+from dataclasses import dataclass
+from typing import Any, Protocol, runtime_checkable
+from uuid import UUID
+
+from forging_blocks.application.ports.outbound.unit_of_work import UnitOfWork
+from forging_blocks.domain.messages.command import Command
+from forging_blocks.domain.messages.message import Message
+from forging_blocks.infrastructure.messaging.handler_registry import HandledType
+
+NextHandler = Callable[[Message[Any]], Awaitable[Any]]
+"""Handles a message: the next middleware of a pipeline, or the handler itself."""
+
+MessageTypes = tuple[type[Message[Any]], ...]
+
+
+class Middleware(Protocol):
+    """Interceptor around the ``handle`` call of every handler it applies to."""
+
+    @property
+    def message_types(self) -> MessageTypes:
+        """The message classes this middleware applies to."""
+        ...
+
+    async def __call__(self, message: Message[Any], call_next: NextHandler) -> Any:
+        """Handle ``message``, usually by awaiting ``call_next(message)``."""
+        ...
+
+
+@runtime_checkable
+class PerHandlerMiddleware(Protocol):
+    """Creates the middleware of each handler, for middlewares keeping per-handler state.
+
+    Buses call ``for_handler`` when they compose a handler's pipeline, so the
+    returned middleware can track that handler alone.
+    """
+
+    @property
+    def message_types(self) -> MessageTypes:
+        """The message classes the created middlewares apply to."""
+        ...
+
+    def for_handler(self, handler: object) -> Middleware:
+        """Return the middleware wrapping ``handler``, the same one on every call."""
+        ...
+
+
+def compose(
+    handle: NextHandler, middlewares: Sequence[Middleware], handled: Sequence[HandledType]
+) -> NextHandler:
+    """Wrap ``handle`` in the middlewares applying to the ``handled`` message types.
+
+    The first middleware is the outermost. Middlewares applying to none of the
+    handled types are left out of the pipeline, and those applying to only some
+    of them check each message's class, so nothing is resolved at dispatch time
+    for handlers of a single message class.
+
+    Returns:
+        A callable handling a message through the whole pipeline.
+    """
+    call = handle
+    for middleware in reversed(middlewares):
+        scope = _scope(middleware.message_types, handled)
+        if scope == "all":
+            call = _bind(middleware, call)
+        elif scope == "some":
+            call = _bind_guarded(middleware, call)
+    return call
+
+
+def _scope(types: MessageTypes, handled: Sequence[HandledType]) -> str:
+    """Tell whether middleware ``types`` cover "all", "some" or "none" of ``handled``."""
+    covered = [not isinstance(each, str) and issubclass(each, types) for each in handled]
+    if all(covered):
+        return "all"
+    if any(covered) or any(
+        isinstance(each, str) or any(issubclass(cls, each) for cls in types) for each in handled
+    ):
+        return "some"
+    return "none"
+
+
+def _bind(middleware: Middleware, call_next: NextHandler) -> NextHandler:
+    async def call(message: Message[Any]) -> Any:
+        return await middleware(message, call_next)
+
+    return call
+
+
+def _bind_guarded(middleware: Middleware, call_next: NextHandler) -> NextHandler:
+    types = middleware.message_types
+
+    async def call(message: Message[Any]) -> Any:
+        if isinstance(message, types):
+            return await middleware(message, call_next)
+        return await call_next(message)
+
+    return call
+
+
+class LoggingMiddleware:
+    """Log every message handled, and the failures of its handlers.
+
+    Args:
+        logger: The logger to write to. Defaults to this module's logger.
+        level: The level of the "handling" records. Failures are logged with
+            ``logger.exception``.
+        message_types: The message classes to log.
+    """
+
+    def __init__(
+        self,
+        logger: logging.Logger | None = None,
+        level: int = logging.DEBUG,
+        message_types: MessageTypes = (Message,),
+    ) -> None:
+        self._logger = logger or logging.getLogger(__name__)
+        self._level = level
+        self.message_types = message_types
+
+    async def __call__(self, message: Message[Any], call_next: NextHandler) -> Any:
+        """Log ``message`` around its handling."""
+        message_type = message.metadata.message_type
+        if self._logger.isEnabledFor(self._level):
+            self._logger.log(self._level, "Handling %s %s", message_type, message.message_id)
+        try:
+            return await call_next(message)
+        except Exception:
+            self._logger.exception("Failed to handle %s %s", message_type, message.message_id)
+            raise
+
+
+@dataclass(slots=True)
+class HandlingStats:
+    """Counters of the messages of one type handled through ``MetricsMiddleware``.
+
+    Attributes:
+        handled: The number of calls that returned.
+        failed: The number of calls that raised.
+        total_seconds: The time spent in those calls.
+    """
+
+    handled: int = 0
+    failed: int = 0
+    total_seconds: float = 0.0
+
+
+class MetricsMiddleware:
+    """Count the calls of each message type and time them.
+
+    Args:
+        message_types: The message classes to measure.
+        clock: Returns a monotonic time in seconds.
+    """
+
+    def __init__(
+        self,
+        message_types: MessageTypes = (Message,),
+        clock: Callable[[], float] = time.perf_counter,
+    ) -> None:
+        self.message_types = message_types
+        self._clock = clock
+        self._stats: dict[str, HandlingStats] = {}
+
+    def stats(self) -> dict[str, HandlingStats]:
+        """Return the counters collected so far, keyed by message type."""
+        return dict(self._stats)
+
+    async def __call__(self, message: Message[Any], call_next: NextHandler) -> Any:
+        """Measure the handling of ``message``."""
+        message_type = message.metadata.message_type
+        stats = self._stats.get(message_type) or self._stats.setdefault(
+            message_type, HandlingStats()
+        )
+        started = self._clock()
+        try:
+            result = await call_next(message)
+        except Exception:
+            stats.failed += 1
+            raise
+        else:
+            stats.handled += 1
+            return result
+        finally:
+            stats.total_seconds += self._clock() - started
+
+
+class RetryMiddleware:
+    """Call the rest of the pipeline again when it raises one of ``retry_on``.
+
+    Args:
+        attempts: The maximum number of calls, including the first one.
+        retry_on: The exception types worth retrying.
+        message_types: The message classes to retry.
+    """
+
+    def __init__(
+        self,
+        attempts: int = 3,
+        retry_on: tuple[type[Exception], ...] = (Exception,),
+        message_types: MessageTypes = (Message,),
+    ) -> None:
+        if attempts < 1:
+            raise ValueError("attempts must be at least 1")
+        self._attempts = attempts
+        self._retry_on = retry_on
+        self.message_types = message_types
+
+    async def __call__(self, message: Message[Any], call_next: NextHandler) -> Any:
+        """Handle ``message``, retrying failures up to the attempt limit."""
+        for _ in range(self._attempts - 1):
+            try:
+                return await call_next(message)
+            except self._retry_on:
+                continue
+        return await call_next(message)
+
+
+class IdempotencyMiddleware:
+    """Handle each message id once, returning the first result to duplicates.
+
+    Results are remembered for the ``capacity`` most recent message ids; a
+    duplicate arriving while the original is still being handled waits for it.
+    Failed calls are forgotten, so the message can be handled again. Since the
+    key is the message id alone, the default scope is commands, which have a
+    single handler.
+
+    Args:
+        capacity: How many message ids to remember.
+        message_types: The message classes to deduplicate.
+    """
+
+    def __init__(self, capacity: int = 10_000, message_types: MessageTypes = (Command,)) -> None:
+        self._capacity = capacity
+        self._results: OrderedDict[UUID, asyncio.Future[Any]] = OrderedDict()
+        self.message_types = message_types
+
+    async def __call__(self, message: Message[Any], call_next: NextHandler) -> Any:
+        """Handle ``message`` unless its id was handled already."""
+        message_id = message.message_id
+        known = self._results.get(message_id)
+        if known is not None:
+            self._results.move_to_end(message_id)
+            return await asyncio.shield(known)
+        outcome: asyncio.Future[Any] = asyncio.get_running_loop().create_future()
+        self._results[message_id] = outcome
+        if len(self._results) > self._capacity:
+            self._results.popitem(last=False)
+        try:
+            result = await call_next(message)
+        except Exception as error:
+            self._results.pop(message_id, None)
+            outcome.set_exception(error)
+            outcome.exception()  # Duplicates may never await it.
+            raise
+        except BaseException:
+            self._results.pop(message_id, None)
+            outcome.cancel()
+            raise
+        outcome.set_result(result)
+        return result
+
+
+class TransactionMiddleware:
+    """Run the rest of the pipeline in a unit of work.
+
+    The unit of work commits when the handler returns and rolls back when it
+    raises, as ``UnitOfWork.__aexit__`` does.
+
+    Args:
+        unit_of_work: Creates the unit of work of each message.
+        message_types: The message classes to run in a transaction.
+    """
+
+    def __init__(
+        self,
+        unit_of_work: Callable[[], UnitOfWork],
+        message_types: MessageTypes = (Command,),
+    ) -> None:
+        self._unit_of_work = unit_of_work
+        self.message_types = message_types
+
+    async def __call__(self, message: Message[Any], call_next: NextHandler) -> Any:
+        """Handle ``message`` in a new unit of work."""
+        async with self._unit_of_work():
+            return await call_next(message)
@@ -0,0 +1,206 @@
+"""Message bus preserving per-key ordering while running different keys in parallel."""
+
+from __future__ import annotations
+
+import asyncio
+import contextvars
+from collections.abc import Awaitable, Callable, Hashable, Sequence
+from functools import partial
+from types import TracebackType
+from typing import Any
+
+from forging_blocks.application.ports.inbound.message_handler import MessageHandler
+from forging_blocks.domain.messages.event import Event
+from forging_blocks.domain.messages.message import Message
+from forging_blocks.infrastructure.messaging.handler_registry import HandledType
+from forging_blocks.infrastructure.messaging.in_memory_message_bus import (
+    InMemoryMessageBus,
+    merge_results,
+)
+
+PartitionKey = Callable[[Message[Any]], Hashable]
+"""Returns the key whose messages must be handled in order."""
+
+_LaneItem = tuple[Callable[[], Awaitable[Any]], "asyncio.Future[Any]"]
+
+_lane_owner: contextvars.ContextVar[PartitionedMessageBus | None] = contextvars.ContextVar(
+    "lane_owner", default=None
+)
+"""The bus whose lane is handling the current message, if any."""
+
+
+def aggregate_key(message: Message[Any]) -> Hashable | None:
+    """Return the aggregate id of an event, or None when it has none.
+
+    Events carry no aggregate id in their base class, so an ``aggregate_id``
+    attribute is used when the event defines one.
+    """
+    if isinstance(message, Event):
+        return getattr(message, "aggregate_id", None)
+    return None
+
+
+def default_partition_key(message: Message[Any]) -> Hashable:
+    """Return the aggregate id of an event, or the correlation id of any message."""
+    key = aggregate_key(message)
+    return message.metadata.correlation_id if key is None else key
+
+
+class PartitionedMessageBus:
+    """Message bus hashing each message to one of several ordered worker lanes.
+
+    Every lane is an asyncio task consuming a FIFO queue, so messages with the
+    same partition key are handled strictly in the order they were dispatched,
+    while messages with different keys can be handled concurrently. Handling
+    itself is delegated to an ``InMemoryMessageBus``, whose results are returned
+    to the callers of ``dispatch``.
+
+    ``dispatch_many`` queues the messages of each lane together, and the lane
+    hands them to ``InMemoryMessageBus.dispatch_many`` in one call, so batch
+    handlers receive them in batches.
+
+    Messages dispatched by a handler running on a lane are handled inline rather
+    than queued: a lane awaiting its own queue, or a cycle of lanes awaiting each
+    other's, would never return. Inline messages therefore jump ahead of the
+    messages already queued for their key.
+
+    Lanes start on the first dispatch and stop on ``aclose``, which waits for the
+    messages already queued; the bus can also be used as an async context manager.
+
+    Example:
+        >>> async with PartitionedMessageBus(lanes=8) as bus:
+        ...     await bus.register_handler(OrderProjection())
+        ...     await bus.dispatch_many(order.collect_events())
+    """
+
+    def __init__(
+        self,
+        bus: InMemoryMessageBus | None = None,
+        lanes: int = 8,
+        key: PartitionKey = default_partition_key,
+    ) -> None:
+        """Create a bus.
+
+        Args:
+            bus: The bus handling the messages of every lane. Defaults to a new
+                ``InMemoryMessageBus``.
+            lanes: The number of lanes, which bounds how many keys are handled
+                concurrently.
+            key: Returns the partition key of a message.
+        """
+        if lanes < 1:
+            raise ValueError("lanes must be at least 1")
+        self._bus = bus or InMemoryMessageBus()
+        self._key = key
+        self._queues: list[asyncio.Queue[_LaneItem | None]] = []
+        self._workers: list[asyncio.Task[None]] = []
+        self._lane_count = lanes
+
+    @property
+    def lanes(self) -> int:
+        """The number of lanes."""
+        return self._lane_count
+
+    async def __aenter__(self) -> PartitionedMessageBus:
+        """Start the lanes."""
+        self._start()
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        """Stop the lanes once their queued messages are handled."""
+        await self.aclose()
+
+    async def register_handler(
+        self,
+        handler: MessageHandler[Any, Any],
+        message_type: HandledType | None = None,
+    ) -> None:
+        """Register a handler on the underlying bus."""
+        await self._bus.register_handler(handler, message_type)
+
+    async def dispatch(self, message: Message[Any]) -> Any:
+        """Queue a message on its lane and wait for it to be handled.
+
+        Returns:
+            What ``InMemoryMessageBus.dispatch`` returns for the message.
+        """
+        if _lane_owner.get() is self:
+            return await self._bus.dispatch(message)
+        return await self._submit(self.partition(message), lambda: self._bus.dispatch(message))
+
+    async def dispatch_many(self, messages: Sequence[Message[Any]]) -> list[Any]:
+        """Queue several messages, in the order given, and wait for all of them.
+
+        Returns:
+            One entry per message, in the order given, as returned by
+            ``InMemoryMessageBus.dispatch_many``.
+
+        Raises:
+            HandlerNotFoundError: If a non-event message has no handler. Raised
+                before any message is queued.
+            DispatchFailedError: If the handlers of commands or queries failed,
+                once every message was handled, with the results of all of them.
+        """
+        if _lane_owner.get() is self:
+            return await self._bus.dispatch_many(messages)
+        self._bus.check_handled(messages)
+        parts: dict[int, list[int]] = {}
+        for index, message in enumerate(messages):
+            parts.setdefault(self.partition(message), []).append(index)
+        handled = [
+            self._submit(lane, partial(self._bus.dispatch_many, [messages[i] for i in indexes]))
+            for lane, indexes in parts.items()
+        ]
+        outcomes = await asyncio.gather(*handled, return_exceptions=True)
+        return merge_results(len(messages), zip(parts.values(), outcomes, strict=True))
+
+    async def aclose(self) -> None:
+        """Stop the lanes once their queued messages are handled."""
+        for queue in self._queues:
+            queue.put_nowait(None)
+        workers, self._workers, self._queues = self._workers, [], []
+        await asyncio.gather(*workers)
+
+    def partition(self, message: Message[Any]) -> int:
+        """Return the index of the lane handling ``message``."""
+        return hash(self._key(message)) % self._lane_count
+
+    def _submit(self, lane: int, handle: Callable[[], Awaitable[Any]]) -> asyncio.Future[Any]:
+        """Queue ``handle`` on a lane, returning the future of its result."""
+        self._start()
+        future: asyncio.Future[Any] = asyncio.get_running_loop().create_future()
+        self._queues[lane].put_nowait((handle, future))
+        return future
+
+    def _start(self) -> None:
+        """Create the lanes unless they are running."""
+        if self._workers:
+            return
+        self._queues = [asyncio.Queue() for _ in range(self._lane_count)]
+        # Lanes outlive the dispatch that starts them, so they must not inherit its
+        # message context.
+        self._workers = [
+            asyncio.create_task(self._run_lane(queue), context=contextvars.Context())
+            for queue in self._queues
+        ]
+
+    async def _run_lane(self, queue: asyncio.Queue[_LaneItem | None]) -> None:
+        """Handle the messages of one lane, one at a time."""
+        _lane_owner.set(self)
+        while (item := await queue.get()) is not None:
+            handle, future = item
+            if future.cancelled():
+                continue
+            try:
+                result = await handle()
+            except Exception as error:
+                if not future.done():
+                    future.set_exception(error)
+            else:
+                if not future.done():
+                    future.set_result(result)
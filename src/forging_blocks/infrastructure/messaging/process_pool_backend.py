@@ -0,0 +1,185 @@
+"""Run CPU-bound message handlers in a pool of worker processes."""
+
+from __future__ import annotations
+
+import asyncio
+import os
+from collections.abc import Callable, Sequence
+from concurrent.futures import Future, ProcessPoolExecutor
+from multiprocessing.context import BaseContext
+from types import TracebackType
+from typing import Any, Protocol, cast
+
+from forging_blocks.application.ports.inbound.message_handler import MessageHandler
+from forging_blocks.domain.messages.message import Message
+from forging_blocks.domain.messages.message_context import handling
+
+HandlerFactory = Callable[[], MessageHandler[Any, Any]]
+"""Creates a handler inside a worker process.
+
+Factories are sent to the workers by pickle, so they must be importable: a
+handler class or a module-level function.
+"""
+
+
+class MessageCodec(Protocol):
+    """Turns messages into bytes and back, such as ``BinaryMessageCodec``."""
+
+    def encode(self, message: Message[Any]) -> bytes:
+        """Encode a message."""
+        ...
+
+    def decode(self, data: bytes) -> Message[Any]:
+        """Decode a message."""
+        ...
+
+
+class ProcessPoolBackend:
+    """Pool of worker processes running message handlers off the event loop.
+
+    Handlers are declared with ``handler``, which returns a proxy to register on a
+    bus; its ``handle`` ships the message to a worker and awaits the result there.
+    Every worker is spawned on start, and imports and creates the handlers declared
+    so far and sets up the event loop that runs them; entering the backend as an
+    async context manager waits until they are ready, so the first message does
+    not pay for either. Handlers declared later are created on first use.
+
+    Messages travel by pickle, or as the bytes of ``codec`` when one is given, which
+    must then be picklable itself and know every shipped message type. Results and
+    exceptions come back by pickle.
+
+    Example:
+        >>> async with ProcessPoolBackend(max_workers=32) as backend:
+        ...     await bus.register_handler(
+        ...         backend.handler(RenderInvoicePdf), message_type=InvoiceIssued
+        ...     )
+    """
+
+    def __init__(
+        self,
+        max_workers: int | None = None,
+        codec: MessageCodec | None = None,
+        mp_context: BaseContext | None = None,
+    ) -> None:
+        """Create a backend.
+
+        Args:
+            max_workers: The number of worker processes. Defaults to the number of
+                CPUs, as ``ProcessPoolExecutor`` does.
+            codec: Encodes messages sent to the workers. Defaults to pickle.
+            mp_context: The multiprocessing context starting the workers.
+        """
+        self._max_workers = max_workers
+        self._codec = codec
+        self._mp_context = mp_context
+        self._factories: list[HandlerFactory] = []
+        self._executor: ProcessPoolExecutor | None = None
+        self._warming: list[Future[None]] = []
+
+    async def __aenter__(self) -> ProcessPoolBackend:
+        """Start the worker processes and wait until they are warmed."""
+        self.start()
+        warming, self._warming = self._warming, []
+        await asyncio.gather(*(asyncio.wrap_future(future) for future in warming))
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        """Stop the worker processes once their messages are handled."""
+        await asyncio.to_thread(self.shutdown)
+
+    def handler(self, factory: HandlerFactory) -> ProcessPoolHandler:
+        """Declare a handler run by the workers, returning its proxy.
+
+        The proxy's message type cannot be inferred, so pass ``message_type`` when
+        registering it on a bus.
+        """
+        if factory not in self._factories:
+            self._factories.append(factory)
+        return ProcessPoolHandler(self, factory)
+
+    def start(self) -> None:
+        """Spawn the worker processes, warmed with the handlers declared so far."""
+        if self._executor is not None:
+            return
+        workers = self._max_workers or os.cpu_count() or 1
+        self._executor = ProcessPoolExecutor(
+            workers,
+            self._mp_context,
+            initializer=_warm_up,
+            initargs=(tuple(self._factories), self._codec),
+        )
+        # The executor only spawns a worker when a job finds none idle, so one
+        # job per worker spawns them all now.
+        self._warming = [self._executor.submit(_ready) for _ in range(workers)]
+
+    def shutdown(self, wait: bool = True) -> None:
+        """Stop the worker processes.
+
+        Args:
+            wait: Whether to block until the submitted messages are handled.
+        """
+        executor, self._executor = self._executor, None
+        self._warming = []
+        if executor is not None:
+            executor.shutdown(wait)
+
+    async def submit(self, factory: HandlerFactory, message: Message[Any]) -> Any:
+        """Handle ``message`` in a worker with the handler built by ``factory``.
+
+        Returns:
+            What the handler returns.
+        """
+        self.start()
+        shipped = message if self._codec is None else self._codec.encode(message)
+        return await asyncio.get_running_loop().run_in_executor(
+            self._executor, _handle_in_worker, factory, shipped
+        )
+
+
+class ProcessPoolHandler:
+    """Proxy handler forwarding its messages to a ``ProcessPoolBackend``."""
+
+    def __init__(self, backend: ProcessPoolBackend, factory: HandlerFactory) -> None:
+        self._backend = backend
+        self._factory = factory
+
+    async def handle(self, message: Any) -> Any:
+        """Handle ``message`` in a worker process."""
+        return await self._backend.submit(self._factory, message)
+
+
+_worker_handlers: dict[HandlerFactory, MessageHandler[Any, Any]] = {}
+_worker_codec: MessageCodec | None = None
+_worker_loop: asyncio.AbstractEventLoop | None = None
+
+
+def _warm_up(factories: Sequence[HandlerFactory], codec: MessageCodec | None) -> None:
+    """Prepare a worker process: create its handlers and its event loop."""
+    global _worker_codec, _worker_loop
+    _worker_codec = codec
+    _worker_loop = asyncio.new_event_loop()
+    for factory in factories:
+        _worker_handlers[factory] = factory()
+
+
+def _ready() -> None:
+    """Do nothing, in a worker that has run ``_warm_up``."""
+
+
+def _handle_in_worker(factory: HandlerFactory, shipped: Message[Any] | bytes) -> Any:
+    """Handle a shipped message in a worker process."""
+    handler = _worker_handlers.get(factory)
+    if handler is None:
+        handler = _worker_handlers[factory] = factory()
+    if _worker_codec is None:
+        message = cast("Message[Any]", shipped)
+    else:
+        message = _worker_codec.decode(cast(bytes, shipped))
+    loop = cast(asyncio.AbstractEventLoop, _worker_loop)
+    with handling(message):
+        return loop.run_until_complete(handler.handle(message))
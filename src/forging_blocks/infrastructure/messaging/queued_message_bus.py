@@ -0,0 +1,463 @@
+"""Message bus queueing messages for a pool of worker tasks."""
+
+from __future__ import annotations
+
+import asyncio
+import contextvars
+from collections.abc import Callable, Collection, Hashable, Sequence
+from dataclasses import dataclass
+from enum import Enum
+from types import TracebackType
+from typing import Any
+from uuid import UUID
+
+from forging_blocks.application.ports.inbound.message_handler import MessageHandler
+from forging_blocks.domain.messages.event import Event
+from forging_blocks.domain.messages.message import Message
+from forging_blocks.infrastructure.messaging.errors import (
+    DispatchFailedError,
+    MessageDroppedError,
+    QueueFullError,
+)
+from forging_blocks.infrastructure.messaging.handler_registry import HandledType
+from forging_blocks.infrastructure.messaging.in_memory_message_bus import (
+    InMemoryMessageBus,
+    merge_results,
+)
+from forging_blocks.infrastructure.messaging.partitioned_message_bus import aggregate_key
+from forging_blocks.infrastructure.messaging.priority_lanes import PriorityLanes
+
+
+class DispatchMode(Enum):
+    """What ``QueuedMessageBus.dispatch`` waits for."""
+
+    FIRE_AND_FORGET = "fire_and_forget"
+    """Return once the message is queued."""
+    AWAIT_COMPLETION = "await_completion"
+    """Return the result of the message once it is handled."""
+
+
+class OverflowPolicy(Enum):
+    """What happens to a message dispatched while the queue is saturated."""
+
+    BLOCK = "block"
+    """Wait until the queue drains to its low watermark."""
+    DROP_OLDEST = "drop_oldest"
+    """Drop the oldest message of the lowest-priority lane to make room."""
+    REJECT = "reject"
+    """Raise ``QueueFullError``."""
+
+
+ErrorCallback = Callable[[Message[Any], Exception], None]
+"""Receives the failures of messages nobody awaits."""
+
+CoalescingKey = Callable[[Message[Any]], Hashable | None]
+"""Returns the aggregate whose events supersede each other, or None."""
+
+
+@dataclass(frozen=True, slots=True)
+class Superseded:
+    """Outcome of a queued event replaced by a newer one before being handled.
+
+    Attributes:
+        message_id: The id of the superseded event.
+        superseded_by: The id of the event delivered instead.
+    """
+
+    message_id: UUID
+    superseded_by: UUID
+
+
+@dataclass(slots=True)
+class _Item:
+    message: Message[Any]
+    future: asyncio.Future[Any] | None
+    key: Hashable | None = None
+    batch: Sequence[Message[Any]] | None = None
+    """The messages dispatched together, starting with ``message``, if any."""
+
+    @property
+    def size(self) -> int:
+        """The number of messages the item stands for."""
+        return 1 if self.batch is None else len(self.batch)
+
+
+class QueuedMessageBus:
+    """Message bus decoupling callers from handlers with a bounded queue.
+
+    ``dispatch`` puts the message on a queue drained by ``workers`` tasks, which
+    hand it to an ``InMemoryMessageBus``. In ``FIRE_AND_FORGET`` mode the caller
+    returns as soon as the message is queued; in ``AWAIT_COMPLETION`` mode it
+    receives the handler result, as with a direct dispatch.
+
+    The queue becomes saturated when it holds ``high_watermark`` messages and
+    stays so until it drains to ``low_watermark``, so that producers blocked by
+    the ``BLOCK`` policy resume in bursts rather than one message at a time.
+    While saturated, the ``overflow`` policy decides what happens to new messages.
+
+    Queued messages are handled in FIFO order, unless ``lanes`` splits them into
+    priority lanes, such as ``PriorityLanes()`` serving queries before commands
+    and commands before events, with weighted fair scheduling between them.
+
+    ``dispatch_many`` queues the messages of each priority lane together, and a
+    worker hands them to ``InMemoryMessageBus.dispatch_many`` in one call, so
+    batch handlers receive them in batches.
+
+    Events of the ``coalesce`` classes are last-writer-wins: when one is queued
+    while an event of the same class and aggregate is still waiting, only the
+    newer one is delivered, in the place of the older one, so that a busy
+    aggregate does not keep moving to the back of the queue, and the older one is
+    acknowledged with a ``Superseded`` result.
+
+    Failures of messages nobody awaits go to ``on_error``, which defaults to the
+    event loop's exception handler.
+
+    Example:
+        >>> async with QueuedMessageBus(workers=8, high_watermark=1000) as bus:
+        ...     await bus.register_handler(SendWelcomeEmail())
+        ...     await bus.dispatch(UserRegistered(user_id="u-1"))
+    """
+
+    def __init__(
+        self,
+        bus: InMemoryMessageBus | None = None,
+        workers: int = 4,
+        high_watermark: int = 1024,
+        low_watermark: int | None = None,
+        overflow: OverflowPolicy = OverflowPolicy.BLOCK,
+        mode: DispatchMode = DispatchMode.FIRE_AND_FORGET,
+        on_error: ErrorCallback | None = None,
+        lanes: PriorityLanes[Any] | None = None,
+        coalesce: Collection[type[Event[Any]]] = (),
+        coalesce_key: CoalescingKey = aggregate_key,
+    ) -> None:
+        """Create a bus.
+
+        Args:
+            bus: The bus handling queued messages. Defaults to a new
+                ``InMemoryMessageBus``.
+            workers: The number of worker tasks draining the queue.
+            high_watermark: The queue depth at which the queue becomes saturated.
+            low_watermark: The queue depth at which it stops being saturated.
+                Defaults to ``high_watermark``.
+            overflow: What to do with messages dispatched while saturated.
+            mode: What ``dispatch`` and ``dispatch_many`` wait for.
+            on_error: Receives the failures of fire-and-forget messages.
+            lanes: Empty lanes ordering the queued messages. Defaults to a single
+                FIFO lane.
+            coalesce: The last-writer-wins event classes.
+            coalesce_key: Returns the aggregate of an event to coalesce. Defaults
+                to its ``aggregate_id``; events without one are never coalesced.
+        """
+        low_watermark = high_watermark if low_watermark is None else low_watermark
+        if workers < 1:
+            raise ValueError("workers must be at least 1")
+        if not 0 <= low_watermark <= high_watermark or high_watermark < 1:
+            raise ValueError("watermarks must satisfy 0 <= low_watermark <= high_watermark")
+        self._bus = bus or InMemoryMessageBus()
+        self._worker_count = workers
+        self._high_watermark = high_watermark
+        self._low_watermark = low_watermark
+        self._overflow = overflow
+        self._mode = mode
+        self._on_error = on_error
+        self._queue: PriorityLanes[_Item] = (
+            lanes if lanes is not None else PriorityLanes({Message: 1})  # type: ignore[type-abstract]
+        )
+        self._coalesce = tuple(coalesce)
+        self._coalesce_key = coalesce_key
+        self._latest: dict[Hashable, _Item] = {}
+        self._depth = 0
+        self._superseded = 0
+        self._unfinished = 0
+        self._saturated = False
+        self._closing = False
+        self._changed: asyncio.Condition | None = None
+        self._workers: list[asyncio.Task[None]] = []
+
+    @property
+    def depth(self) -> int:
+        """The number of queued messages not yet picked up by a worker."""
+        return self._depth
+
+    @property
+    def superseded(self) -> int:
+        """The number of events acknowledged as superseded so far."""
+        return self._superseded
+
+    @property
+    def saturated(self) -> bool:
+        """Whether the queue has reached its high watermark and not yet drained."""
+        return self._saturated
+
+    async def __aenter__(self) -> QueuedMessageBus:
+        """Start the workers."""
+        self._start()
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        """Stop the workers once the queue is drained."""
+        await self.aclose()
+
+    async def register_handler(
+        self,
+        handler: MessageHandler[Any, Any],
+        message_type: HandledType | None = None,
+    ) -> None:
+        """Register a handler on the underlying bus."""
+        await self._bus.register_handler(handler, message_type)
+
+    async def dispatch(self, message: Message[Any], low_priority: bool = False) -> Any:
+        """Queue a message.
+
+        Args:
+            message: The message to queue.
+            low_priority: Whether to queue it in the lowest-priority lane rather
+                than in the lane of its class.
+
+        Returns:
+            None in ``FIRE_AND_FORGET`` mode, otherwise what
+            ``InMemoryMessageBus.dispatch`` returns for the message.
+
+        Raises:
+            QueueFullError: If the queue is saturated and the policy is ``REJECT``.
+            MessageDroppedError: If the message is awaited but dropped to make room
+                for a newer one.
+        """
+        future = await self._put(message, low_priority)
+        return None if future is None else await future
+
+    async def dispatch_many(
+        self, messages: Sequence[Message[Any]], low_priority: bool = False
+    ) -> list[Any]:
+        """Queue several messages, in the order given.
+
+        The messages of each lane are queued as one item, handled by a single
+        ``InMemoryMessageBus.dispatch_many`` call, except for the events to
+        coalesce, which are queued one by one.
+
+        Args:
+            messages: The messages to queue.
+            low_priority: Whether to queue them in the lowest-priority lane rather
+                than in the lanes of their classes.
+
+        Returns:
+            None for every message in ``FIRE_AND_FORGET`` mode, otherwise one entry
+            per message, in the order given, as returned by
+            ``InMemoryMessageBus.dispatch_many``.
+
+        Raises:
+            QueueFullError: If the queue is saturated and the policy is ``REJECT``.
+            HandlerNotFoundError: If a non-event message has no handler, in
+                ``AWAIT_COMPLETION`` mode. Raised before any message is queued.
+            DispatchFailedError: If the handlers of commands or queries failed, in
+                ``AWAIT_COMPLETION`` mode, once every message was handled. Messages
+                dropped to make room fail with ``MessageDroppedError``.
+        """
+        awaited = self._mode is DispatchMode.AWAIT_COMPLETION
+        if awaited:
+            self._bus.check_handled(messages)
+        parts: list[list[int]] = []
+        lanes: dict[type[Message[Any]] | None, list[int]] = {}
+        for index, message in enumerate(messages):
+            if self._coalescing_key(message) is not None:
+                parts.append([index])
+                continue
+            lane = None if low_priority else self._queue.lane_of(message)
+            part = lanes.get(lane)
+            if part is None:
+                part = lanes[lane] = []
+                parts.append(part)
+            part.append(index)
+        futures = [
+            await self._put(messages[part[0]], low_priority, [messages[i] for i in part])
+            for part in parts
+        ]
+        if not awaited:
+            return [None] * len(messages)
+        handled = [future for future in futures if future is not None]
+        outcomes = await asyncio.gather(*handled, return_exceptions=True)
+        return merge_results(len(messages), zip(parts, outcomes, strict=True))
+
+    async def join(self) -> None:
+        """Wait until every queued message has been handled."""
+        changed = self._condition()
+        async with changed:
+            await changed.wait_for(lambda: self._unfinished == 0)
+
+    async def aclose(self) -> None:
+        """Stop the workers once the queue is drained."""
+        await self.join()
+        self._closing = True
+        changed = self._condition()
+        async with changed:
+            changed.notify_all()
+        workers, self._workers = self._workers, []
+        await asyncio.gather(*workers)
+        self._closing = False
+
+    async def _put(
+        self,
+        message: Message[Any],
+        low_priority: bool = False,
+        batch: Sequence[Message[Any]] | None = None,
+    ) -> asyncio.Future[Any] | None:
+        """Queue ``message``, or the ``batch`` it starts, under the overflow policy.
+
+        Returns:
+            The future of the result, if awaited.
+        """
+        self._start()
+        changed = self._condition()
+        async with changed:
+            if self._saturated:
+                if self._overflow is OverflowPolicy.REJECT:
+                    raise QueueFullError.for_message(message, self.depth)
+                if self._overflow is OverflowPolicy.BLOCK:
+                    await changed.wait_for(lambda: not self._saturated)
+                elif self.depth:
+                    self._drop(self._evict())
+            future = None
+            if self._mode is DispatchMode.AWAIT_COMPLETION:
+                future = asyncio.get_running_loop().create_future()
+            key = self._coalescing_key(message)
+            previous = None if key is None else self._latest.get(key)
+            if previous is not None:
+                self._supersede(previous, message, future, batch)
+                return future
+            item = _Item(message, future, key, batch=batch)
+            if key is not None:
+                self._latest[key] = item
+            self._queue.append(message, item, lowest=low_priority)
+            self._depth += item.size
+            self._unfinished += 1
+            if self.depth >= self._high_watermark:
+                self._saturated = True
+            changed.notify_all()
+            return future
+
+    def _coalescing_key(self, message: Message[Any]) -> tuple[type[Message[Any]], Hashable] | None:
+        """Return the key under which ``message`` supersedes older events, if any."""
+        if not self._coalesce or not isinstance(message, self._coalesce):
+            return None
+        key = self._coalesce_key(message)
+        return None if key is None else (type(message), key)
+
+    def _supersede(
+        self,
+        item: _Item,
+        by: Message[Any],
+        future: asyncio.Future[Any] | None,
+        batch: Sequence[Message[Any]] | None,
+    ) -> None:
+        """Put ``by`` in the place of a queued item, acknowledging the event it replaces."""
+        if item.future is not None and not item.future.done():
+            superseded = Superseded(item.message.message_id, by.message_id)
+            item.future.set_result(superseded if item.batch is None else [superseded])
+        item.message, item.future, item.batch = by, future, batch
+        self._superseded += 1
+
+    def _remove(self) -> _Item:
+        """Pop the next item."""
+        item = self._queue.pop()
+        self._forget(item)
+        return item
+
+    def _evict(self) -> _Item:
+        """Evict the oldest item of the lowest-priority lane."""
+        item = self._queue.evict()
+        self._forget(item)
+        return item
+
+    def _forget(self, item: _Item) -> None:
+        """Account for ``item`` leaving the queue, and stop coalescing newer events into it."""
+        self._depth -= item.size
+        if item.key is not None and self._latest.get(item.key) is item:
+            del self._latest[item.key]
+
+    def _drop(self, item: _Item) -> None:
+        """Discard a queued item, failing its future."""
+        self._unfinished -= 1
+        if item.future is not None and not item.future.done():
+            item.future.set_exception(MessageDroppedError.for_message(item.message))
+
+    async def _take(self) -> _Item | None:
+        """Wait for the next item, or None once the bus is closing and drained."""
+        changed = self._condition()
+        async with changed:
+            await changed.wait_for(lambda: self.depth > 0 or self._closing)
+            if not self.depth:
+                return None
+            item = self._remove()
+            if self._saturated and self.depth <= self._low_watermark:
+                self._saturated = False
+                changed.notify_all()
+            return item
+
+    async def _finish(self) -> None:
+        """Record that a taken item has been handled."""
+        changed = self._condition()
+        async with changed:
+            self._unfinished -= 1
+            if self._unfinished == 0:
+                changed.notify_all()
+
+    async def _run_worker(self) -> None:
+        """Handle queued messages until the bus is closed."""
+        while (item := await self._take()) is not None:
+            try:
+                if item.batch is None:
+                    result = await self._bus.dispatch(item.message)
+                else:
+                    result = await self._bus.dispatch_many(item.batch)
+            except Exception as error:
+                self._fail(item, error)
+            else:
+                if item.future is not None and not item.future.done():
+                    item.future.set_result(result)
+            await self._finish()
+
+    def _fail(self, item: _Item, error: Exception) -> None:
+        """Pass the failure of ``item`` to its caller, or to ``on_error`` if not awaited."""
+        if item.future is not None:
+            if not item.future.done():
+                item.future.set_exception(error)
+        elif item.batch is not None and isinstance(error, DispatchFailedError):
+            for index, failure in zip(error.failed, error, strict=True):
+                self._report(item.batch[index], failure)
+        else:
+            self._report(item.message, error)
+
+    def _report(self, message: Message[Any], error: Exception) -> None:
+        """Pass the failure of a fire-and-forget message to ``on_error``."""
+        if self._on_error is not None:
+            self._on_error(message, error)
+            return
+        asyncio.get_running_loop().call_exception_handler(
+            {
+                "message": f"Unhandled failure of queued message '{message.metadata.message_type}'",
+                "exception": error,
+            }
+        )
+
+    def _condition(self) -> asyncio.Condition:
+        """Return the condition guarding the queue, creating it in the running loop."""
+        if self._changed is None:
+            self._changed = asyncio.Condition()
+        return self._changed
+
+    def _start(self) -> None:
+        """Create the workers unless they are running."""
+        if self._workers:
+            return
+        # Workers outlive the dispatch that starts them, so they must not inherit its
+        # message context.
+        self._workers = [
+            asyncio.create_task(self._run_worker(), context=contextvars.Context())
+            for _ in range(self._worker_count)
+        ]
@@ -0,0 +1,334 @@
+"""Token-bucket rate limits applied to messages before they reach a bus."""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Hashable, Mapping, Sequence
+from dataclasses import dataclass
+from enum import Enum
+from typing import Any, cast
+
+from forging_blocks.application.ports.inbound.message_handler import MessageHandler
+from forging_blocks.domain.messages.message import Message
+from forging_blocks.foundation.result import Err
+from forging_blocks.infrastructure.messaging.errors import RateLimitExceededError
+from forging_blocks.infrastructure.messaging.handler_registry import DispatchKey, HandledType
+from forging_blocks.infrastructure.messaging.in_memory_message_bus import InMemoryMessageBus
+from forging_blocks.infrastructure.messaging.partitioned_message_bus import PartitionedMessageBus
+from forging_blocks.infrastructure.messaging.queued_message_bus import QueuedMessageBus
+
+TenantKey = Callable[[Message[Any]], Hashable | None]
+"""Returns the tenant of a message, or None when it belongs to none."""
+
+_Bucket = tuple[str, "TokenBucket"]
+_Admission = float | None | Err[Any, RateLimitExceededError]
+
+
+def tenant_key(message: Message[Any]) -> Hashable | None:
+    """Return the ``tenant_id`` attribute of a message, or None when it has none."""
+    return getattr(message, "tenant_id", None)
+
+
+class TokenBucket:
+    """Tokens refilled continuously at ``rate`` per second, holding at most ``burst``.
+
+    A full bucket lets ``burst`` messages through at once, then one every
+    ``1 / rate`` seconds. ``reserve`` may take tokens the bucket does not hold yet,
+    so callers waiting for them are served in the order they reserved.
+    """
+
+    def __init__(
+        self, rate: float, burst: int, clock: Callable[[], float] = time.monotonic
+    ) -> None:
+        """Create a full bucket.
+
+        Args:
+            rate: The number of tokens added per second.
+            burst: The capacity of the bucket.
+            clock: Returns a monotonic time in seconds.
+        """
+        if rate <= 0 or burst < 1:
+            raise ValueError("rate must be positive and burst at least 1")
+        self._rate = rate
+        self._burst = burst
+        self._clock = clock
+        self._tokens = float(burst)
+        self._updated = clock()
+
+    @property
+    def tokens(self) -> float:
+        """The tokens available, negative while reservations wait for tokens."""
+        self._refill()
+        return self._tokens
+
+    def wait_time(self) -> float:
+        """Return how long, in seconds, until a token is available."""
+        return max(0.0, (1 - self.tokens) / self._rate)
+
+    def reserve(self) -> float:
+        """Take a token, returning how long, in seconds, to wait before using it."""
+        self._refill()
+        self._tokens -= 1
+        return max(0.0, -self._tokens / self._rate)
+
+    def _refill(self) -> None:
+        now = self._clock()
+        self._tokens = min(self._burst, self._tokens + (now - self._updated) * self._rate)
+        self._updated = now
+
+
+@dataclass(frozen=True, slots=True)
+class RateLimit:
+    """The parameters of a token bucket.
+
+    Attributes:
+        rate: The sustained number of messages per second.
+        burst: How many messages may go through at once after a quiet period.
+    """
+
+    rate: float
+    burst: int
+
+
+class ThrottlePolicy(Enum):
+    """What ``RateLimitedMessageBus`` does with a message over its rate limit."""
+
+    DELAY = "delay"
+    """Wait for a token, then dispatch the message."""
+
+    SHED = "shed"
+    """Return an ``Err`` with a ``RateLimitExceededError`` instead of dispatching."""
+
+    DOWNGRADE = "downgrade"
+    """Queue the message in the lowest-priority lane of a ``QueuedMessageBus``."""
+
+
+@dataclass(slots=True)
+class ThrottleStats:
+    """Counters of the messages of one type dispatched through ``RateLimitedMessageBus``.
+
+    Attributes:
+        admitted: The number of messages dispatched without waiting.
+        delayed: The number of messages dispatched after waiting for a token.
+        shed: The number of messages not dispatched.
+        downgraded: The number of messages queued at the lowest priority.
+        delay_seconds: The total time delayed messages waited.
+    """
+
+    admitted: int = 0
+    delayed: int = 0
+    shed: int = 0
+    downgraded: int = 0
+    delay_seconds: float = 0.0
+
+
+class RateLimitedMessageBus:
+    """Message bus applying token-bucket rate limits before dispatching to another bus.
+
+    Each message takes a token from the bucket of its type, found like handlers
+    are, by ``message_type`` string or by the most specific class of its MRO in
+    ``limits``, and from the bucket of its tenant when ``tenant_limit`` is set;
+    every tenant gets a bucket of its own. A message short of a token is handled
+    according to ``policy``. With ``DELAY``, messages that would wait longer than
+    ``max_delay`` are shed instead, so a bulk import slows down to the agreed
+    rate while interactive traffic is refused rather than queued for minutes.
+
+    The buckets of the ``max_tenants`` most recently seen tenants are kept; a
+    tenant seen again after its bucket was dropped starts with a full bucket.
+
+    Example:
+        >>> bus = RateLimitedMessageBus(
+        ...     QueuedMessageBus(lanes=PriorityLanes()),
+        ...     limits={ProductImported: RateLimit(rate=200, burst=50)},
+        ...     tenant_limit=RateLimit(rate=20, burst=20),
+        ...     policy=ThrottlePolicy.DOWNGRADE,
+        ... )
+    """
+
+    def __init__(
+        self,
+        bus: InMemoryMessageBus | PartitionedMessageBus | QueuedMessageBus | None = None,
+        limits: Mapping[HandledType, RateLimit] | None = None,
+        tenant_limit: RateLimit | None = None,
+        tenant: TenantKey = tenant_key,
+        policy: ThrottlePolicy = ThrottlePolicy.DELAY,
+        max_delay: float | None = None,
+        clock: Callable[[], float] = time.monotonic,
+        max_tenants: int = 10_000,
+    ) -> None:
+        """Create a bus.
+
+        Args:
+            bus: The bus dispatching admitted messages. Defaults to a new
+                ``InMemoryMessageBus``; must be a ``QueuedMessageBus`` with the
+                ``DOWNGRADE`` policy.
+            limits: The rate limit of each message class or ``message_type``.
+            tenant_limit: The rate limit of each tenant. None limits no tenant.
+            tenant: Returns the tenant of a message. Defaults to its ``tenant_id``.
+            policy: What to do with messages over a limit.
+            max_delay: With ``DELAY``, the longest wait, in seconds, before a
+                message is shed instead. None waits as long as needed.
+            clock: Returns a monotonic time in seconds.
+            max_tenants: How many tenant buckets to keep.
+        """
+        if policy is ThrottlePolicy.DOWNGRADE and not isinstance(bus, QueuedMessageBus):
+            raise ValueError("the DOWNGRADE policy needs a QueuedMessageBus")
+        self._bus = bus if bus is not None else InMemoryMessageBus()
+        self._limits = {
+            key: (_name(key), TokenBucket(limit.rate, limit.burst, clock))
+            for key, limit in (limits or {}).items()
+        }
+        self._bucket_of: dict[DispatchKey, _Bucket | None] = {}
+        self._tenant_limit = tenant_limit
+        self._tenant = tenant
+        self._tenant_buckets: OrderedDict[Hashable, _Bucket] = OrderedDict()
+        self._max_tenants = max_tenants
+        self._policy = policy
+        self._max_delay = max_delay
+        self._clock = clock
+        self._stats: dict[str, ThrottleStats] = {}
+
+    def stats(self) -> dict[str, ThrottleStats]:
+        """Return the counters collected so far, keyed by message type."""
+        return dict(self._stats)
+
+    async def register_handler(
+        self,
+        handler: MessageHandler[Any, Any],
+        message_type: HandledType | None = None,
+    ) -> None:
+        """Register a handler on the underlying bus."""
+        await self._bus.register_handler(handler, message_type)
+
+    async def dispatch(self, message: Message[Any]) -> Any:
+        """Dispatch a message once its rate limits allow it.
+
+        Returns:
+            What the underlying bus returns for the message, or an ``Err`` with a
+            ``RateLimitExceededError`` when the message is shed.
+        """
+        admission = self._admit(message)
+        if isinstance(admission, Err):
+            return admission
+        if admission is None:
+            return await self._downgrade(message)
+        if admission:
+            await asyncio.sleep(admission)
+        return await self._bus.dispatch(message)
+
+    async def dispatch_many(self, messages: Sequence[Message[Any]]) -> list[Any]:
+        """Dispatch several messages, waiting once for the longest delay among them.
+
+        The admitted messages go to the underlying bus in a single
+        ``dispatch_many`` call, in the order given, and the downgraded ones in
+        another call made concurrently.
+
+        Returns:
+            One entry per message, in the order given, as returned by ``dispatch``.
+        """
+        results: list[Any] = [None] * len(messages)
+        admitted: list[int] = []
+        downgraded: list[int] = []
+        delay = 0.0
+        for index, message in enumerate(messages):
+            admission = self._admit(message)
+            if isinstance(admission, Err):
+                results[index] = admission
+            elif admission is None:
+                downgraded.append(index)
+            else:
+                admitted.append(index)
+                delay = max(delay, admission)
+        if delay:
+            await asyncio.sleep(delay)
+        calls = []
+        if admitted:
+            calls.append(self._bus.dispatch_many([messages[index] for index in admitted]))
+        if downgraded:
+            queued = cast(QueuedMessageBus, self._bus)  # Checked by __init__.
+            lowered = [messages[index] for index in downgraded]
+            calls.append(queued.dispatch_many(lowered, low_priority=True))
+        indexes = [group for group in (admitted, downgraded) if group]
+        for group, handled in zip(indexes, await asyncio.gather(*calls), strict=True):
+            for index, result in zip(group, handled, strict=True):
+                results[index] = result
+        return results
+
+    def _admit(self, message: Message[Any]) -> _Admission:
+        """Apply the policy to ``message``.
+
+        Returns:
+            The delay, in seconds, before dispatching the message, None to
+            downgrade it, or the ``Err`` to return when it is shed.
+        """
+        stats = self._stats.get(message.metadata.message_type) or self._stats.setdefault(
+            message.metadata.message_type, ThrottleStats()
+        )
+        buckets = self._buckets(message)
+        name, wait = max(
+            ((name, bucket.wait_time()) for name, bucket in buckets),
+            key=lambda each: each[1],
+            default=("", 0.0),
+        )
+        if not wait:
+            for _, bucket in buckets:
+                bucket.reserve()
+            stats.admitted += 1
+            return 0.0
+        if self._policy is ThrottlePolicy.DOWNGRADE:
+            stats.downgraded += 1
+            return None
+        if self._policy is ThrottlePolicy.SHED or (
+            self._max_delay is not None and wait > self._max_delay
+        ):
+            stats.shed += 1
+            return Err(RateLimitExceededError.for_message(message, name, wait))
+        delay = max(bucket.reserve() for _, bucket in buckets)
+        stats.delayed += 1
+        stats.delay_seconds += delay
+        return delay
+
+    async def _downgrade(self, message: Message[Any]) -> Any:
+        """Queue ``message`` at the lowest priority of the underlying bus."""
+        queued = cast(QueuedMessageBus, self._bus)  # Checked by __init__.
+        return await queued.dispatch(message, low_priority=True)
+
+    def _buckets(self, message: Message[Any]) -> list[_Bucket]:
+        """Return the buckets ``message`` takes a token from."""
+        key = (type(message), message.metadata.message_type)
+        try:
+            by_type = self._bucket_of[key]
+        except KeyError:
+            by_type = self._bucket_of.setdefault(key, self._resolve(*key))
+        buckets = [] if by_type is None else [by_type]
+        if self._tenant_limit is not None:
+            tenant = self._tenant(message)
+            if tenant is not None:
+                buckets.append(self._tenant_bucket(tenant, self._tenant_limit))
+        return buckets
+
+    def _tenant_bucket(self, tenant: Hashable, limit: RateLimit) -> _Bucket:
+        """Return the bucket of ``tenant``, dropping the least recently used beyond the cap."""
+        bucket = self._tenant_buckets.get(tenant)
+        if bucket is not None:
+            self._tenant_buckets.move_to_end(tenant)
+            return bucket
+        bucket = (f"tenant:{tenant}", TokenBucket(limit.rate, limit.burst, self._clock))
+        self._tenant_buckets[tenant] = bucket
+        if len(self._tenant_buckets) > self._max_tenants:
+            self._tenant_buckets.popitem(last=False)
+        return bucket
+
+    def _resolve(self, message_class: type[Message[Any]], message_type: str) -> _Bucket | None:
+        """Find the bucket of a message class and name, by name first."""
+        if message_type in self._limits:
+            return self._limits[message_type]
+        return next(
+            (self._limits[cls] for cls in message_class.__mro__ if cls in self._limits), None
+        )
+
+
+def _name(key: HandledType) -> str:
+    return key if isinstance(key, str) else key.__qualname__
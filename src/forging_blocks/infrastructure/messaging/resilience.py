@@ -0,0 +1,388 @@
+"""Circuit breakers and adaptive concurrency limits guarding each handler."""
+
+from __future__ import annotations
+
+import time
+from collections import deque
+from collections.abc import Callable
+from dataclasses import dataclass
+from enum import Enum
+from typing import Any
+
+from forging_blocks.domain.messages.message import Message
+from forging_blocks.infrastructure.messaging.errors import CircuitOpenError, ConcurrencyLimitError
+from forging_blocks.infrastructure.messaging.middleware import MessageTypes, NextHandler
+
+
+class CircuitState(Enum):
+    """The states of a ``CircuitBreaker``."""
+
+    CLOSED = "closed"
+    """Calls go through while the breaker watches their outcomes."""
+
+    OPEN = "open"
+    """Calls are rejected until the open duration has passed."""
+
+    HALF_OPEN = "half_open"
+    """One probe call goes through to decide whether to close again."""
+
+
+class CallPermit:
+    """Returned by ``CircuitBreaker.allow`` for a call it lets through.
+
+    The permit is handed back to ``record`` or ``abandon`` when the call ends, so
+    the breaker can tell its half-open probe from calls started before it opened.
+
+    Attributes:
+        probe: Whether the call is the probe of a half-open circuit.
+    """
+
+    __slots__ = ("probe",)
+
+    def __init__(self, probe: bool) -> None:
+        self.probe = probe
+
+
+_CALL = CallPermit(probe=False)
+
+
+class CircuitBreaker:
+    """Reject calls while the recent ones mostly failed or were too slow.
+
+    The breaker counts the calls among the last ``window`` that failed or took at
+    least ``slow_call_duration``. Once at least ``minimum_calls`` were made and the
+    share of those bad calls reaches ``failure_rate``, it opens and rejects every
+    call for ``open_duration`` seconds. Then it lets a single probe through: the
+    circuit closes if the probe is good and opens again otherwise. Calls still
+    running from before the circuit opened only add their outcome to the window
+    when they end, whatever the state.
+
+    Args:
+        failure_rate: The share of bad calls that opens the circuit.
+        slow_call_duration: The duration, in seconds, from which a successful
+            call counts as bad. None ignores durations.
+        window: How many recent calls are considered.
+        minimum_calls: How many calls the window needs before the circuit opens.
+        open_duration: How long the circuit stays open, in seconds.
+        clock: Returns a monotonic time in seconds.
+    """
+
+    def __init__(
+        self,
+        failure_rate: float = 0.5,
+        slow_call_duration: float | None = None,
+        window: int = 20,
+        minimum_calls: int = 10,
+        open_duration: float = 30.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        if not 0 < failure_rate <= 1:
+            raise ValueError("failure_rate must be in (0, 1]")
+        if not 1 <= minimum_calls <= window:
+            raise ValueError("minimum_calls must be between 1 and window")
+        self._failure_rate = failure_rate
+        self._slow_call_duration = slow_call_duration
+        self._outcomes: deque[bool] = deque(maxlen=window)
+        self._bad = 0
+        self._minimum_calls = minimum_calls
+        self._open_duration = open_duration
+        self._clock = clock
+        self._state = CircuitState.CLOSED
+        self._opened_at = 0.0
+        self._probe: CallPermit | None = None
+
+    @property
+    def state(self) -> CircuitState:
+        """The current state, half-open once an open circuit has waited long enough."""
+        if self._state is CircuitState.OPEN and self.retry_in == 0:
+            self._state = CircuitState.HALF_OPEN
+        return self._state
+
+    @property
+    def retry_in(self) -> float:
+        """How long, in seconds, until an open circuit lets a probe through."""
+        if self._state is not CircuitState.OPEN:
+            return 0.0
+        return max(0.0, self._opened_at + self._open_duration - self._clock())
+
+    @property
+    def failure_rate(self) -> float:
+        """The share of bad calls in the window."""
+        return self._bad / len(self._outcomes) if self._outcomes else 0.0
+
+    def allow(self) -> CallPermit | None:
+        """Let a call through, reserving the probe when half-open.
+
+        Returns:
+            The permit to pass to ``record`` or ``abandon`` once the call ends,
+            or None when the call is rejected.
+        """
+        state = self.state
+        if state is CircuitState.CLOSED:
+            return _CALL
+        if state is CircuitState.HALF_OPEN and self._probe is None:
+            self._probe = CallPermit(probe=True)
+            return self._probe
+        return None
+
+    def record(self, duration: float, failed: bool, permit: CallPermit | None = None) -> None:
+        """Record the outcome of a call.
+
+        Args:
+            duration: How long the call took, in seconds.
+            failed: Whether the call raised.
+            permit: What ``allow`` returned for the call. Only the current probe
+                closes or reopens a half-open circuit.
+        """
+        slow = self._slow_call_duration is not None and duration >= self._slow_call_duration
+        bad = failed or slow
+        if permit is not None and permit is self._probe:
+            self._probe = None
+            if bad:
+                self._open()
+            else:
+                self._close()
+            return
+        if len(self._outcomes) == self._outcomes.maxlen:
+            self._bad -= self._outcomes[0]
+        self._outcomes.append(bad)
+        self._bad += bad
+        if (
+            self._state is CircuitState.CLOSED
+            and len(self._outcomes) >= self._minimum_calls
+            and self.failure_rate >= self._failure_rate
+        ):
+            self._open()
+
+    def abandon(self, permit: CallPermit) -> None:
+        """Forget a call that ``allow`` let through but that ended without an outcome."""
+        if permit is self._probe:
+            self._probe = None
+
+    def _open(self) -> None:
+        self._state = CircuitState.OPEN
+        self._opened_at = self._clock()
+
+    def _close(self) -> None:
+        self._state = CircuitState.CLOSED
+        self._outcomes.clear()
+        self._bad = 0
+
+
+class AdaptiveConcurrencyLimit:
+    """In-flight limit adjusted by additive increase and multiplicative decrease.
+
+    Every call finishing within ``latency_target`` raises the limit by
+    ``1 / limit``, so about one per ``limit`` good calls, and every call that
+    fails or runs late multiplies it by ``backoff``. The limit thus follows the
+    concurrency a downstream sustains at the target latency, and calls beyond it
+    are rejected instead of piling up.
+
+    Args:
+        initial: The starting limit.
+        minimum: The lowest limit.
+        maximum: The highest limit.
+        latency_target: The duration, in seconds, above which a call shrinks the limit.
+        backoff: The factor applied to the limit on a failed or late call.
+    """
+
+    def __init__(
+        self,
+        initial: int = 16,
+        minimum: int = 1,
+        maximum: int = 1000,
+        latency_target: float = 0.1,
+        backoff: float = 0.9,
+    ) -> None:
+        if not 1 <= minimum <= initial <= maximum:
+            raise ValueError("limits must satisfy 1 <= minimum <= initial <= maximum")
+        if not 0 < backoff < 1:
+            raise ValueError("backoff must be in (0, 1)")
+        self._limit = float(initial)
+        self._minimum = minimum
+        self._maximum = maximum
+        self._latency_target = latency_target
+        self._backoff = backoff
+        self._in_flight = 0
+
+    @property
+    def limit(self) -> int:
+        """The number of calls that may run at the same time."""
+        return int(self._limit)
+
+    @property
+    def in_flight(self) -> int:
+        """The number of calls running."""
+        return self._in_flight
+
+    def try_acquire(self) -> bool:
+        """Count a new call in flight, unless the limit is reached."""
+        if self._in_flight >= self.limit:
+            return False
+        self._in_flight += 1
+        return True
+
+    def release(self, duration: float | None, failed: bool = False) -> None:
+        """Count a call as finished and adapt the limit to its outcome.
+
+        Args:
+            duration: How long the call took, in seconds. None leaves the limit
+                unchanged, as for a cancelled call.
+            failed: Whether the call raised.
+        """
+        self._in_flight -= 1
+        if duration is None:
+            return
+        if failed or duration > self._latency_target:
+            self._limit = max(float(self._minimum), self._limit * self._backoff)
+        else:
+            self._limit = min(float(self._maximum), self._limit + 1 / self._limit)
+
+
+@dataclass(frozen=True, slots=True)
+class HandlerHealth:
+    """Snapshot of what a ``CircuitBreakerMiddleware`` observed of one handler.
+
+    Attributes:
+        handler: The class name of the handler.
+        state: The state of its circuit breaker.
+        calls: The number of calls that went through.
+        failed: The number of those calls that raised.
+        rejected: The number of calls rejected by the breaker or the limit.
+        mean_seconds: The mean duration of the calls that went through.
+        concurrency_limit: The current in-flight limit, if one is applied.
+    """
+
+    handler: str
+    state: CircuitState
+    calls: int
+    failed: int
+    rejected: int
+    mean_seconds: float
+    concurrency_limit: int | None
+
+
+class CircuitBreakerMiddleware:
+    """Give each handler a circuit breaker, and optionally an adaptive concurrency limit.
+
+    This is a ``PerHandlerMiddleware``: a bus composing a handler's pipeline gets
+    a middleware of its own for that handler, which tracks its error rate and
+    latency. Rejected calls raise ``CircuitOpenError`` or
+    ``ConcurrencyLimitError`` without calling the handler, so event handlers
+    fail fast with an ``Err`` result while a downstream is down or saturated.
+
+    Example:
+        >>> health = CircuitBreakerMiddleware(
+        ...     breaker=lambda: CircuitBreaker(slow_call_duration=2.0),
+        ...     limiter=lambda: AdaptiveConcurrencyLimit(latency_target=0.2),
+        ... )
+        >>> bus = InMemoryMessageBus(middlewares=[health])
+
+    Args:
+        breaker: Creates the breaker of each handler.
+        limiter: Creates the concurrency limit of each handler. None applies none.
+        message_types: The message classes to guard.
+        clock: Returns a monotonic time in seconds, used to time calls.
+    """
+
+    def __init__(
+        self,
+        breaker: Callable[[], CircuitBreaker] = CircuitBreaker,
+        limiter: Callable[[], AdaptiveConcurrencyLimit] | None = None,
+        message_types: MessageTypes = (Message,),
+        clock: Callable[[], float] = time.perf_counter,
+    ) -> None:
+        self._breaker = breaker
+        self._limiter = limiter
+        self.message_types = message_types
+        self._clock = clock
+        self._guards: dict[int, _HandlerGuard] = {}
+
+    def for_handler(self, handler: object) -> _HandlerGuard:
+        """Return the middleware guarding ``handler``."""
+        guard = self._guards.get(id(handler))
+        if guard is None:
+            limiter = None if self._limiter is None else self._limiter()
+            guard = _HandlerGuard(
+                handler, self._breaker(), limiter, self.message_types, self._clock
+            )
+            self._guards[id(handler)] = guard
+        return guard
+
+    def breaker(self, handler: object) -> CircuitBreaker:
+        """Return the circuit breaker of ``handler``.
+
+        Raises:
+            KeyError: If ``handler`` was not registered on a bus using this middleware.
+        """
+        return self._guards[id(handler)].breaker
+
+    def health(self) -> list[HandlerHealth]:
+        """Return what was observed of every guarded handler, in registration order."""
+        return [guard.health() for guard in self._guards.values()]
+
+
+class _HandlerGuard:
+    """The middleware a ``CircuitBreakerMiddleware`` creates for one handler."""
+
+    def __init__(
+        self,
+        handler: object,
+        breaker: CircuitBreaker,
+        limiter: AdaptiveConcurrencyLimit | None,
+        message_types: MessageTypes,
+        clock: Callable[[], float],
+    ) -> None:
+        self.handler = handler
+        self.breaker = breaker
+        self.limiter = limiter
+        self.message_types = message_types
+        self._clock = clock
+        self._calls = 0
+        self._failed = 0
+        self._rejected = 0
+        self._total_seconds = 0.0
+
+    async def __call__(self, message: Message[Any], call_next: NextHandler) -> Any:
+        """Call the handler unless its breaker or limit rejects ``message``."""
+        permit = self.breaker.allow()
+        if permit is None:
+            self._rejected += 1
+            raise CircuitOpenError.for_handler(self.handler, message, self.breaker.retry_in)
+        if self.limiter is not None and not self.limiter.try_acquire():
+            self.breaker.abandon(permit)
+            self._rejected += 1
+            raise ConcurrencyLimitError.for_handler(self.handler, message, self.limiter.limit)
+        started = self._clock()
+        try:
+            result = await call_next(message)
+        except Exception:
+            self._record(permit, self._clock() - started, failed=True)
+            raise
+        except BaseException:
+            self.breaker.abandon(permit)
+            if self.limiter is not None:
+                self.limiter.release(None)
+            raise
+        self._record(permit, self._clock() - started, failed=False)
+        return result
+
+    def health(self) -> HandlerHealth:
+        """Return what was observed of the handler."""
+        return HandlerHealth(
+            handler=type(self.handler).__qualname__,
+            state=self.breaker.state,
+            calls=self._calls,
+            failed=self._failed,
+            rejected=self._rejected,
+            mean_seconds=self._total_seconds / self._calls if self._calls else 0.0,
+            concurrency_limit=None if self.limiter is None else self.limiter.limit,
+        )
+
+    def _record(self, permit: CallPermit, duration: float, failed: bool) -> None:
+        self._calls += 1
+        self._failed += failed
+        self._total_seconds += duration
+        self.breaker.record(duration, failed, permit)
+        if self.limiter is not None:
+            self.limiter.release(duration, failed)
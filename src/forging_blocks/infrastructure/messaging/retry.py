@@ -0,0 +1,281 @@
+"""Retries scheduled on a timing wheel, and the dead letters of messages out of attempts."""
+
+from __future__ import annotations
+
+import asyncio
+import random
+from collections.abc import Callable, Iterator
+from dataclasses import dataclass, field
+from typing import Any
+from uuid import UUID, uuid4
+
+from forging_blocks.domain.messages.event import Event
+from forging_blocks.domain.messages.message import Message
+from forging_blocks.domain.messages.message_context import handling
+from forging_blocks.foundation.errors.base import Error
+from forging_blocks.infrastructure.messaging.deadlines import before_deadline, seconds_left
+from forging_blocks.infrastructure.messaging.errors import (
+    DeadlineExceededError,
+    RetriesExhaustedError,
+)
+from forging_blocks.infrastructure.messaging.middleware import MessageTypes, NextHandler
+from forging_blocks.infrastructure.messaging.timing_wheel import TimingWheel
+
+
+class ExponentialBackoff:
+    """Exponential backoff with full jitter.
+
+    The delay before retry ``n`` is drawn uniformly between 0 and
+    ``min(max_delay, base * factor ** (n - 1))``, which spreads the retries of
+    messages that failed together instead of sending them back in a burst.
+
+    Args:
+        base: The upper bound of the first delay, in seconds.
+        factor: How much the upper bound grows with each attempt.
+        max_delay: The cap of the upper bound, in seconds.
+        random: Returns a float in ``[0, 1)``.
+    """
+
+    def __init__(
+        self,
+        base: float = 0.1,
+        factor: float = 2.0,
+        max_delay: float = 60.0,
+        random: Callable[[], float] = random.random,
+    ) -> None:
+        if base <= 0 or factor < 1 or max_delay < base:
+            raise ValueError("base must be positive, factor at least 1 and max_delay >= base")
+        self._base = base
+        self._factor = factor
+        self._max_delay = max_delay
+        self._random = random
+
+    def delay(self, attempt: int) -> float:
+        """Return the delay, in seconds, before retry number ``attempt``."""
+        ceiling = self._max_delay
+        if attempt < 64:
+            ceiling = min(ceiling, self._base * self._factor ** max(0, attempt - 1))
+        return ceiling * self._random()
+
+
+@dataclass(frozen=True, slots=True)
+class RetryScheduled:
+    """Returned in place of a handler result when a failed message will be retried.
+
+    Attributes:
+        message_id: The id of the failed message.
+        attempt: The number of the scheduled retry, starting at 1.
+        delay: The delay before the retry, in seconds.
+    """
+
+    message_id: UUID
+    attempt: int
+    delay: float
+
+
+@dataclass(frozen=True, slots=True)
+class DeadLetter:
+    """A message whose handling failed on every attempt.
+
+    Attributes:
+        message: The message that could not be handled.
+        error: Why it was given up, with the last exception as its cause: a
+            ``RetriesExhaustedError``, or a ``DeadlineExceededError`` when its
+            deadline would pass before the next attempt.
+        attempts: The number of attempts made.
+        letter_id: Identifies the letter in its store.
+    """
+
+    message: Message[Any]
+    error: Error
+    attempts: int
+    letter_id: UUID = field(default_factory=uuid4)
+
+
+class InMemoryDeadLetterStore:
+    """Dead letters kept in memory, in the order they arrived.
+
+    Example:
+        >>> for letter in dead_letters:
+        ...     print(letter.error.context["exception_type"])
+        >>> await dead_letters.replay(letter.letter_id)
+    """
+
+    def __init__(self) -> None:
+        self._letters: dict[UUID, DeadLetter] = {}
+        self._replays: dict[UUID, NextHandler] = {}
+
+    def __len__(self) -> int:
+        """The number of dead letters."""
+        return len(self._letters)
+
+    def __iter__(self) -> Iterator[DeadLetter]:
+        """Iterate over the dead letters, oldest first."""
+        return iter(list(self._letters.values()))
+
+    def add(self, letter: DeadLetter, replay: NextHandler | None = None) -> None:
+        """Store ``letter``.
+
+        Args:
+            letter: The letter to store.
+            replay: Handles the message of the letter again for ``replay``.
+                None leaves the letter without replay.
+        """
+        self._letters[letter.letter_id] = letter
+        if replay is not None:
+            self._replays[letter.letter_id] = replay
+
+    def get(self, letter_id: UUID) -> DeadLetter | None:
+        """Return the letter with ``letter_id``, or None when there is none."""
+        return self._letters.get(letter_id)
+
+    def remove(self, letter_id: UUID) -> DeadLetter:
+        """Remove and return the letter with ``letter_id``.
+
+        Raises:
+            KeyError: If there is no such letter.
+        """
+        letter = self._letters.pop(letter_id)
+        self._replays.pop(letter_id, None)
+        return letter
+
+    async def replay(self, letter_id: UUID) -> Any:
+        """Handle the message of a letter again, removing the letter if it succeeds.
+
+        The message goes through the same handler pipeline that gave it up, once
+        and without further retries; when it fails again, the exception is raised
+        and the letter stays in the store.
+
+        Raises:
+            KeyError: If there is no such letter.
+            ValueError: If the letter was added without a way to replay it.
+        """
+        letter = self._letters[letter_id]
+        replay = self._replays.get(letter_id)
+        if replay is None:
+            raise ValueError("the letter has no handler to replay it with")
+        with handling(letter.message):
+            result = await replay(letter.message)
+        self._letters.pop(letter_id, None)
+        self._replays.pop(letter_id, None)
+        return result
+
+
+class ScheduledRetryMiddleware:
+    """Retry failed messages after a backoff, then send them to the dead letters.
+
+    A failed call returns a ``RetryScheduled`` right away instead of raising, and
+    the rest of the pipeline is called again once the backoff delay has passed.
+    Delays are timers on a shared ``TimingWheel``, so a waiting retry holds a
+    timer and no task; its task only exists while the retry runs. A message
+    failing its last attempt is added to ``dead_letters`` with a
+    ``RetriesExhaustedError``, and that first call raises when no retry is
+    allowed at all.
+
+    Retries honour the deadline of the message: no retry is scheduled past it,
+    the message going to the dead letters with a ``DeadlineExceededError``
+    instead, and a retry still running when it passes is cancelled.
+
+    Retries run outside of the dispatch that failed, so the default scope is
+    events, whose publishers do not wait for a result.
+
+    Args:
+        wheel: Schedules the retries. Defaults to a new ``TimingWheel``.
+        backoff: Returns the delay before each retry. Defaults to an
+            ``ExponentialBackoff``.
+        max_attempts: The maximum number of calls, including the first one.
+        dead_letters: Receives the messages out of attempts. Defaults to a new
+            ``InMemoryDeadLetterStore``.
+        retry_on: The exception types worth retrying; others raise at once.
+        message_types: The message classes to retry.
+    """
+
+    def __init__(
+        self,
+        wheel: TimingWheel | None = None,
+        backoff: ExponentialBackoff | None = None,
+        max_attempts: int = 5,
+        dead_letters: InMemoryDeadLetterStore | None = None,
+        retry_on: tuple[type[Exception], ...] = (Exception,),
+        message_types: MessageTypes = (Event,),
+    ) -> None:
+        if max_attempts < 1:
+            raise ValueError("max_attempts must be at least 1")
+        self._wheel = TimingWheel() if wheel is None else wheel
+        self._backoff = backoff or ExponentialBackoff()
+        self._max_attempts = max_attempts
+        self.dead_letters = InMemoryDeadLetterStore() if dead_letters is None else dead_letters
+        self._retry_on = retry_on
+        self.message_types = message_types
+        self._pending = 0
+        self._running: set[asyncio.Task[None]] = set()
+        self._idle: asyncio.Event | None = None
+
+    @property
+    def pending(self) -> int:
+        """The number of retries scheduled or running."""
+        return self._pending
+
+    async def __call__(self, message: Message[Any], call_next: NextHandler) -> Any:
+        """Handle ``message``, scheduling a retry if it fails."""
+        try:
+            return await call_next(message)
+        except self._retry_on as error:
+            scheduled = self._retry_later(message, call_next, 1, error)
+            if scheduled is None:
+                raise
+            return scheduled
+
+    async def join(self) -> None:
+        """Wait until no retry is scheduled or running."""
+        while self._pending:
+            if self._idle is None:
+                self._idle = asyncio.Event()
+            await self._idle.wait()
+
+    def _retry_later(
+        self, message: Message[Any], call_next: NextHandler, attempts: int, error: Exception
+    ) -> RetryScheduled | None:
+        """Schedule the next attempt, or dead-letter ``message`` when none is left."""
+        if attempts >= self._max_attempts:
+            exhausted = RetriesExhaustedError.from_exception(message, attempts, error)
+            self._dead_letter(message, call_next, attempts, exhausted)
+            return None
+        delay = self._backoff.delay(attempts)
+        left = seconds_left(message.metadata)
+        if left is not None and left <= delay:
+            late = DeadlineExceededError.for_metadata(message.metadata)
+            late.__cause__ = error
+            self._dead_letter(message, call_next, attempts, late)
+            return None
+        self._pending += 1
+        self._wheel.schedule(delay, lambda: self._start(message, call_next, attempts + 1))
+        return RetryScheduled(message.message_id, attempts, delay)
+
+    def _start(self, message: Message[Any], call_next: NextHandler, attempt: int) -> None:
+        """Run a retry whose delay has passed, from the wheel's driver."""
+        task = asyncio.get_running_loop().create_task(self._retry(message, call_next, attempt))
+        self._running.add(task)
+        task.add_done_callback(self._running.discard)
+
+    async def _retry(self, message: Message[Any], call_next: NextHandler, attempt: int) -> None:
+        """Call the pipeline again, scheduling another retry if it fails."""
+        try:
+            with handling(message):
+                await before_deadline(message.metadata, lambda: call_next(message))
+        except self._retry_on as error:
+            self._retry_later(message, call_next, attempt, error)
+        except Exception as error:
+            exhausted = RetriesExhaustedError.from_exception(message, attempt, error)
+            self._dead_letter(message, call_next, attempt, exhausted)
+        finally:
+            self._pending -= 1
+            if not self._pending and self._idle is not None:
+                self._idle.set()
+                self._idle = None
+
+    def _dead_letter(
+        self, message: Message[Any], call_next: NextHandler, attempts: int, reason: Error
+    ) -> None:
+        """Give up on ``message`` for ``reason``."""
+        self.dead_letters.add(DeadLetter(message, reason, attempts), replay=call_next)
@@ -0,0 +1,170 @@
+"""Hierarchical timing wheel scheduling many timers with one driver task."""
+
+from __future__ import annotations
+
+import asyncio
+import contextvars
+import math
+import time
+from collections.abc import Callable
+from typing import Any
+
+
+class WheelTimer:
+    """A callback scheduled on a ``TimingWheel``, which can be cancelled."""
+
+    __slots__ = ("deadline", "callback", "cancelled")
+
+    def __init__(self, deadline: int, callback: Callable[[], Any]) -> None:
+        self.deadline = deadline
+        self.callback = callback
+        self.cancelled = False
+
+    def cancel(self) -> None:
+        """Prevent the callback from running."""
+        self.cancelled = True
+
+
+class TimingWheel:
+    """Timer scheduler whose cost does not grow with the number of pending timers.
+
+    Time advances in ticks of ``tick`` seconds. Level 0 has one slot per tick for
+    the next ``slots`` ticks; each level above has slots ``slots`` times wider,
+    and its timers cascade to the level below when their slot comes up. Timers
+    further away than the top level covers wait in its last slot and cascade
+    again. Scheduling and cancelling are O(1), and firing costs O(1) per timer
+    plus one slot visit per tick, instead of one ``asyncio`` handle or task and a
+    heap operation per timer.
+
+    A single driver task advances the wheel while timers are pending. Callbacks
+    run on the event loop, in the context the driver started in, and should hand
+    longer work to a task.
+
+    Example:
+        >>> wheel = TimingWheel(tick=0.01)
+        >>> timer = wheel.schedule(1.5, lambda: print("later"))
+        >>> timer.cancel()
+    """
+
+    def __init__(
+        self,
+        tick: float = 0.01,
+        slots: int = 256,
+        levels: int = 4,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Create a wheel.
+
+        Args:
+            tick: The resolution of the wheel, in seconds.
+            slots: The number of slots of each level.
+            levels: The number of levels.
+            clock: Returns a monotonic time in seconds.
+        """
+        if tick <= 0 or slots < 2 or levels < 1:
+            raise ValueError("tick must be positive, with at least 2 slots and 1 level")
+        self._tick = tick
+        self._slots = slots
+        self._wheels: list[list[list[WheelTimer]]] = [
+            [[] for _ in range(slots)] for _ in range(levels)
+        ]
+        self._clock = clock
+        self._origin = 0.0
+        self._now = 0
+        self._pending = 0
+        self._driver: asyncio.Task[None] | None = None
+        self._wake: asyncio.Event | None = None
+
+    def __len__(self) -> int:
+        """The number of timers scheduled and not yet fired or skipped."""
+        return self._pending
+
+    @property
+    def now(self) -> int:
+        """The number of ticks the wheel has advanced."""
+        return self._now
+
+    def schedule(self, delay: float, callback: Callable[[], Any]) -> WheelTimer:
+        """Run ``callback`` once ``delay`` seconds have passed, rounded up to a tick.
+
+        The driver task starts with the first timer scheduled from a running loop;
+        without one, the wheel only moves through ``advance``.
+        """
+        self._start()
+        timer = WheelTimer(self._now + max(1, math.ceil(delay / self._tick)), callback)
+        self._insert(timer)
+        self._pending += 1
+        if self._wake is not None:
+            self._wake.set()
+        return timer
+
+    def advance(self, ticks: int = 1) -> None:
+        """Move the wheel forward by ``ticks``, firing the timers that come due."""
+        for _ in range(ticks):
+            self._now += 1
+            self._cascade()
+            slot = self._wheels[0][self._now % self._slots]
+            due, slot[:] = list(slot), []
+            for timer in due:
+                if timer.deadline > self._now:
+                    self._insert(timer)
+                    continue
+                self._pending -= 1
+                if not timer.cancelled:
+                    timer.callback()
+
+    async def aclose(self) -> None:
+        """Stop the driver task. Pending timers stay scheduled but do not fire."""
+        driver, self._driver = self._driver, None
+        if driver is not None:
+            driver.cancel()
+            await asyncio.gather(driver, return_exceptions=True)
+
+    def _insert(self, timer: WheelTimer) -> None:
+        """Put ``timer`` in the slot covering its deadline at the lowest fitting level."""
+        remaining = timer.deadline - self._now
+        granularity = 1
+        for level, wheel in enumerate(self._wheels):
+            span = granularity * self._slots
+            if remaining < span or level == len(self._wheels) - 1:
+                target = min(timer.deadline, self._now + span - granularity)
+                wheel[(target // granularity) % self._slots].append(timer)
+                return
+            granularity = span
+
+    def _cascade(self) -> None:
+        """Move the timers of the upper-level slots starting at this tick downwards."""
+        granularity = self._slots
+        for wheel in self._wheels[1:]:
+            if self._now % granularity:
+                return
+            slot = wheel[(self._now // granularity) % self._slots]
+            timers, slot[:] = list(slot), []
+            for timer in timers:
+                self._insert(timer)
+            granularity *= self._slots
+
+    def _start(self) -> None:
+        """Start the driver task if a loop is running and it is not started yet."""
+        if self._driver is not None:
+            return
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return
+        self._wake = asyncio.Event()
+        self._origin = self._clock() - self._now * self._tick
+        # Timers outlive the code that schedules them, so they must not inherit its
+        # message context.
+        self._driver = loop.create_task(self._drive(self._wake), context=contextvars.Context())
+
+    async def _drive(self, wake: asyncio.Event) -> None:
+        """Advance the wheel with the clock, sleeping while no timer is pending."""
+        while True:
+            if not self._pending:
+                wake.clear()
+                await wake.wait()
+                self._origin = self._clock() - self._now * self._tick
+            await asyncio.sleep(self._tick)
+            elapsed = int((self._clock() - self._origin) / self._tick)
+            self.advance(max(0, elapsed - self._now))
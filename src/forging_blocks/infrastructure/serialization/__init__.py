@@ -0,0 +1,4 @@
+"""Infrastructure serialization package.
+
+Contains codecs that turn domain messages into bytes and back.
+"""
@@ -0,0 +1,215 @@
+"""Field codecs for the binary message codec.
+
+Each field codec writes one payload value into a ``bytearray`` and reads it back
+from a ``memoryview`` at a given offset. Fixed-size values use precompiled
+``struct.Struct`` instances; variable-size values are length-prefixed.
+"""
+
+from __future__ import annotations
+
+from datetime import datetime, timedelta, timezone
+from struct import Struct
+from typing import Generic, Protocol, TypeVar
+from uuid import UUID
+
+from forging_blocks.domain.value_object import ValueObject
+
+FieldValueType = TypeVar("FieldValueType")
+
+EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+
+_BOOL = Struct("<?")
+_INT64 = Struct("<q")
+_FLOAT64 = Struct("<d")
+_LENGTH = Struct("<I")
+_UUID_SIZE = 16
+
+
+class FieldCodec(Protocol[FieldValueType]):
+    """Protocol for encoding and decoding a single payload field."""
+
+    def encode(self, value: FieldValueType, buffer: bytearray) -> None:
+        """Append the encoded ``value`` to ``buffer``."""
+        ...
+
+    def decode(self, view: memoryview, offset: int) -> tuple[FieldValueType, int]:
+        """Read a value from ``view`` at ``offset``.
+
+        Returns:
+            The decoded value and the offset just past it.
+        """
+        ...
+
+
+class BoolField:
+    """Boolean stored as a single byte."""
+
+    def encode(self, value: bool, buffer: bytearray) -> None:
+        """Append the encoded ``value`` to ``buffer``."""
+        buffer += _BOOL.pack(value)
+
+    def decode(self, view: memoryview, offset: int) -> tuple[bool, int]:
+        """Read a value from ``view`` at ``offset``."""
+        return _BOOL.unpack_from(view, offset)[0], offset + _BOOL.size
+
+
+class IntField:
+    """Signed integer stored as 8 little-endian bytes."""
+
+    def encode(self, value: int, buffer: bytearray) -> None:
+        """Append the encoded ``value`` to ``buffer``."""
+        buffer += _INT64.pack(value)
+
+    def decode(self, view: memoryview, offset: int) -> tuple[int, int]:
+        """Read a value from ``view`` at ``offset``."""
+        return _INT64.unpack_from(view, offset)[0], offset + _INT64.size
+
+
+class FloatField:
+    """Float stored as an 8-byte IEEE 754 double."""
+
+    def encode(self, value: float, buffer: bytearray) -> None:
+        """Append the encoded ``value`` to ``buffer``."""
+        buffer += _FLOAT64.pack(value)
+
+    def decode(self, view: memoryview, offset: int) -> tuple[float, int]:
+        """Read a value from ``view`` at ``offset``."""
+        return _FLOAT64.unpack_from(view, offset)[0], offset + _FLOAT64.size
+
+
+class StrField:
+    """UTF-8 string prefixed with its 4-byte length."""
+
+    def encode(self, value: str, buffer: bytearray) -> None:
+        """Append the encoded ``value`` to ``buffer``."""
+        encoded = value.encode("utf-8")
+        buffer += _LENGTH.pack(len(encoded))
+        buffer += encoded
+
+    def decode(self, view: memoryview, offset: int) -> tuple[str, int]:
+        """Read a value from ``view`` at ``offset``, decoding straight from the view."""
+        (length,) = _LENGTH.unpack_from(view, offset)
+        start = offset + _LENGTH.size
+        end = start + length
+        return str(view[start:end], "utf-8"), end
+
+
+class BytesField:
+    """Raw bytes prefixed with their 4-byte length."""
+
+    def encode(self, value: bytes, buffer: bytearray) -> None:
+        """Append the encoded ``value`` to ``buffer``."""
+        buffer += _LENGTH.pack(len(value))
+        buffer += value
+
+    def decode(self, view: memoryview, offset: int) -> tuple[bytes, int]:
+        """Read a value from ``view`` at ``offset``."""
+        (length,) = _LENGTH.unpack_from(view, offset)
+        start = offset + _LENGTH.size
+        end = start + length
+        return bytes(view[start:end]), end
+
+
+class UuidField:
+    """UUID stored as its 16 raw bytes."""
+
+    def encode(self, value: UUID, buffer: bytearray) -> None:
+        """Append the encoded ``value`` to ``buffer``."""
+        buffer += value.bytes
+
+    def decode(self, view: memoryview, offset: int) -> tuple[UUID, int]:
+        """Read a value from ``view`` at ``offset``."""
+        end = offset + _UUID_SIZE
+        return UUID(bytes=bytes(view[offset:end])), end
+
+
+class DateTimeField:
+    """Timezone-aware datetime stored as int64 microseconds since the Unix epoch (UTC)."""
+
+    def encode(self, value: datetime, buffer: bytearray) -> None:
+        """Append the encoded ``value`` to ``buffer``."""
+        buffer += _INT64.pack(to_epoch_microseconds(value))
+
+    def decode(self, view: memoryview, offset: int) -> tuple[datetime, int]:
+        """Read a value from ``view`` at ``offset``."""
+        (microseconds,) = _INT64.unpack_from(view, offset)
+        return from_epoch_microseconds(microseconds), offset + _INT64.size
+
+
+class OptionalField(Generic[FieldValueType]):
+    """Nullable field: a presence byte followed by the inner field when present."""
+
+    def __init__(self, inner: FieldCodec[FieldValueType]) -> None:
+        self._inner = inner
+
+    def encode(self, value: FieldValueType | None, buffer: bytearray) -> None:
+        """Append the encoded ``value`` to ``buffer``."""
+        buffer += _BOOL.pack(value is not None)
+        if value is not None:
+            self._inner.encode(value, buffer)
+
+    def decode(self, view: memoryview, offset: int) -> tuple[FieldValueType | None, int]:
+        """Read a value from ``view`` at ``offset``."""
+        (present,) = _BOOL.unpack_from(view, offset)
+        offset += _BOOL.size
+        if not present:
+            return None, offset
+        return self._inner.decode(view, offset)
+
+
+class ListField(Generic[FieldValueType]):
+    """Homogeneous list prefixed with its 4-byte item count."""
+
+    def __init__(self, inner: FieldCodec[FieldValueType]) -> None:
+        self._inner = inner
+
+    def encode(self, value: list[FieldValueType], buffer: bytearray) -> None:
+        """Append the encoded ``value`` to ``buffer``."""
+        buffer += _LENGTH.pack(len(value))
+        encode = self._inner.encode
+        for item in value:
+            encode(item, buffer)
+
+    def decode(self, view: memoryview, offset: int) -> tuple[list[FieldValueType], int]:
+        """Read a value from ``view`` at ``offset``."""
+        (count,) = _LENGTH.unpack_from(view, offset)
+        offset += _LENGTH.size
+        items: list[FieldValueType] = []
+        decode = self._inner.decode
+        for _ in range(count):
+            item, offset = decode(view, offset)
+            items.append(item)
+        return items, offset
+
+
+class ValueObjectField(Generic[FieldValueType]):
+    """Value object stored as its raw ``value`` with an inner field codec.
+
+    Decoding rebuilds the value object with its class's ``_from_validated``, so the
+    raw value is trusted as it was valid when encoded.
+    """
+
+    def __init__(
+        self, value_type: type[ValueObject[FieldValueType]], inner: FieldCodec[FieldValueType]
+    ) -> None:
+        self._value_type = value_type
+        self._inner = inner
+
+    def encode(self, value: ValueObject[FieldValueType], buffer: bytearray) -> None:
+        """Append the encoded ``value`` to ``buffer``."""
+        self._inner.encode(value.value, buffer)
+
+    def decode(self, view: memoryview, offset: int) -> tuple[ValueObject[FieldValueType], int]:
+        """Read a value from ``view`` at ``offset``."""
+        raw_value, offset = self._inner.decode(view, offset)
+        return self._value_type._from_validated(raw_value), offset
+
+
+def to_epoch_microseconds(value: datetime) -> int:
+    """Convert a timezone-aware datetime to integer microseconds since the Unix epoch."""
+    return (value - EPOCH) // timedelta(microseconds=1)
+
+
+def from_epoch_microseconds(microseconds: int) -> datetime:
+    """Convert integer microseconds since the Unix epoch to a UTC datetime."""
+    return EPOCH + timedelta(microseconds=microseconds)
@@ -0,0 +1,222 @@
+"""Compact binary codec for domain messages.
+
+Messages are encoded against a per-message-type schema registered in the codec.
+A frame is laid out as:
+
+.. code-block:: text
+
+    u8   format version
+    u16  message_type length, followed by the UTF-8 message_type
+    16B  message_id, 16B correlation_id, 16B causation_id (raw UUID bytes)
+    i64  created_at, in microseconds since the Unix epoch (UTC)
+    u8   deadline presence, followed by the i64 deadline when present
+    ...  payload fields, in schema order, each written by its field codec
+
+Decoding reads from a ``memoryview`` without copying the frame, and several frames
+can be concatenated in one buffer.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable, Iterator, Mapping
+from struct import Struct
+from typing import Any
+from uuid import UUID
+
+from forging_blocks.domain.messages.message import Message, MessageMetadata
+from forging_blocks.foundation.errors.base import Error
+from forging_blocks.foundation.errors.core import ErrorMessage, ErrorMetadata
+from forging_blocks.infrastructure.serialization.binary_fields import (
+    DateTimeField,
+    FieldCodec,
+    OptionalField,
+    from_epoch_microseconds,
+    to_epoch_microseconds,
+)
+
+FORMAT_VERSION = 2
+
+_PREAMBLE = Struct("<BH")
+_METADATA = Struct("<16s16s16sq")
+_DEADLINE = OptionalField(DateTimeField())
+
+
+class MessageSchemaNotFoundError(Error):
+    """Raised when a message type has no schema registered in the codec."""
+
+    @classmethod
+    def from_message_type(cls, message_type: str) -> MessageSchemaNotFoundError:
+        """Create the error for an unregistered message type."""
+        message = ErrorMessage(f"No binary schema registered for message type '{message_type}'.")
+        metadata = ErrorMetadata(context={"message_type": message_type})
+        return cls(message, metadata)
+
+
+class UnsupportedFormatVersionError(Error):
+    """Raised when a frame was written with an unknown format version."""
+
+    @classmethod
+    def from_version(cls, version: int) -> UnsupportedFormatVersionError:
+        """Create the error for an unknown format version."""
+        message = ErrorMessage(f"Unsupported binary message format version {version}.")
+        metadata = ErrorMetadata(context={"version": version, "supported": FORMAT_VERSION})
+        return cls(message, metadata)
+
+
+class MessageSchema:
+    """Binary layout of the payload of one message type.
+
+    Args:
+        message_class: The message class rebuilt on decode, via ``from_payload``.
+        fields: Payload keys mapped to their field codecs, in encoding order.
+        message_type: The ``MessageMetadata.message_type`` this schema is keyed on.
+            Defaults to the class name, as ``Message`` does.
+    """
+
+    __slots__ = ("_message_class", "_fields", "_message_type", "_encoded_type")
+
+    def __init__(
+        self,
+        message_class: type[Message[Any]],
+        fields: Mapping[str, FieldCodec[Any]],
+        message_type: str | None = None,
+    ) -> None:
+        self._message_class = message_class
+        self._fields = tuple(fields.items())
+        self._message_type = message_type or message_class.__name__
+        self._encoded_type = self._message_type.encode("utf-8")
+
+    @property
+    def message_class(self) -> type[Message[Any]]:
+        """The message class rebuilt on decode."""
+        return self._message_class
+
+    @property
+    def message_type(self) -> str:
+        """The message type this schema is registered under."""
+        return self._message_type
+
+    @property
+    def field_names(self) -> tuple[str, ...]:
+        """The payload keys, in encoding order."""
+        return tuple(name for name, _ in self._fields)
+
+    def encode_payload(self, payload: Mapping[str, Any], buffer: bytearray) -> None:
+        """Append the payload fields to ``buffer`` in schema order."""
+        for name, codec in self._fields:
+            codec.encode(payload[name], buffer)
+
+    def decode_payload(self, view: memoryview, offset: int) -> tuple[dict[str, Any], int]:
+        """Read the payload fields from ``view`` at ``offset``.
+
+        Returns:
+            The payload and the offset just past it.
+        """
+        payload: dict[str, Any] = {}
+        for name, codec in self._fields:
+            payload[name], offset = codec.decode(view, offset)
+        return payload, offset
+
+
+class BinaryMessageCodec:
+    """Encode and decode messages with a registry of binary schemas.
+
+    Example:
+        >>> codec = BinaryMessageCodec(
+        ...     [MessageSchema(OrderCreated, {"order_id": UuidField(), "total": FloatField()})]
+        ... )
+        >>> data = codec.encode(OrderCreated(order_id=uuid4(), total=12.5))
+        >>> codec.decode(data)
+    """
+
+    def __init__(self, schemas: Iterable[MessageSchema] = ()) -> None:
+        self._schemas: dict[str, MessageSchema] = {}
+        for schema in schemas:
+            self.register(schema)
+
+    def register(self, schema: MessageSchema) -> None:
+        """Register (or replace) the schema of a message type."""
+        self._schemas[schema.message_type] = schema
+
+    def schema_for(self, message_type: str) -> MessageSchema:
+        """Return the schema registered for ``message_type``.
+
+        Raises:
+            MessageSchemaNotFoundError: If no schema is registered for the type.
+        """
+        try:
+            return self._schemas[message_type]
+        except KeyError:
+            raise MessageSchemaNotFoundError.from_message_type(message_type) from None
+
+    def encode(self, message: Message[Any]) -> bytes:
+        """Encode a message into a single frame, cached on the message."""
+        return message.encoded(self._encode_frame)
+
+    def encode_into(self, message: Message[Any], buffer: bytearray) -> None:
+        """Append the frame of ``message`` to ``buffer``."""
+        buffer += self.encode(message)
+
+    def _encode_frame(self, message: Message[Any]) -> bytes:
+        """Encode ``message`` into a new frame."""
+        buffer = bytearray()
+        metadata = message.metadata
+        schema = self.schema_for(metadata.message_type)
+        encoded_type = schema._encoded_type
+        buffer += _PREAMBLE.pack(FORMAT_VERSION, len(encoded_type))
+        buffer += encoded_type
+        buffer += _METADATA.pack(
+            metadata.message_id.bytes,
+            metadata.correlation_id.bytes,
+            metadata.causation_id.bytes,
+            to_epoch_microseconds(metadata.created_at),
+        )
+        _DEADLINE.encode(metadata.deadline, buffer)
+        schema.encode_payload(message.payload, buffer)
+        return bytes(buffer)
+
+    def decode(self, data: bytes | bytearray | memoryview) -> Message[Any]:
+        """Decode a single frame."""
+        message, _ = self.decode_from(memoryview(data), 0)
+        return message
+
+    def decode_from(self, view: memoryview, offset: int) -> tuple[Message[Any], int]:
+        """Decode the frame starting at ``offset`` without copying the buffer.
+
+        Returns:
+            The decoded message and the offset of the next frame.
+
+        Raises:
+            UnsupportedFormatVersionError: If the frame has an unknown format version.
+            MessageSchemaNotFoundError: If the frame's message type is not registered.
+        """
+        version, type_length = _PREAMBLE.unpack_from(view, offset)
+        if version != FORMAT_VERSION:
+            raise UnsupportedFormatVersionError.from_version(version)
+        offset += _PREAMBLE.size
+        message_type = str(view[offset : offset + type_length], "utf-8")
+        offset += type_length
+        message_id, correlation_id, causation_id, created_at = _METADATA.unpack_from(view, offset)
+        offset += _METADATA.size
+        deadline, offset = _DEADLINE.decode(view, offset)
+
+        schema = self.schema_for(message_type)
+        payload, offset = schema.decode_payload(view, offset)
+        metadata = MessageMetadata(
+            message_type=message_type,
+            message_id=UUID(bytes=message_id),
+            created_at=from_epoch_microseconds(created_at),
+            correlation_id=UUID(bytes=correlation_id),
+            causation_id=UUID(bytes=causation_id),
+            deadline=deadline,
+        )
+        return schema.message_class.from_payload(payload, metadata), offset
+
+    def iter_decode(self, data: bytes | bytearray | memoryview) -> Iterator[Message[Any]]:
+        """Decode every frame of a buffer holding concatenated frames."""
+        view = memoryview(data)
+        offset = 0
+        end = len(view)
+        while offset < end:
+            message, offset = self.decode_from(view, offset)
+            yield message
@@ -0,0 +1,82 @@
+"""JSON codec for domain messages.
+
+Messages are written as the JSON form of ``Message.to_dict`` and rebuilt through a
+``MessageRegistry``. Newline-delimited JSON (one message per line) is decoded as a
+stream, so large event archives are never loaded into memory at once.
+"""
+
+from __future__ import annotations
+
+import json
+from collections.abc import Iterable, Iterator
+from typing import Any
+
+from forging_blocks.domain.messages.message import Message
+from forging_blocks.infrastructure.serialization.message_registry import MessageRegistry
+
+_ENCODER = json.JSONEncoder(separators=(",", ":"), ensure_ascii=False, default=str)
+_DECODER = json.JSONDecoder()
+
+
+class JsonMessageCodec:
+    """Encode and decode messages as JSON, resolving classes with a registry.
+
+    Payload values that JSON cannot represent (e.g. ``UUID``, ``datetime``) are
+    written with ``str``; classes whose payload holds such values convert them back
+    in ``from_payload``.
+
+    Example:
+        >>> codec = JsonMessageCodec(registry)
+        >>> with open("events.ndjson", "rb") as archive:
+        ...     for event in codec.iter_decode(archive):
+        ...         replay(event)
+    """
+
+    def __init__(self, registry: MessageRegistry) -> None:
+        self._registry = registry
+
+    @property
+    def registry(self) -> MessageRegistry:
+        """The registry used to resolve message classes."""
+        return self._registry
+
+    def encode(self, message: Message[Any]) -> bytes:
+        """Encode a message as a UTF-8 JSON document, cached on the message."""
+        return message.encoded(_encode_document)
+
+    def encode_lines(self, messages: Iterable[Message[Any]]) -> Iterator[bytes]:
+        """Encode messages as newline-terminated JSON lines."""
+        for message in messages:
+            yield message.encoded(_encode_document) + b"\n"
+
+    def decode(self, data: bytes | bytearray | str) -> Message[Any]:
+        """Decode a single JSON document.
+
+        Raises:
+            MessageTypeNotRegisteredError: If the message type is not registered.
+        """
+        if not isinstance(data, str):
+            data = data.decode("utf-8")
+        return self._registry.from_dict(_DECODER.decode(data))
+
+    def iter_decode(self, lines: Iterable[bytes | str]) -> Iterator[Message[Any]]:
+        """Decode newline-delimited JSON one line at a time.
+
+        Blank lines are skipped. ``lines`` may be any iterable of lines, such as an
+        open file.
+
+        Raises:
+            MessageTypeNotRegisteredError: If a message type is not registered.
+        """
+        from_dict = self._registry.from_dict
+        decode = _DECODER.decode
+        for line in lines:
+            if isinstance(line, (bytes, bytearray)):
+                line = line.decode("utf-8")
+            if line.strip():
+                yield from_dict(decode(line))
+
+
+def _encode_document(message: Message[Any]) -> bytes:
+    """Encode ``message.to_dict()`` as compact UTF-8 JSON."""
+    return _ENCODER.encode(message.to_dict()).encode("utf-8")
@@ -0,0 +1,88 @@
+"""Registry mapping message type names to message classes.
+
+Consumers that receive serialized messages only know the ``message_type`` stored in
+the metadata. The registry resolves it to the ``Message`` subclass to rebuild with a
+single dictionary lookup.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable, Mapping
+from typing import Any, TypeVar
+
+from forging_blocks.domain.messages.message import Message
+from forging_blocks.foundation.errors.base import Error
+from forging_blocks.foundation.errors.core import ErrorMessage, ErrorMetadata
+
+MessageClass = TypeVar("MessageClass", bound=type[Message[Any]])
+
+
+class MessageTypeNotRegisteredError(Error):
+    """Raised when a message type has no message class registered."""
+
+    @classmethod
+    def from_message_type(cls, message_type: str) -> MessageTypeNotRegisteredError:
+        """Create the error for an unregistered message type."""
+        message = ErrorMessage(f"No message class registered for message type '{message_type}'.")
+        metadata = ErrorMetadata(context={"message_type": message_type})
+        return cls(message, metadata)
+
+
+class MessageRegistry:
+    """Map ``MessageMetadata.message_type`` values to ``Message`` subclasses.
+
+    ``register`` returns the class, so it can be used as a decorator.
+
+    Example:
+        >>> registry = MessageRegistry()
+        >>> @registry.register
+        ... class OrderCreated(Event[dict[str, Any]]): ...
+        >>> registry.from_dict(OrderCreated(order_id="1").to_dict())
+    """
+
+    def __init__(self, message_classes: Iterable[type[Message[Any]]] = ()) -> None:
+        self._message_classes: dict[str, type[Message[Any]]] = {}
+        for message_class in message_classes:
+            self.register(message_class)
+
+    def __contains__(self, message_type: object) -> bool:
+        return message_type in self._message_classes
+
+    def __len__(self) -> int:
+        return len(self._message_classes)
+
+    def register(
+        self, message_class: MessageClass, message_type: str | None = None
+    ) -> MessageClass:
+        """Register (or replace) the class rebuilt for a message type.
+
+        Args:
+            message_class: The message class to register.
+            message_type: The message type it is registered under. Defaults to the
+                class name, as ``Message`` does.
+
+        Returns:
+            The registered class.
+        """
+        self._message_classes[message_type or message_class.__name__] = message_class
+        return message_class
+
+    def message_class_for(self, message_type: str) -> type[Message[Any]]:
+        """Return the message class registered for ``message_type``.
+
+        Raises:
+            MessageTypeNotRegisteredError: If no class is registered for the type.
+        """
+        try:
+            return self._message_classes[message_type]
+        except KeyError:
+            raise MessageTypeNotRegisteredError.from_message_type(message_type) from None
+
+    def from_dict(self, data: Mapping[str, Any]) -> Message[Any]:
+        """Rebuild a message from the dictionary returned by ``Message.to_dict``.
+
+        Raises:
+            MessageTypeNotRegisteredError: If the message type is not registered.
+        """
+        message_class = self.message_class_for(data["metadata"]["message_type"])
+        return message_class.from_dict(data)
@@ -22,6 +22,7 @@ class TestCommandSender:
     def message_bus(self) -> MagicMock:
         bus = MagicMock(spec=MessageBus)
         bus.dispatch = AsyncMock()
+        bus.dispatch_many = AsyncMock()
 
         return bus
 
@@ -39,3 +40,13 @@ class TestCommandSender:
         await sender.send(command)
 
         message_bus.dispatch.assert_awaited_with(command)
+
+    async def test_send_many_when_called_then_call_message_bus_dispatch_many_with_commands(
+        self, message_bus: MagicMock
+    ) -> None:
+        commands = [FakeCommand(), FakeCommand()]
+        sender = CommandSender(message_bus)
+
+        await sender.send_many(commands)
+
+        message_bus.dispatch_many.assert_awaited_once_with(commands)
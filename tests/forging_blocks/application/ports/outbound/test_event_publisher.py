@@ -22,6 +22,7 @@ class TestEventPublisher:
     def message_bus(self) -> MagicMock:
         bus = MagicMock(spec=MessageBus)
         bus.dispatch = AsyncMock()
+        bus.dispatch_many = AsyncMock()
 
         return bus
 
@@ -39,3 +40,13 @@ class TestEventPublisher:
         await publisher.publish(event)
 
         message_bus.dispatch.assert_awaited_with(event)
+
+    async def test_publish_many_when_called_then_call_message_bus_dispatch_many_with_events(
+        self, message_bus: MagicMock
+    ) -> None:
+        publisher = EventPublisher(message_bus)
+        events = [FakeEvent(), FakeEvent()]
+
+        await publisher.publish_many(events)
+
+        message_bus.dispatch_many.assert_awaited_once_with(events)
@@ -23,6 +23,7 @@ class TestQueryFetcher:
     def message_bus(self) -> MagicMock:
         bus = MagicMock(spec=MessageBus)
         bus.dispatch = AsyncMock()
+        bus.dispatch_many = AsyncMock()
 
         return bus
 
@@ -38,3 +39,15 @@ class TestQueryFetcher:
         expected_result = {"fetched": "query"}
         assert result == expected_result
         message_bus.dispatch.assert_awaited_with(query)
+
+    async def test_fetch_many_when_called_then_return_message_bus_dispatch_many_results(
+        self, message_bus: MagicMock
+    ) -> None:
+        message_bus.dispatch_many.return_value = [1, 2]
+        fetcher = QueryFetcher(message_bus)
+        queries = [FakeQuery(), FakeQuery()]
+
+        result = await fetcher.fetch_many(queries)
+
+        assert result == [1, 2]
+        message_bus.dispatch_many.assert_awaited_once_with(queries)
@@ -3,13 +3,22 @@
 Tests for MessageMetadata and Message classes.
 """
 
-from datetime import datetime, timezone
+import copy
+import json
+import pickle
+from datetime import datetime, timedelta, timezone
 from typing import Any
 from uuid import UUID, uuid4
 
 import pytest
 
-from forging_blocks.domain.messages.message import Message, MessageMetadata
+from forging_blocks.domain.messages.message import (
+    Message,
+    MessageMetadata,
+    now,
+    set_clock,
+    set_id_provider,
+)
 
 
 class FakeMessage(Message[str]):
@@ -148,6 +157,87 @@ class TestMessageMetadata:
 
         assert hash(metadata1) != hash(metadata2)
 
+    def test_from_dict_when_called_then_reuses_stored_identifiers(self):
+        metadata = MessageMetadata("FakeMessage")
+
+        rebuilt = MessageMetadata.from_dict(metadata.to_dict())
+
+        assert rebuilt == metadata
+        assert rebuilt.message_type == "FakeMessage"
+        assert rebuilt.correlation_id == metadata.correlation_id
+        assert rebuilt.causation_id == metadata.causation_id
+
+    def test_init_when_ttl_and_deadline_given_then_keeps_earliest(self):
+        deadline = self.created_at + timedelta(seconds=30)
+
+        metadata = MessageMetadata(
+            "FakeMessage", created_at=self.created_at, deadline=deadline, ttl=timedelta(seconds=5)
+        )
+
+        assert metadata.deadline == self.created_at + timedelta(seconds=5)
+
+    def test_init_when_no_deadline_given_then_has_none(self):
+        metadata = MessageMetadata("FakeMessage")
+
+        assert metadata.deadline is None
+        assert "deadline" not in metadata.to_dict()
+
+    def test_from_dict_when_deadline_set_then_keeps_it(self):
+        metadata = MessageMetadata("FakeMessage", ttl=timedelta(seconds=5))
+
+        rebuilt = MessageMetadata.from_dict(metadata.to_dict())
+
+        assert rebuilt.deadline == metadata.deadline
+
+    def test_message_id_when_not_given_then_generated_lazily_once(self):
+        generated: list[UUID] = []
+
+        def id_provider() -> UUID:
+            generated.append(uuid4())
+            return generated[-1]
+
+        previous = set_id_provider(id_provider)
+        try:
+            metadata = MessageMetadata("FakeMessage", correlation_id=uuid4())
+            assert generated == []
+
+            assert metadata.message_id == metadata.message_id == generated[0]
+            assert len(generated) == 1
+        finally:
+            set_id_provider(previous)
+
+    def test_init_when_no_message_handled_then_ids_default_to_message_id(self):
+        metadata = MessageMetadata("FakeMessage")
+
+        assert metadata.correlation_id == metadata.message_id
+        assert metadata.causation_id == metadata.message_id
+
+    def test_created_at_when_clock_configured_then_uses_clock(self):
+        fixed = datetime(2025, 6, 11, 19, 36, 6, tzinfo=timezone.utc)
+        previous = set_clock(lambda: fixed)
+        try:
+            assert now() == fixed
+            assert MessageMetadata("FakeMessage").created_at == fixed
+        finally:
+            set_clock(previous)
+
+    def test_copy_when_ids_not_yet_generated_then_keeps_same_ids(self):
+        metadata = MessageMetadata("FakeMessage")
+
+        for clone in (copy.deepcopy(metadata), pickle.loads(pickle.dumps(metadata))):
+            assert clone.message_id == metadata.message_id
+            assert clone.correlation_id == metadata.correlation_id
+            assert clone.causation_id == metadata.causation_id
+
+    def test_value_when_called_twice_then_returns_same_read_only_view(self):
+        metadata = MessageMetadata("FakeMessage")
+
+        value = metadata.value
+
+        assert metadata.value is value
+        with pytest.raises(TypeError):
+            value["message_type"] = "Other"  # type: ignore[index]
+
 
 class TestMessage:
     """Tests for Message class."""
@@ -234,6 +324,77 @@ class TestMessage:
 
         assert hash(message1) != hash(message2)
 
+    def test_payload_when_called_then_returns_domain_data(self):
+        message = FakeMessage("test_data")
+
+        assert message.payload == {"data": "test_data"}
+
+    def test_from_payload_when_called_then_rebuilds_equal_message(self):
+        message = FakeMessage("test_data")
+
+        rebuilt = FakeMessage.from_payload(message.payload, message.metadata)
+
+        assert rebuilt == message
+        assert rebuilt.value == "test_data"
+        assert rebuilt.metadata is message.metadata
+
+    def test_from_dict_when_called_then_rebuilds_message(self):
+        message = FakeMessage("test_data")
+
+        rebuilt = FakeMessage.from_dict(message.to_dict())
+
+        assert rebuilt == message
+        assert rebuilt.value == "test_data"
+        assert rebuilt.metadata.correlation_id == message.metadata.correlation_id
+
+    def test_to_dict_when_called_twice_then_returns_same_read_only_view(self):
+        message = FakeMessage("test_data")
+
+        result = message.to_dict()
+
+        assert message.to_dict() is result
+        assert message.payload is result["payload"]
+        with pytest.raises(TypeError):
+            result["payload"] = {}  # type: ignore[index]
+        with pytest.raises(TypeError):
+            message.payload["data"] = "changed"  # type: ignore[index]
+
+    def test_to_dict_when_serialized_or_copied_then_behaves_like_dict(self):
+        message = FakeMessage("test_data")
+        result = message.to_dict()
+
+        copies = [
+            json.loads(json.dumps(result)),
+            pickle.loads(pickle.dumps(result)),
+            copy.deepcopy(result),
+        ]
+
+        assert all(clone == result for clone in copies)
+        copies[2]["payload"]["data"] = "changed"
+        assert message.payload["data"] == "test_data"
+
+    def test_encoded_when_same_encoder_then_encodes_once(self):
+        message = FakeMessage("test_data")
+        calls: list[Message[Any]] = []
+
+        def encoder(encoded_message: Message[Any]) -> bytes:
+            calls.append(encoded_message)
+            return b"encoded"
+
+        assert message.encoded(encoder) == message.encoded(encoder) == b"encoded"
+        assert calls == [message]
+
+    def test_pickle_when_snapshots_cached_then_leaves_them_out(self):
+        message = FakeMessage("test_data")
+        message.to_dict()
+        message.encoded(lambda _: b"encoded")
+
+        clone = pickle.loads(pickle.dumps(message))
+
+        assert clone == message
+        assert clone.to_dict() == message.to_dict()
+        assert "_encoded_forms" not in vars(clone)
+
     def test_cannot_instantiate_abstract_message_directly(self):
         with pytest.raises(TypeError, match="abstract"):
             # This should raise TypeError because Message is abstract an payload is
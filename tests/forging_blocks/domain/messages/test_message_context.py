@@ -0,0 +1,78 @@
+import asyncio
+from datetime import timedelta
+
+from forging_blocks.domain.messages.message import MessageMetadata
+from forging_blocks.domain.messages.message_context import current_metadata, handling
+
+
+class TestMessageContext:
+    def test_current_metadata_when_nothing_handled_then_returns_none(self) -> None:
+        assert current_metadata() is None
+
+    def test_handling_when_message_created_then_joins_causal_chain(self) -> None:
+        command = MessageMetadata("PlaceOrder")
+
+        with handling(command) as handled:
+            event = MessageMetadata("OrderPlaced")
+
+        assert handled is command
+        assert event.correlation_id == command.correlation_id
+        assert event.causation_id == command.message_id
+        assert current_metadata() is None
+
+    def test_handling_when_nested_then_chain_follows_innermost_message(self) -> None:
+        command = MessageMetadata("PlaceOrder")
+
+        with handling(command):
+            event = MessageMetadata("OrderPlaced")
+            with handling(event):
+                reaction = MessageMetadata("ReserveStock")
+            assert current_metadata() is command
+
+        assert reaction.correlation_id == command.message_id
+        assert reaction.causation_id == event.message_id
+
+    def test_handling_when_handled_message_has_deadline_then_derived_keeps_earliest(
+        self,
+    ) -> None:
+        query = MessageMetadata("SearchProducts", ttl=timedelta(seconds=2))
+
+        with handling(query):
+            inherited = MessageMetadata("LoadPrices")
+            shorter = MessageMetadata("LoadStock", ttl=timedelta(seconds=1))
+            longer = MessageMetadata("LoadReviews", ttl=timedelta(seconds=10))
+
+        assert inherited.deadline == longer.deadline == query.deadline
+        assert shorter.deadline is not None and query.deadline is not None
+        assert shorter.deadline < query.deadline
+
+    def test_handling_when_ids_given_then_keeps_them(self) -> None:
+        explicit = MessageMetadata("Other")
+
+        with handling(MessageMetadata("PlaceOrder")):
+            event = MessageMetadata(
+                "OrderPlaced",
+                correlation_id=explicit.message_id,
+                causation_id=explicit.message_id,
+            )
+
+        assert event.correlation_id == explicit.message_id
+        assert event.causation_id == explicit.message_id
+
+    def test_handling_when_tasks_run_concurrently_then_contexts_are_isolated(self) -> None:
+        first, second = MessageMetadata("First"), MessageMetadata("Second")
+
+        async def handle(parent: MessageMetadata) -> MessageMetadata:
+            with handling(parent):
+                await asyncio.sleep(0)
+                return MessageMetadata("Child")
+
+        async def main() -> list[MessageMetadata]:
+            return list(await asyncio.gather(handle(first), handle(second)))
+
+        children = asyncio.run(main())
+
+        assert [child.causation_id for child in children] == [
+            first.message_id,
+            second.message_id,
+        ]
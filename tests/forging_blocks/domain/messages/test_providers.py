@@ -0,0 +1,69 @@
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from forging_blocks.domain.messages.providers import CoarseClock, UuidV7Generator, system_clock
+
+
+class TestUuidV7Generator:
+    def test___call___when_called_then_returns_version_7_uuid(self) -> None:
+        uuid = UuidV7Generator()()
+
+        assert uuid.version == 7
+        assert uuid.variant == "specified in RFC 4122"
+
+    def test___call___when_called_repeatedly_then_uuids_strictly_increase(self) -> None:
+        generate = UuidV7Generator(batch_size=8)
+
+        uuids = [generate() for _ in range(1_000)]
+
+        assert uuids == sorted(uuids)
+        assert len(set(uuids)) == len(uuids)
+
+    def test___call___when_called_then_embeds_current_unix_millis(self) -> None:
+        before = int(datetime.now(timezone.utc).timestamp() * 1000)
+
+        uuid = UuidV7Generator()()
+
+        after = int(datetime.now(timezone.utc).timestamp() * 1000)
+        assert before - 1 <= uuid.int >> 80 <= after + 1
+
+    def test_allocate_when_count_given_then_returns_increasing_batch(self) -> None:
+        generate = UuidV7Generator()
+
+        batch = generate.allocate(100)
+        following = generate()
+
+        assert len(batch) == 100
+        assert batch == sorted(batch)
+        assert batch[-1] < following
+
+    def test___init___when_batch_size_not_positive_then_raises_value_error(self) -> None:
+        with pytest.raises(ValueError):
+            UuidV7Generator(batch_size=0)
+
+
+class TestCoarseClock:
+    def test___call___when_within_resolution_then_returns_cached_reading(self) -> None:
+        readings = iter(
+            [
+                datetime(2025, 1, 1, tzinfo=timezone.utc),
+                datetime(2025, 1, 2, tzinfo=timezone.utc),
+            ]
+        )
+        clock = CoarseClock(resolution=timedelta(hours=1), clock=lambda: next(readings))
+
+        assert clock() == clock() == datetime(2025, 1, 1, tzinfo=timezone.utc)
+
+    def test___call___when_resolution_elapsed_then_reads_clock_again(self) -> None:
+        calls: list[datetime] = []
+
+        def underlying() -> datetime:
+            calls.append(system_clock())
+            return calls[-1]
+
+        clock = CoarseClock(resolution=timedelta(0), clock=underlying)
+        clock()
+        clock()
+
+        assert len(calls) == 3
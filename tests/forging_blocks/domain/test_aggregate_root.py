@@ -55,6 +55,33 @@ class TestAggregateVersion:
         b = AggregateVersion(2)
         assert a != b
 
+    def test___init___when_value_already_exists_then_returns_shared_instance(self) -> None:
+        version = AggregateVersion(7)
+        assert AggregateVersion(6).increment() is version
+
+    def test_construct_many_when_values_are_valid_then_returns_interned_versions(
+        self,
+    ) -> None:
+        existing = AggregateVersion(4)
+        result = AggregateVersion.construct_many([4, 5])
+        assert result.is_ok
+        assert result.value[0] is existing
+        assert result.value[1] == AggregateVersion(5)
+        with pytest.raises(AttributeError):
+            result.value[1]._value = 6  # type: ignore
+
+    def test_construct_many_when_values_are_invalid_then_reports_each_row(self) -> None:
+        result = AggregateVersion.construct_many([1, -1, "2"])
+        assert result.is_err
+        messages = [field_errors.errors[0].message.value for field_errors in result.error]
+        assert [field_errors.field.value for field_errors in result.error] == ["1", "2"]
+        assert messages == ["Version cannot be negative", "Expected int, got str"]
+
+    def test___setattr___when_frozen_then_raises_attribute_error(self) -> None:
+        version = AggregateVersion(1)
+        with pytest.raises(AttributeError):
+            version._value = 2  # type: ignore
+
 
 class TestAggregateRoot:
     def test___init___when_id_is_none_then_raises_entity_id_none_error(self) -> None:
@@ -0,0 +1,146 @@
+import pytest
+
+from forging_blocks.domain.aggregate_root import AggregateVersion
+from forging_blocks.domain.value_object import ValueObject
+from forging_blocks.domain.value_object_array import ValueObjectArray
+
+
+class Price(ValueObject[float]):
+    def __init__(self, value: float):
+        super().__init__()
+        if value < 0:
+            raise ValueError("Price cannot be negative")
+        self._value = value
+        self._freeze()
+
+    @property
+    def value(self) -> float:
+        return self._value
+
+    def _equality_components(self) -> tuple[float]:
+        return (self._value,)
+
+
+def versions(*values: int) -> ValueObjectArray[AggregateVersion]:
+    result = ValueObjectArray.from_raw(AggregateVersion, values)
+    assert result.is_ok
+    return result.value
+
+
+class TestValueObjectArray:
+    def test___init___when_items_given_then_stores_raw_values(self) -> None:
+        array = ValueObjectArray(AggregateVersion, [AggregateVersion(1), AggregateVersion(2)])
+
+        assert len(array) == 2
+        assert array.raw.tolist() == [1, 2]
+        assert array.typecode == "q"
+        assert array.value_type is AggregateVersion
+
+    def test___init___when_item_has_other_type_then_raises_type_error(self) -> None:
+        with pytest.raises(TypeError):
+            ValueObjectArray(AggregateVersion, [Price(1.0)])  # type: ignore[list-item]
+
+    def test_from_raw_when_values_are_invalid_then_returns_err(self) -> None:
+        result = ValueObjectArray.from_raw(AggregateVersion, [1, -2, 3])
+
+        assert result.is_err
+        assert [field_errors.field.value for field_errors in result.error] == ["1"]
+
+    def test_from_raw_when_typecode_cannot_store_values_then_returns_err(self) -> None:
+        result = ValueObjectArray.from_raw(Price, [1, 1.5, 2**70], typecode="q")
+
+        assert result.is_err
+        assert [field_errors.field.value for field_errors in result.error] == ["1", "2"]
+        assert ValueObjectArray.from_raw(AggregateVersion, [1, 2**70]).is_err
+
+    def test_from_raw_when_type_has_no_column_validation_then_validates_by_construction(
+        self,
+    ) -> None:
+        ok = ValueObjectArray.from_raw(Price, [1.5, 2.5], typecode="d")
+        err = ValueObjectArray.from_raw(Price, [1.5, -2.5], typecode="d")
+
+        assert ok.is_ok
+        assert ok.value[1] == Price(2.5)
+        assert err.is_err
+
+    def test___getitem___when_index_then_returns_value_object(self) -> None:
+        array = versions(4, 5, 6)
+
+        assert array[1] == AggregateVersion(5)
+        assert array[-1] == AggregateVersion(6)
+
+    def test___getitem___when_slice_then_returns_array(self) -> None:
+        array = versions(4, 5, 6)
+
+        sliced = array[1:]
+
+        assert isinstance(sliced, ValueObjectArray)
+        assert sliced == versions(5, 6)
+
+    def test___iter___when_iterated_then_yields_value_objects(self) -> None:
+        assert list(versions(1, 2)) == [AggregateVersion(1), AggregateVersion(2)]
+
+    def test___eq___when_same_raw_values_then_returns_true(self) -> None:
+        assert versions(1, 2) == versions(1, 2)
+        assert versions(1, 2) != versions(2, 1)
+        assert versions(1) != [AggregateVersion(1)]
+
+    def test_comparison_when_arrays_differ_then_compares_lexicographically(self) -> None:
+        assert versions(1, 2) < versions(1, 3)
+        assert versions(1, 2) <= versions(1, 2)
+        assert versions(2) > versions(1, 9)
+        assert versions(2) >= versions(2)
+
+    def test_comparison_when_other_is_not_an_array_then_raises_type_error(self) -> None:
+        with pytest.raises(TypeError):
+            assert versions(1) < [AggregateVersion(2)]
+
+    def test_comparison_when_value_types_differ_then_raises_type_error(self) -> None:
+        prices = ValueObjectArray.from_raw(Price, [2], typecode="q").value
+
+        with pytest.raises(TypeError):
+            assert versions(1) <= prices
+
+    def test_min_max_when_called_then_return_value_objects(self) -> None:
+        array = versions(3, 1, 2)
+
+        assert array.min() == AggregateVersion(1)
+        assert array.max() == AggregateVersion(3)
+
+    def test_min_when_empty_then_raises_value_error(self) -> None:
+        with pytest.raises(ValueError):
+            versions().min()
+
+    def test_sort_when_called_then_sorts_in_place(self) -> None:
+        array = versions(3, 1, 2)
+
+        array.sort()
+        assert array == versions(1, 2, 3)
+
+        array.sort(reverse=True)
+        assert array == versions(3, 2, 1)
+
+    def test_append_extend_when_called_then_add_raw_values(self) -> None:
+        array = versions(1)
+
+        array.append(AggregateVersion(2))
+        array.extend([AggregateVersion(3), AggregateVersion(4)])
+
+        assert array.raw.tolist() == [1, 2, 3, 4]
+
+    def test_append_when_raw_view_alive_then_raises_buffer_error(self) -> None:
+        array = versions(1)
+
+        with array.raw:
+            with pytest.raises(BufferError):
+                array.append(AggregateVersion(2))
+        array.append(AggregateVersion(2))
+
+        assert len(array) == 2
+
+    def test_raw_when_accessed_then_is_read_only(self) -> None:
+        with pytest.raises(TypeError):
+            versions(1).raw[0] = 2
+
+    def test___repr___when_called_then_shows_type_and_values(self) -> None:
+        assert repr(versions(1, 2)) == "ValueObjectArray(AggregateVersion, [1, 2])"
@@ -1,6 +1,11 @@
+import copy
+import gc
+import pickle
+
 import pytest
 
-from forging_blocks.domain.value_object import ValueObject
+from forging_blocks.domain.value_object import InternPool, ValueObject
+from forging_blocks.foundation.errors.validation_error import CombinedValidationErrors
 
 
 class Email(ValueObject[str]):
@@ -60,3 +65,291 @@ class TestValueObject:
     def test_value_property_when_called_then_returns_underlying_value(self) -> None:
         e = Email("a@example.com")
         assert e.value == "a@example.com"
+
+
+class CachedEmail(ValueObject[str], cache_hash=True):
+    def __init__(self, value: str, freeze: bool = True):
+        super().__init__()
+        self._value = value
+        self.calls = 0
+        if freeze:
+            self._freeze()
+
+    @property
+    def value(self) -> str:
+        return self._value
+
+    def _equality_components(self) -> tuple[str]:
+        object.__setattr__(self, "calls", self.calls + 1)
+        return (self._value,)
+
+
+class WorkEmail(CachedEmail):
+    pass
+
+
+class CustomEqualityEmail(CachedEmail):
+    def __eq__(self, other: object) -> bool:
+        return True
+
+    def __hash__(self) -> int:
+        return 0
+
+
+class TestValueObjectCachedHash:
+    def test___hash___when_frozen_then_components_computed_once(self) -> None:
+        email = CachedEmail("a@example.com")
+
+        hash(email)
+        hash(email)
+
+        assert email.calls == 1
+        assert hash(email) == hash(("a@example.com",))
+
+    def test__freeze_when_cache_hash_then_defers_components_until_first_use(self) -> None:
+        email = CachedEmail("a@example.com")
+
+        assert email.calls == 0
+        hash(email)
+        assert email.calls == 1
+
+    def test___eq___when_frozen_then_uses_cached_components(self) -> None:
+        e1 = CachedEmail("a@example.com")
+        e2 = CachedEmail("a@example.com")
+
+        assert e1 == e2
+        assert e1 != CachedEmail("b@example.com")
+        assert (e1.calls, e2.calls) == (1, 1)
+
+    def test___eq___when_not_frozen_then_falls_back_to_components(self) -> None:
+        frozen = CachedEmail("a@example.com")
+        draft = CachedEmail("a@example.com", freeze=False)
+
+        assert frozen == draft
+        assert hash(frozen) == hash(draft)
+
+    def test___eq___when_other_is_different_type_then_returns_false(self) -> None:
+        assert CachedEmail("a@example.com") != Email("a@example.com")
+        assert CachedEmail("a@example.com") != "a@example.com"
+
+    def test___init_subclass___when_inherited_then_generates_equality_per_subclass(
+        self,
+    ) -> None:
+        assert WorkEmail.__eq__ is not CachedEmail.__eq__
+        assert WorkEmail("a@example.com") != CachedEmail("a@example.com")
+        assert WorkEmail("a@example.com") == WorkEmail("a@example.com")
+
+    def test___init_subclass___when_subclass_defines_equality_then_keeps_it(self) -> None:
+        email = CustomEqualityEmail("a@example.com")
+
+        assert email == "anything"
+        assert hash(email) == 0
+
+    def test___init_subclass___when_not_opted_in_then_keeps_default_equality(self) -> None:
+        assert Email.__eq__ is ValueObject.__eq__
+        assert Email.__hash__ is ValueObject.__hash__
+
+
+class Cents(ValueObject[int], compact=True):
+    __slots__ = ("_value",)
+
+    def __init__(self, value: int):
+        self._value = value
+        self._freeze()
+
+    @property
+    def value(self) -> int:
+        return self._value
+
+    def _equality_components(self) -> tuple[int]:
+        return (self._value,)
+
+
+class CachedCents(Cents, cache_hash=True):
+    __slots__ = ()
+
+
+class TestValueObjectCompact:
+    def test___init___when_compact_then_instance_has_no_dict(self) -> None:
+        cents = Cents(5)
+
+        assert not hasattr(cents, "__dict__")
+        assert isinstance(cents, Cents)
+        assert type(cents).__name__ == "Cents"
+
+    def test___setattr___when_compact_and_frozen_then_raises_attribute_error(self) -> None:
+        cents = Cents(5)
+
+        with pytest.raises(AttributeError):
+            cents._value = 6  # type: ignore
+
+    def test___delattr___when_compact_and_frozen_then_raises_attribute_error(self) -> None:
+        cents = Cents(5)
+
+        with pytest.raises(AttributeError):
+            del cents._value
+
+    def test___eq___when_compact_values_are_equal_then_returns_true(self) -> None:
+        assert Cents(5) == Cents(5)
+        assert hash(Cents(5)) == hash(Cents(5))
+        assert Cents(5) != Cents(6)
+
+    def test___str___when_compact_then_uses_class_name(self) -> None:
+        assert str(Cents(5)) == "Cents(5)"
+
+    def test___init_subclass___when_compact_without_slots_then_raises_type_error(
+        self,
+    ) -> None:
+        with pytest.raises(TypeError):
+
+            class Loose(ValueObject[int], compact=True):
+                @property
+                def value(self) -> int:
+                    return 0
+
+                def _equality_components(self) -> tuple[int]:
+                    return (0,)
+
+    def test___init_subclass___when_compact_and_cached_then_combines_both(self) -> None:
+        cents = CachedCents(5)
+
+        assert hash(cents) == hash((5,))
+        assert cents == CachedCents(5)
+        assert not hasattr(cents, "__dict__")
+
+    def test_pickle_when_compact_and_frozen_then_round_trips_frozen(self) -> None:
+        cents = CachedCents(5)
+
+        restored = pickle.loads(pickle.dumps(cents))
+
+        assert restored == cents
+        assert hash(restored) == hash(cents)
+        with pytest.raises(AttributeError):
+            restored._value = 6  # type: ignore
+
+    def test_deepcopy_when_frozen_then_returns_equal_frozen_copy(self) -> None:
+        email = Email("a@example.com")
+
+        copied = copy.deepcopy(email)
+
+        assert copied == email
+        with pytest.raises(AttributeError):
+            copied._value = "b@example.com"  # type: ignore
+
+
+class Status(ValueObject[str], interned=True):
+    def __init__(self, value: str):
+        super().__init__()
+        self._value = value
+        self._freeze()
+
+    @property
+    def value(self) -> str:
+        return self._value
+
+    def _equality_components(self) -> tuple[str]:
+        return (self._value,)
+
+
+class SubStatus(Status):
+    pass
+
+
+class TestValueObjectInterning:
+    def setup_method(self) -> None:
+        for cls in (Status, SubStatus):
+            pool = cls.intern_pool()
+            assert pool is not None
+            pool.clear()
+
+    def test___init___when_equal_value_is_alive_then_returns_canonical_instance(
+        self,
+    ) -> None:
+        first = Status("open")
+
+        second = Status("open")
+
+        assert second is first
+        assert Status("closed") is not first
+
+    def test___init___when_equal_values_differ_in_type_then_keeps_them_apart(
+        self,
+    ) -> None:
+        kept = [Status(True), Status(1), Status(1.0)]  # type: ignore[arg-type]
+
+        assert [type(status.value) for status in kept] == [bool, int, float]
+        assert Status(1) is kept[1]  # type: ignore[arg-type]
+
+    def test_intern_pool_when_constructing_then_counts_hits_and_misses(self) -> None:
+        kept = [Status("open"), Status("open"), Status("closed")]
+
+        pool = Status.intern_pool()
+
+        assert isinstance(pool, InternPool)
+        assert (pool.hits, pool.misses, len(pool)) == (1, 2, 2)
+        assert len(kept) == 3
+
+    def test_intern_pool_when_instances_are_released_then_drops_them(self) -> None:
+        Status("open")
+        gc.collect()
+
+        pool = Status.intern_pool()
+
+        assert pool is not None
+        assert len(pool) == 0
+
+    def test_intern_pool_when_subclassed_then_each_class_has_its_own_pool(self) -> None:
+        status = Status("open")
+        sub_status = SubStatus("open")
+
+        assert sub_status is not status
+        assert SubStatus.intern_pool() is not Status.intern_pool()
+
+    def test_intern_pool_when_not_interned_then_returns_none(self) -> None:
+        assert Email.intern_pool() is None
+        assert Email("a@example.com") is not Email("a@example.com")
+
+    def test___init_subclass___when_interned_without_weakref_then_raises_type_error(
+        self,
+    ) -> None:
+        with pytest.raises(TypeError):
+
+            class Code(ValueObject[int], compact=True, interned=True):
+                __slots__ = ("_value",)
+
+                @property
+                def value(self) -> int:
+                    return self._value
+
+                def _equality_components(self) -> tuple[int]:
+                    return (self._value,)
+
+
+class TestValueObjectConstructMany:
+    def test_construct_many_when_all_values_are_valid_then_returns_ok_instances(
+        self,
+    ) -> None:
+        result = Email.construct_many(iter(["a@example.com", "b@example.com"]))
+
+        assert result.is_ok
+        assert result.value == [Email("a@example.com"), Email("b@example.com")]
+
+    def test_construct_many_when_rows_fail_then_returns_err_indexing_failing_rows(
+        self,
+    ) -> None:
+        result = Email.construct_many(["a@example.com", "invalid", "b@example.com", "bad"])
+
+        assert result.is_err
+        error = result.error
+        assert isinstance(error, CombinedValidationErrors)
+        assert [field_errors.field.value for field_errors in error] == ["1", "3"]
+        assert [field_errors.errors[0].context["value"] for field_errors in error] == [
+            "invalid",
+            "bad",
+        ]
+
+    def test_construct_many_when_column_is_empty_then_returns_empty_ok(self) -> None:
+        result = Email.construct_many([])
+
+        assert result.is_ok
+        assert result.value == []
@@ -1,3 +1,5 @@
+import pickle
+
 from forging_blocks.foundation.errors.base import CombinedErrors, Error, FieldErrors
 from forging_blocks.foundation.errors.core import (
     ErrorMessage,
@@ -86,6 +88,15 @@ class TestError:
         )
         assert debug_string == expected_debug_string
 
+    def test_pickle_when_error_round_trips_then_keeps_message_and_metadata(self) -> None:
+        error = Error(ErrorMessage("An error occurred"), ErrorMetadata({"key": "value"}))
+
+        restored = pickle.loads(pickle.dumps(error))
+
+        assert type(restored) is Error
+        assert restored.message == ErrorMessage("An error occurred")
+        assert restored.context == {"key": "value"}
+
 
 class TestFieldErrors:
     def test_field_when_field_defined_then_returns_field_name(self) -> None:
@@ -274,3 +285,11 @@ class TestCombinedErrors:
 
         expected_errors = []
         assert actual_errors == expected_errors
+
+    def test_pickle_when_combined_errors_round_trip_then_keeps_errors(self) -> None:
+        error = Error(ErrorMessage("An error occurred"))
+        combined_errors = CombinedErrors(errors=[error])
+
+        restored = pickle.loads(pickle.dumps(combined_errors))
+
+        assert [str(inner) for inner in restored.errors] == ["Error: An error occurred"]
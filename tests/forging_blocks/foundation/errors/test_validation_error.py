@@ -14,6 +14,12 @@ class TestValidationError:
 
         assert isinstance(error, ValidationError)
 
+    def test_for_row_when_created_then_records_row_and_value(self) -> None:
+        error = ValidationError.for_row(-1, 3, "must be positive")
+
+        assert error.message == ErrorMessage("must be positive")
+        assert error.context == {"row": 3, "value": -1}
+
 
 class TestValidationFieldErrors:
     def test_constructor(self) -> None:
@@ -36,3 +42,15 @@ class TesCombinedValidationErrors:
         errors = CombinedValidationErrors([field_errors])
 
         assert isinstance(errors, CombinedValidationErrors)
+
+    def test_for_rows_when_created_then_references_rows_by_index_in_order(self) -> None:
+        first = ValidationError(ErrorMessage("first"))
+        second = ValidationError(ErrorMessage("second"))
+
+        errors = CombinedValidationErrors.for_rows({4: second, 1: first})
+
+        assert [field_errors.field for field_errors in errors] == [
+            FieldReference("1"),
+            FieldReference("4"),
+        ]
+        assert [list(field_errors) for field_errors in errors] == [[first], [second]]
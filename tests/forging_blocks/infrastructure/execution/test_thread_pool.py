@@ -0,0 +1,119 @@
+import asyncio
+import contextvars
+import threading
+from collections.abc import Iterator
+
+import pytest
+
+from forging_blocks.infrastructure.execution.thread_pool import (
+    ThreadPool,
+    cancellation_requested,
+)
+
+request_id: contextvars.ContextVar[str] = contextvars.ContextVar("request_id")
+
+
+@pytest.fixture
+def pool() -> Iterator[ThreadPool]:
+    pool = ThreadPool(max_workers=1, name="test-pool")
+    yield pool
+    pool.shutdown()
+
+
+async def wait_until(condition: threading.Event) -> None:
+    await asyncio.to_thread(condition.wait, 1)
+
+
+class TestThreadPool:
+    async def test_run_when_called_then_returns_result_from_worker_thread(
+        self, pool: ThreadPool
+    ) -> None:
+        assert await pool.run(threading.get_ident) != threading.get_ident()
+        assert pool.metrics().completed == 1
+
+    async def test_run_when_context_variable_set_then_visible_in_thread(
+        self, pool: ThreadPool
+    ) -> None:
+        request_id.set("req-1")
+
+        assert await pool.run(request_id.get) == "req-1"
+
+    async def test_run_when_function_raises_then_reraises_and_counts_failure(
+        self, pool: ThreadPool
+    ) -> None:
+        with pytest.raises(ZeroDivisionError):
+            await pool.run(divmod, 1, 0)
+
+        assert pool.metrics().failed == 1
+
+    async def test_metrics_when_threads_busy_then_reports_queue_depth(
+        self, pool: ThreadPool
+    ) -> None:
+        started, release = threading.Event(), threading.Event()
+
+        def block() -> None:
+            started.set()
+            release.wait(1)
+
+        running = asyncio.ensure_future(pool.run(block))
+        queued = asyncio.ensure_future(pool.run(block))
+        await wait_until(started)
+
+        metrics = pool.metrics()
+        assert (metrics.queued, metrics.running, pool.queue_depth) == (1, 1, 1)
+
+        release.set()
+        await asyncio.gather(running, queued)
+        assert pool.metrics().completed == 2
+
+    async def test_run_when_cancelled_while_queued_then_call_never_runs(
+        self, pool: ThreadPool
+    ) -> None:
+        started, release = threading.Event(), threading.Event()
+        calls: list[str] = []
+
+        def block() -> None:
+            started.set()
+            release.wait(1)
+
+        running = asyncio.ensure_future(pool.run(block))
+        queued = asyncio.ensure_future(pool.run(calls.append, "queued"))
+        await wait_until(started)
+
+        queued.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await queued
+        release.set()
+        await running
+
+        assert calls == []
+        assert pool.metrics().queued == 0
+        assert pool.metrics().cancelled == 1
+
+    async def test_run_when_cancelled_while_running_then_call_sees_cancellation(
+        self, pool: ThreadPool
+    ) -> None:
+        started, stopped = threading.Event(), threading.Event()
+
+        def poll() -> None:
+            started.set()
+            while not cancellation_requested():
+                threading.Event().wait(0.001)
+            stopped.set()
+
+        task = asyncio.ensure_future(pool.run(poll))
+        await wait_until(started)
+
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+        await wait_until(stopped)
+        assert stopped.is_set()
+
+    def test_cancellation_requested_when_outside_pool_then_returns_false(self) -> None:
+        assert cancellation_requested() is False
+
+    def test_init_when_no_workers_then_raises_value_error(self) -> None:
+        with pytest.raises(ValueError):
+            ThreadPool(max_workers=0)
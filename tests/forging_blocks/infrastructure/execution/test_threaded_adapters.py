@@ -0,0 +1,63 @@
+import threading
+from dataclasses import dataclass
+
+from forging_blocks.domain.messages.message_context import current_metadata
+from forging_blocks.infrastructure.execution.thread_pool import ThreadPool
+from forging_blocks.infrastructure.execution.threaded_adapters import (
+    ThreadedMessageHandler,
+    ThreadedUseCase,
+)
+from forging_blocks.infrastructure.messaging.in_memory_message_bus import InMemoryMessageBus
+from tests.forging_blocks.infrastructure.messaging.fakes import RegisterUser
+
+
+class BlockingRegisterUserHandler:
+    def handle(self, message: RegisterUser) -> tuple[str, int, bool]:
+        handled = current_metadata()
+        is_current = handled is not None and handled.message_id == message.message_id
+        return message.value, threading.get_ident(), is_current
+
+
+@dataclass
+class Greet:
+    name: str
+
+
+class BlockingGreeter:
+    def execute(self, request: Greet) -> str:
+        return f"Hello, {request.name}"
+
+
+class TestThreadedMessageHandler:
+    async def test_handle_when_dispatched_then_runs_in_thread_within_message_context(
+        self,
+    ) -> None:
+        handler = ThreadedMessageHandler(BlockingRegisterUserHandler())
+        bus = InMemoryMessageBus()
+        await bus.register_handler(handler, message_type=RegisterUser)
+
+        email, thread_id, is_current = await bus.dispatch(RegisterUser("ada@example.com"))
+
+        assert email == "ada@example.com"
+        assert thread_id != threading.get_ident()
+        assert is_current
+        handler.pool.shutdown()
+
+    def test_init_when_no_pool_given_then_creates_a_pool_per_handler(self) -> None:
+        first = ThreadedMessageHandler(BlockingRegisterUserHandler())
+        second = ThreadedMessageHandler(BlockingRegisterUserHandler())
+
+        assert first.pool is not second.pool
+        assert first.pool.name == "BlockingRegisterUserHandler"
+        assert first.pool.metrics().max_workers == 1
+
+
+class TestThreadedUseCase:
+    async def test_execute_when_pool_given_then_runs_use_case_in_it(self) -> None:
+        pool = ThreadPool(max_workers=2, name="greetings")
+        use_case = ThreadedUseCase(BlockingGreeter(), pool)
+
+        assert await use_case.execute(Greet("Ada")) == "Hello, Ada"
+        assert use_case.pool is pool
+        assert pool.metrics().completed == 1
+        pool.shutdown()
@@ -0,0 +1,134 @@
+"""Messages and handlers shared by the messaging tests."""
+
+import os
+from collections.abc import Sequence
+from typing import Any
+
+from forging_blocks.domain.messages.command import Command
+from forging_blocks.domain.messages.event import Event
+from forging_blocks.domain.messages.message import Message, MessageMetadata
+from forging_blocks.domain.messages.query import Query
+from forging_blocks.infrastructure.messaging.errors import HandlerFailedError
+
+
+class RegisterUser(Command[str]):
+    def __init__(self, email: str, metadata: MessageMetadata | None = None):
+        super().__init__(metadata)
+        self._email = email
+
+    @property
+    def value(self) -> str:
+        return self._email
+
+    @property
+    def _payload(self) -> dict[str, Any]:
+        return {"email": self._email}
+
+
+class GetUser(Query):
+    def __init__(self, email: str, metadata: MessageMetadata | None = None):
+        super().__init__(metadata)
+        self._email = email
+
+    @property
+    def value(self) -> str:
+        return self._email
+
+    @property
+    def _payload(self) -> dict[str, Any]:
+        return {"email": self._email}
+
+
+class UserEvent(Event[str]):
+    def __init__(self, user_id: str, metadata: MessageMetadata | None = None):
+        super().__init__(metadata)
+        self._user_id = user_id
+
+    @property
+    def user_id(self) -> str:
+        return self._user_id
+
+    @property
+    def value(self) -> str:
+        return self._user_id
+
+    @property
+    def _payload(self) -> dict[str, Any]:
+        return {"user_id": self._user_id}
+
+
+class UserRegistered(UserEvent):
+    pass
+
+
+class UserRenamed(UserEvent):
+    pass
+
+
+class RecordingHandler:
+    """Handler recording every message it receives, for any message type."""
+
+    def __init__(self, result: Any = None) -> None:
+        self.handled: list[Message[Any]] = []
+        self._result = result
+
+    async def handle(self, message: Message[Any]) -> Any:
+        self.handled.append(message)
+        return self._result
+
+
+class RegisterUserHandler(RecordingHandler):
+    async def handle(self, message: RegisterUser) -> Any:
+        return await super().handle(message)
+
+
+class GetUserHandler(RecordingHandler):
+    async def handle(self, message: GetUser) -> Any:
+        return await super().handle(message)
+
+
+class UserRegisteredHandler(RecordingHandler):
+    async def handle(self, message: UserRegistered) -> None:
+        await super().handle(message)
+
+
+class AnyEventHandler(RecordingHandler):
+    async def handle(self, message: Event[Any]) -> None:
+        await super().handle(message)
+
+
+class BatchUserEventHandler(AnyEventHandler):
+    def __init__(self) -> None:
+        super().__init__()
+        self.batches: list[list[Any]] = []
+
+    async def handle_batch(self, messages: Sequence[Any]) -> Sequence[None]:
+        self.batches.append(list(messages))
+        return [None] * len(messages)
+
+
+class FailingHandler(RecordingHandler):
+    def __init__(self, error: Exception) -> None:
+        super().__init__()
+        self._error = error
+
+    async def handle(self, message: Message[Any]) -> Any:
+        await super().handle(message)
+        raise self._error
+
+
+class ProcessInfoHandler:
+    """Handler reporting the process it runs in, for process pool tests."""
+
+    async def handle(self, message: RegisterUser) -> tuple[int, str, str]:
+        return os.getpid(), message.value, str(message.metadata.correlation_id)
+
+
+class ExplodingHandler:
+    async def handle(self, message: RegisterUser) -> None:
+        raise ValueError(message.value)
+
+
+class ErrorRaisingHandler:
+    async def handle(self, message: RegisterUser) -> None:
+        raise HandlerFailedError.from_exception(self, message, ValueError(message.value))
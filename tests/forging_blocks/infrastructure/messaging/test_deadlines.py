@@ -0,0 +1,165 @@
+import asyncio
+from datetime import timedelta
+from typing import Any
+
+import pytest
+
+from forging_blocks.domain.messages.message import MessageMetadata
+from forging_blocks.domain.messages.message_context import handling
+from forging_blocks.foundation.result import Err, Ok
+from forging_blocks.infrastructure.messaging.deadlines import DeadlineUseCase, before_deadline
+from forging_blocks.infrastructure.messaging.errors import (
+    DeadlineExceededError,
+    DispatchFailedError,
+)
+from forging_blocks.infrastructure.messaging.in_memory_message_bus import InMemoryMessageBus
+from forging_blocks.infrastructure.messaging.retry import (
+    ExponentialBackoff,
+    ScheduledRetryMiddleware,
+)
+from forging_blocks.infrastructure.messaging.timing_wheel import TimingWheel
+from tests.forging_blocks.infrastructure.messaging.fakes import (
+    AnyEventHandler,
+    FailingHandler,
+    GetUser,
+    GetUserHandler,
+    RegisterUser,
+    RegisterUserHandler,
+    UserRegistered,
+)
+
+
+def expiring(message_type: str, seconds: float) -> MessageMetadata:
+    return MessageMetadata(message_type, ttl=timedelta(seconds=seconds))
+
+
+class SlowRegisterUserHandler(RegisterUserHandler):
+    def __init__(self) -> None:
+        super().__init__()
+        self.cancelled = False
+
+    async def handle(self, message: RegisterUser) -> Any:
+        try:
+            await asyncio.sleep(1)
+        except asyncio.CancelledError:
+            self.cancelled = True
+            raise
+
+
+class LookupUseCase:
+    def __init__(self) -> None:
+        self.requests: list[str] = []
+
+    async def execute(self, request: str) -> str:
+        self.requests.append(request)
+        return request.upper()
+
+
+class TestBeforeDeadline:
+    async def test_before_deadline_when_no_deadline_then_awaits_call(self) -> None:
+        async def call() -> str:
+            return "done"
+
+        assert await before_deadline(MessageMetadata("GetUser"), call) == "done"
+
+    async def test_before_deadline_when_call_raises_timeout_then_reraises_it(self) -> None:
+        async def call() -> None:
+            raise TimeoutError("downstream timeout")
+
+        with pytest.raises(TimeoutError, match="downstream"):
+            await before_deadline(expiring("GetUser", 5), call)
+
+
+class TestDeadlineUseCase:
+    async def test_execute_when_handled_message_expired_then_raises_without_executing(
+        self,
+    ) -> None:
+        use_case = LookupUseCase()
+        wrapped = DeadlineUseCase(use_case)
+
+        with handling(expiring("GetUser", -1)), pytest.raises(DeadlineExceededError):
+            await wrapped.execute("ada")
+
+        assert use_case.requests == []
+
+    async def test_execute_when_within_deadline_then_returns_response(self) -> None:
+        wrapped = DeadlineUseCase(LookupUseCase())
+
+        with handling(expiring("GetUser", 5)):
+            assert await wrapped.execute("ada") == "ADA"
+
+
+class TestInMemoryMessageBusDeadlines:
+    async def test_dispatch_when_query_expired_then_raises_before_handling(self) -> None:
+        handler = GetUserHandler()
+        bus = InMemoryMessageBus()
+        await bus.register_handler(handler)
+
+        with pytest.raises(DeadlineExceededError):
+            await bus.dispatch(GetUser("ada@example.com", expiring("GetUser", -1)))
+
+        assert handler.handled == []
+
+    async def test_dispatch_when_deadline_passes_while_handling_then_cancels_handler(
+        self,
+    ) -> None:
+        handler = SlowRegisterUserHandler()
+        bus = InMemoryMessageBus()
+        await bus.register_handler(handler)
+
+        with pytest.raises(DeadlineExceededError):
+            await bus.dispatch(RegisterUser("a@example.com", expiring("RegisterUser", 0.01)))
+
+        assert handler.cancelled
+
+    async def test_dispatch_when_event_expired_then_still_handles_it_by_default(self) -> None:
+        handler = AnyEventHandler()
+        bus = InMemoryMessageBus()
+        await bus.register_handler(handler)
+
+        results = await bus.dispatch(UserRegistered("u-1", expiring("UserRegistered", -1)))
+
+        assert results == [Ok(None)]
+
+    async def test_dispatch_many_when_some_expired_then_fails_only_those(self) -> None:
+        handler = GetUserHandler(result="found")
+        bus = InMemoryMessageBus()
+        await bus.register_handler(handler)
+        late = GetUser("late@example.com", expiring("GetUser", -1))
+
+        with pytest.raises(DispatchFailedError) as raised:
+            await bus.dispatch_many([GetUser("ada@example.com"), late])
+
+        assert [query.value for query in handler.handled] == ["ada@example.com"]
+        [error] = raised.value
+        assert isinstance(error, DeadlineExceededError)
+        assert raised.value.results[0] == "found"
+
+    async def test_dispatch_when_events_enforced_then_returns_err_per_handler(self) -> None:
+        handler = AnyEventHandler()
+        bus = InMemoryMessageBus(deadline_types=(UserRegistered,))
+        await bus.register_handler(handler)
+
+        [outcome] = await bus.dispatch(UserRegistered("u-1", expiring("UserRegistered", -1)))
+
+        assert isinstance(outcome, Err)
+        assert isinstance(outcome.error, DeadlineExceededError)
+        assert handler.handled == []
+
+
+class TestScheduledRetryDeadlines:
+    async def test_call_when_retry_would_run_past_deadline_then_dead_letters(self) -> None:
+        retry = ScheduledRetryMiddleware(
+            wheel=TimingWheel(tick=0.001),
+            backoff=ExponentialBackoff(base=10, max_delay=10, random=lambda: 1.0),
+        )
+        bus = InMemoryMessageBus(middlewares=[retry])
+        await bus.register_handler(FailingHandler(ConnectionError("down")), UserRegistered)
+
+        [outcome] = await bus.dispatch(UserRegistered("u-1", expiring("UserRegistered", 1)))
+
+        assert isinstance(outcome, Err)
+        [letter] = retry.dead_letters
+        assert isinstance(letter.error, DeadlineExceededError)
+        assert isinstance(letter.error.__cause__, ConnectionError)
+        assert retry.pending == 0
@@ -0,0 +1,88 @@
+from typing import Any
+
+import pytest
+
+from forging_blocks.domain.messages.event import Event
+from forging_blocks.infrastructure.messaging.handler_registry import (
+    HandlerRegistry,
+    handled_types,
+)
+from tests.forging_blocks.infrastructure.messaging.fakes import (
+    AnyEventHandler,
+    RecordingHandler,
+    RegisterUser,
+    RegisterUserHandler,
+    UserRegistered,
+    UserRegisteredHandler,
+    UserRenamed,
+)
+
+
+class UnionHandler(RecordingHandler):
+    async def handle(self, message: UserRegistered | UserRenamed) -> None:
+        await super().handle(message)
+
+
+class UnannotatedHandler:
+    async def handle(self, message):  # type: ignore[no-untyped-def]
+        return None
+
+
+class TestHandledTypes:
+    def test_handled_types_when_annotated_then_returns_message_class(self) -> None:
+        assert handled_types(RegisterUserHandler()) == (RegisterUser,)
+
+    def test_handled_types_when_generic_annotation_then_returns_origin(self) -> None:
+        assert handled_types(AnyEventHandler()) == (Event,)
+
+    def test_handled_types_when_union_annotation_then_returns_each_member(self) -> None:
+        assert handled_types(UnionHandler()) == (UserRegistered, UserRenamed)
+
+    def test_handled_types_when_not_annotated_then_raises_type_error(self) -> None:
+        with pytest.raises(TypeError):
+            handled_types(UnannotatedHandler())  # type: ignore[arg-type]
+
+
+class TestHandlerRegistry:
+    def test_handlers_for_when_base_handler_registered_then_includes_it_after_specific(
+        self,
+    ) -> None:
+        registry = HandlerRegistry()
+        any_event = AnyEventHandler()
+        registered = UserRegisteredHandler()
+        registry.register(any_event)
+        registry.register(registered)
+
+        assert registry.handlers_for(UserRegistered("u-1")) == (registered, any_event)
+        assert registry.handlers_for(UserRenamed("u-1")) == (any_event,)
+        assert registry.handlers_for(RegisterUser("a@example.com")) == ()
+
+    def test_handlers_for_when_registered_by_name_then_routes_by_message_type(self) -> None:
+        registry = HandlerRegistry()
+        by_name = RecordingHandler()
+
+        assert registry.register(by_name, "UserRenamed") == ("UserRenamed",)
+
+        assert registry.handlers_for(UserRenamed("u-1")) == (by_name,)
+        assert registry.handlers_for(UserRegistered("u-1")) == ()
+
+    def test_handlers_for_when_registered_twice_for_related_types_then_deduplicates(
+        self,
+    ) -> None:
+        registry = HandlerRegistry()
+        handler = RecordingHandler()
+        registry.register(handler, UserRegistered)
+        registry.register(handler, Event)
+
+        assert registry.handlers_for(UserRegistered("u-1")) == (handler,)
+
+    def test_register_when_called_after_resolution_then_invalidates_cache(self) -> None:
+        registry = HandlerRegistry()
+        first: Any = AnyEventHandler()
+        registry.register(first)
+        assert registry.handlers_for(UserRegistered("u-1")) == (first,)
+
+        second = UserRegisteredHandler()
+        registry.register(second)
+
+        assert registry.handlers_for(UserRegistered("u-1")) == (second, first)
@@ -0,0 +1,296 @@
+import asyncio
+from collections.abc import Sequence
+from typing import Any
+
+import pytest
+
+from forging_blocks.domain.messages.event import Event
+from forging_blocks.domain.messages.message import MessageMetadata
+from forging_blocks.foundation.errors.base import Error
+from forging_blocks.foundation.errors.core import ErrorMessage
+from forging_blocks.foundation.result import Err, Ok
+from forging_blocks.infrastructure.messaging.errors import (
+    DispatchFailedError,
+    HandlerFailedError,
+    HandlerNotFoundError,
+)
+from forging_blocks.infrastructure.messaging.in_memory_message_bus import InMemoryMessageBus
+from tests.forging_blocks.infrastructure.messaging.fakes import (
+    AnyEventHandler,
+    BatchUserEventHandler,
+    FailingHandler,
+    GetUser,
+    GetUserHandler,
+    RecordingHandler,
+    RegisterUser,
+    RegisterUserHandler,
+    UserRegistered,
+    UserRegisteredHandler,
+    UserRenamed,
+)
+
+
+class EmittingHandler(RecordingHandler):
+    async def handle(self, message: RegisterUser) -> MessageMetadata:
+        await super().handle(message)
+        return MessageMetadata("UserRegistered")
+
+
+class BatchGetUserHandler(GetUserHandler):
+    async def handle_batch(self, messages: Sequence[GetUser]) -> Sequence[str]:
+        return [message.value.upper() for message in messages]
+
+
+class SlowEventHandler(AnyEventHandler):
+    """Handler tracking how many of its instances are handling an event at once."""
+
+    in_flight = 0
+    peak = 0
+
+    async def handle(self, message: Event[Any]) -> None:
+        SlowEventHandler.in_flight += 1
+        SlowEventHandler.peak = max(SlowEventHandler.peak, SlowEventHandler.in_flight)
+        await asyncio.sleep(0)
+        await super().handle(message)
+        SlowEventHandler.in_flight -= 1
+
+
+class RendezvousHandler(AnyEventHandler):
+    """Handler that only completes once every other rendezvous handler has started."""
+
+    def __init__(self, arrived: list[asyncio.Event], index: int) -> None:
+        super().__init__()
+        self._arrived = arrived
+        self._index = index
+
+    async def handle(self, message: Event[Any]) -> None:
+        self._arrived[self._index].set()
+        await asyncio.wait_for(asyncio.gather(*(event.wait() for event in self._arrived)), 1)
+        await super().handle(message)
+
+
+class TestInMemoryMessageBus:
+    async def test_dispatch_when_query_then_returns_handler_result(self) -> None:
+        bus = InMemoryMessageBus()
+        await bus.register_handler(GetUserHandler(result="Ada"))
+
+        assert await bus.dispatch(GetUser("ada@example.com")) == "Ada"
+
+    async def test_dispatch_when_command_then_calls_single_handler(self) -> None:
+        bus = InMemoryMessageBus()
+        handler = RegisterUserHandler()
+        await bus.register_handler(handler)
+        command = RegisterUser("ada@example.com")
+
+        await bus.dispatch(command)
+
+        assert handler.handled == [command]
+
+    async def test_dispatch_when_no_handler_for_command_then_raises(self) -> None:
+        bus = InMemoryMessageBus()
+
+        with pytest.raises(HandlerNotFoundError):
+            await bus.dispatch(RegisterUser("ada@example.com"))
+
+    async def test_dispatch_when_event_then_fans_out_to_specific_and_base_handlers(
+        self,
+    ) -> None:
+        bus = InMemoryMessageBus()
+        specific, generic, by_name = UserRegisteredHandler(), AnyEventHandler(), RecordingHandler()
+        await bus.register_handler(generic)
+        await bus.register_handler(specific)
+        await bus.register_handler(by_name, message_type="UserRegistered")
+        event = UserRegistered("u-1")
+
+        assert await bus.dispatch(event) == [Ok(None), Ok(None), Ok(None)]
+
+        assert specific.handled == generic.handled == by_name.handled == [event]
+
+    async def test_dispatch_when_event_has_no_handler_then_returns_no_results(self) -> None:
+        assert await InMemoryMessageBus().dispatch(UserRegistered("u-1")) == []
+
+    async def test_dispatch_when_event_has_several_handlers_then_runs_them_concurrently(
+        self,
+    ) -> None:
+        bus = InMemoryMessageBus()
+        arrived = [asyncio.Event() for _ in range(3)]
+        handlers = [RendezvousHandler(arrived, index) for index in range(3)]
+        for handler in handlers:
+            await bus.register_handler(handler)
+
+        results = await bus.dispatch(UserRegistered("u-1"))
+
+        assert results == [Ok(None)] * 3
+
+    async def test_dispatch_when_max_concurrency_set_then_limits_handlers_in_flight(
+        self,
+    ) -> None:
+        bus = InMemoryMessageBus(max_concurrency=2)
+        SlowEventHandler.in_flight = SlowEventHandler.peak = 0
+        handlers = [SlowEventHandler() for _ in range(5)]
+        for handler in handlers:
+            await bus.register_handler(handler)
+
+        await bus.dispatch(UserRegistered("u-1"))
+
+        assert SlowEventHandler.peak == 2
+        assert all(len(handler.handled) == 1 for handler in handlers)
+
+    def test_init_when_max_concurrency_below_one_then_raises_value_error(self) -> None:
+        with pytest.raises(ValueError):
+            InMemoryMessageBus(max_concurrency=0)
+
+    async def test_dispatch_when_event_handler_fails_then_returns_err_and_runs_others(
+        self,
+    ) -> None:
+        bus = InMemoryMessageBus()
+        error = Error(ErrorMessage("projection is stale"))
+        first, last = AnyEventHandler(), AnyEventHandler()
+        await bus.register_handler(first)
+        await bus.register_handler(FailingHandler(error), message_type=UserRegistered)
+        await bus.register_handler(last)
+        event = UserRegistered("u-1")
+
+        results = await bus.dispatch(event)
+
+        assert results == [Err(error), Ok(None), Ok(None)]
+        assert first.handled == last.handled == [event]
+
+    async def test_dispatch_when_event_handler_raises_non_error_then_wraps_it(self) -> None:
+        bus = InMemoryMessageBus()
+        cause = RuntimeError("boom")
+        await bus.register_handler(FailingHandler(cause), message_type=UserRegistered)
+
+        [result] = await bus.dispatch(UserRegistered("u-1"))
+
+        assert isinstance(result.error, HandlerFailedError)
+        assert result.error.__cause__ is cause
+        assert result.error.metadata.context["exception_type"] == "RuntimeError"
+
+    async def test_dispatch_when_command_handler_fails_then_raises(self) -> None:
+        bus = InMemoryMessageBus()
+        await bus.register_handler(FailingHandler(RuntimeError("boom")), message_type=RegisterUser)
+
+        with pytest.raises(RuntimeError):
+            await bus.dispatch(RegisterUser("ada@example.com"))
+
+    async def test_dispatch_when_handler_creates_message_then_joins_causal_chain(self) -> None:
+        bus = InMemoryMessageBus()
+        await bus.register_handler(EmittingHandler())
+        command = RegisterUser("ada@example.com")
+
+        emitted = await bus.dispatch(command)
+
+        assert emitted.causation_id == command.message_id
+        assert emitted.correlation_id == command.metadata.correlation_id
+
+    async def test_dispatch_many_when_events_then_each_handler_receives_them_in_order(
+        self,
+    ) -> None:
+        bus = InMemoryMessageBus()
+        generic, specific = AnyEventHandler(), UserRegisteredHandler()
+        await bus.register_handler(generic)
+        await bus.register_handler(specific)
+        events = [UserRegistered("u-1"), UserRenamed("u-1"), UserRegistered("u-2")]
+
+        results = await bus.dispatch_many(events)
+
+        assert results == [[Ok(None), Ok(None)], [Ok(None)], [Ok(None), Ok(None)]]
+        assert generic.handled == events
+        assert specific.handled == [events[0], events[2]]
+
+    async def test_dispatch_many_when_handler_supports_batches_then_calls_handle_batch_once(
+        self,
+    ) -> None:
+        bus = InMemoryMessageBus()
+        handler = BatchUserEventHandler()
+        await bus.register_handler(handler)
+        events = [UserRegistered("u-1"), UserRenamed("u-1")]
+
+        await bus.dispatch_many(events)
+
+        assert handler.batches == [events]
+        assert handler.handled == []
+
+    async def test_dispatch_many_when_mixed_messages_then_returns_results_in_input_order(
+        self,
+    ) -> None:
+        bus = InMemoryMessageBus()
+        await bus.register_handler(BatchGetUserHandler())
+        await bus.register_handler(RegisterUserHandler(result="registered"))
+
+        results = await bus.dispatch_many(
+            [GetUser("a"), RegisterUser("ada@example.com"), UserRegistered("u-1"), GetUser("b")]
+        )
+
+        assert results == ["A", "registered", [], "B"]
+
+    async def test_dispatch_many_when_batch_returns_too_few_results_then_fails_whole_batch(
+        self,
+    ) -> None:
+        class ShortBatchGetUserHandler(GetUserHandler):
+            async def handle_batch(self, messages: Sequence[GetUser]) -> Sequence[str]:
+                return ["A"]
+
+        bus = InMemoryMessageBus()
+        await bus.register_handler(ShortBatchGetUserHandler())
+
+        with pytest.raises(DispatchFailedError) as raised:
+            await bus.dispatch_many([GetUser("a"), GetUser("b")])
+
+        assert raised.value.failed == (0, 1)
+        assert all(isinstance(error, HandlerFailedError) for error in raised.value)
+
+    async def test_dispatch_many_when_batch_returns_too_many_results_then_fails_whole_batch(
+        self,
+    ) -> None:
+        class LongBatchUserEventHandler(AnyEventHandler):
+            async def handle_batch(self, messages: Sequence[Any]) -> Sequence[None]:
+                return [None] * (len(messages) + 1)
+
+        bus = InMemoryMessageBus()
+        await bus.register_handler(LongBatchUserEventHandler())
+
+        [[first], [second]] = await bus.dispatch_many([UserRegistered("u-1"), UserRenamed("u-1")])
+
+        assert isinstance(first, Err)
+        assert isinstance(second, Err)
+
+    async def test_dispatch_many_when_command_handler_fails_then_raises(self) -> None:
+        bus = InMemoryMessageBus()
+        await bus.register_handler(FailingHandler(RuntimeError("boom")), message_type=RegisterUser)
+
+        with pytest.raises(DispatchFailedError) as raised:
+            await bus.dispatch_many([RegisterUser("ada@example.com")])
+
+        [error] = raised.value
+        assert isinstance(error.__cause__, RuntimeError)
+
+    async def test_dispatch_many_when_command_handler_fails_then_handles_other_messages(
+        self,
+    ) -> None:
+        bus = InMemoryMessageBus()
+        handler = AnyEventHandler()
+        await bus.register_handler(FailingHandler(RuntimeError("boom")), message_type=RegisterUser)
+        await bus.register_handler(handler)
+        event = UserRegistered("u-1")
+
+        with pytest.raises(DispatchFailedError) as raised:
+            await bus.dispatch_many([RegisterUser("ada@example.com"), event])
+
+        failed, delivered = raised.value.results
+        assert isinstance(failed, Err)
+        assert delivered == [Ok(None)]
+        assert handler.handled == [event]
+
+    async def test_dispatch_many_when_command_has_no_handler_then_raises_before_handling(
+        self,
+    ) -> None:
+        bus = InMemoryMessageBus()
+        handler = AnyEventHandler()
+        await bus.register_handler(handler)
+
+        with pytest.raises(HandlerNotFoundError):
+            await bus.dispatch_many([UserRegistered("u-1"), RegisterUser("ada@example.com")])
+
+        assert handler.handled == []
@@ -0,0 +1,141 @@
+import asyncio
+from collections.abc import Sequence
+from typing import Any
+
+import pytest
+
+from forging_blocks.domain.messages.event import Event
+from forging_blocks.domain.messages.message import MessageMetadata
+from forging_blocks.domain.messages.message_context import current_metadata
+from forging_blocks.foundation.result import Err, Ok
+from forging_blocks.infrastructure.messaging.in_memory_message_bus import InMemoryMessageBus
+from forging_blocks.infrastructure.messaging.micro_batching_handler import MicroBatchingHandler
+from tests.forging_blocks.infrastructure.messaging.fakes import (
+    AnyEventHandler,
+    UserEvent,
+    UserRegistered,
+    UserRenamed,
+)
+
+
+class ProjectionHandler(AnyEventHandler):
+    """Batch handler rejecting whole batches that contain user ``bad``."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.batches: list[list[str]] = []
+
+    async def handle(self, message: Event[Any]) -> str:
+        if message.value == "bad":
+            raise ValueError("bad user")
+        await super().handle(message)
+        return message.value.upper()
+
+    async def handle_batch(self, messages: Sequence[Event[Any]]) -> list[str]:
+        if any(message.value == "bad" for message in messages):
+            raise ValueError("bad user in batch")
+        self.batches.append([message.value for message in messages])
+        return [message.value.upper() for message in messages]
+
+
+class ContextRecordingHandler(AnyEventHandler):
+    """Batch handler recording the message context each batch runs in."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.contexts: list[MessageMetadata | None] = []
+
+    async def handle_batch(self, messages: Sequence[Event[Any]]) -> list[None]:
+        self.contexts.append(current_metadata())
+        return [None] * len(messages)
+
+
+class TestMicroBatchingHandler:
+    async def test_handle_when_batch_size_reached_then_flushes_immediately(self) -> None:
+        projection = ProjectionHandler()
+        handler = MicroBatchingHandler(projection, max_batch_size=3, max_delay=60)
+
+        results = await asyncio.gather(
+            *(handler.handle(UserRegistered(user_id)) for user_id in ("a", "b", "c"))
+        )
+
+        assert results == ["A", "B", "C"]
+        assert projection.batches == [["a", "b", "c"]]
+
+    async def test_handle_when_flushed_by_dispatched_event_then_batch_runs_outside_its_context(
+        self,
+    ) -> None:
+        recording = ContextRecordingHandler()
+        bus = InMemoryMessageBus()
+        await bus.register_handler(
+            MicroBatchingHandler(recording, max_batch_size=1), message_type=UserEvent
+        )
+
+        await bus.dispatch(UserRegistered("a"))
+
+        assert recording.contexts == [None]
+
+    async def test_handle_when_delay_elapses_then_flushes_partial_batch(self) -> None:
+        projection = ProjectionHandler()
+        handler = MicroBatchingHandler(projection, max_batch_size=100, max_delay=0.001)
+
+        results = await asyncio.gather(
+            handler.handle(UserRegistered("a")), handler.handle(UserRenamed("a"))
+        )
+
+        assert results == ["A", "A"]
+        assert projection.batches == [["a", "a"]]
+        assert handler.pending == 0
+
+    async def test_handle_batch_when_several_batches_then_flushes_them_in_order(self) -> None:
+        projection = ProjectionHandler()
+        handler = MicroBatchingHandler(projection, max_batch_size=2, max_delay=60)
+        pending = asyncio.ensure_future(
+            handler.handle_batch([UserRegistered(user_id) for user_id in "abcde"])
+        )
+        await asyncio.sleep(0)
+
+        await handler.flush()
+
+        assert await pending == ["A", "B", "C", "D", "E"]
+        assert projection.batches == [["a", "b"], ["c", "d"], ["e"]]
+
+    async def test_handle_when_batch_fails_then_reports_outcome_per_event(self) -> None:
+        projection = ProjectionHandler()
+        handler = MicroBatchingHandler(projection, max_batch_size=3, max_delay=60)
+
+        results = await asyncio.gather(
+            *(handler.handle(UserRegistered(user_id)) for user_id in ("a", "bad", "c")),
+            return_exceptions=True,
+        )
+
+        assert results[0] == "A" and results[2] == "C"
+        assert isinstance(results[1], ValueError)
+        assert [event.value for event in projection.handled] == ["a", "c"]
+
+    async def test_dispatch_many_when_registered_on_bus_then_delivers_one_batch(self) -> None:
+        projection = ProjectionHandler()
+        bus = InMemoryMessageBus()
+        await bus.register_handler(
+            MicroBatchingHandler(projection, max_batch_size=10, max_delay=0.001),
+            message_type=UserEvent,
+        )
+
+        results = await bus.dispatch_many([UserRegistered("a"), UserRenamed("b")])
+
+        assert results == [[Ok("A")], [Ok("B")]]
+        assert projection.batches == [["a", "b"]]
+
+    async def test_dispatch_when_event_fails_then_bus_returns_its_err(self) -> None:
+        bus = InMemoryMessageBus()
+        await bus.register_handler(
+            MicroBatchingHandler(ProjectionHandler(), max_batch_size=1), message_type=UserEvent
+        )
+
+        [result] = await bus.dispatch(UserRegistered("bad"))
+
+        assert isinstance(result, Err)
+
+    def test_init_when_batch_size_below_one_then_raises_value_error(self) -> None:
+        with pytest.raises(ValueError):
+            MicroBatchingHandler(ProjectionHandler(), max_batch_size=0)
@@ -0,0 +1,181 @@
+import logging
+from typing import Any
+
+import pytest
+
+from forging_blocks.application.ports.outbound.unit_of_work import UnitOfWork
+from forging_blocks.domain.messages.command import Command
+from forging_blocks.domain.messages.event import Event
+from forging_blocks.domain.messages.message import Message
+from forging_blocks.foundation.result import Ok
+from forging_blocks.infrastructure.messaging.in_memory_message_bus import InMemoryMessageBus
+from forging_blocks.infrastructure.messaging.middleware import (
+    IdempotencyMiddleware,
+    LoggingMiddleware,
+    MetricsMiddleware,
+    NextHandler,
+    RetryMiddleware,
+    TransactionMiddleware,
+    compose,
+)
+from tests.forging_blocks.infrastructure.messaging.fakes import (
+    AnyEventHandler,
+    FailingHandler,
+    RegisterUser,
+    RegisterUserHandler,
+    UserRegistered,
+    UserRenamed,
+)
+
+
+class RecordingMiddleware:
+    def __init__(self, name: str, log: list[str], message_types: Any = (Message,)) -> None:
+        self.name = name
+        self.log = log
+        self.message_types = message_types
+
+    async def __call__(self, message: Message[Any], call_next: NextHandler) -> Any:
+        self.log.append(self.name)
+        return await call_next(message)
+
+
+class FlakyHandler(RegisterUserHandler):
+    def __init__(self, failures: int) -> None:
+        super().__init__(result="registered")
+        self._failures = failures
+
+    async def handle(self, message: RegisterUser) -> Any:
+        if self._failures:
+            self._failures -= 1
+            raise ConnectionError("database unavailable")
+        return await super().handle(message)
+
+
+class FakeUnitOfWork(UnitOfWork):
+    def __init__(self, log: list[str]) -> None:
+        self._log = log
+
+    @property
+    def session(self) -> None:
+        return None
+
+    async def commit(self) -> None:
+        self._log.append("commit")
+
+    async def rollback(self) -> None:
+        self._log.append("rollback")
+
+
+class BatchEventHandler(AnyEventHandler):
+    def __init__(self) -> None:
+        super().__init__()
+        self.batches: list[list[Any]] = []
+
+    async def handle_batch(self, messages: Any) -> list[None]:
+        self.batches.append(list(messages))
+        return [None] * len(messages)
+
+
+class TestCompose:
+    async def test_compose_when_middlewares_apply_then_first_one_is_outermost(self) -> None:
+        log: list[str] = []
+        handler = RegisterUserHandler(result="done")
+        pipeline = compose(
+            handler.handle,
+            [RecordingMiddleware("outer", log), RecordingMiddleware("inner", log)],
+            (RegisterUser,),
+        )
+
+        assert await pipeline(RegisterUser("a@example.com")) == "done"
+        assert log == ["outer", "inner"]
+
+    def test_compose_when_no_middleware_applies_then_returns_handler_unchanged(self) -> None:
+        handle = AnyEventHandler().handle
+        middleware = RecordingMiddleware("commands", [], message_types=(Command,))
+
+        assert compose(handle, [middleware], (Event,)) is handle
+
+    async def test_compose_when_middleware_applies_to_some_types_then_checks_each_message(
+        self,
+    ) -> None:
+        log: list[str] = []
+        middleware = RecordingMiddleware("registered", log, message_types=(UserRegistered,))
+        pipeline = compose(AnyEventHandler().handle, [middleware], (Event,))
+
+        await pipeline(UserRenamed("u-1"))
+        await pipeline(UserRegistered("u-1"))
+
+        assert log == ["registered"]
+
+
+class TestMiddlewaresOnBus:
+    async def test_dispatch_when_metrics_middleware_then_counts_and_times_calls(self) -> None:
+        metrics = MetricsMiddleware(clock=iter(range(100)).__next__)
+        bus = InMemoryMessageBus(middlewares=[metrics])
+        await bus.register_handler(RegisterUserHandler())
+        await bus.register_handler(FailingHandler(RuntimeError("boom")), message_type=UserRenamed)
+
+        await bus.dispatch(RegisterUser("a@example.com"))
+        await bus.dispatch(UserRenamed("u-1"))
+
+        stats = metrics.stats()
+        assert (stats["RegisterUser"].handled, stats["RegisterUser"].total_seconds) == (1, 1)
+        assert (stats["UserRenamed"].handled, stats["UserRenamed"].failed) == (0, 1)
+
+    async def test_dispatch_when_retry_middleware_then_retries_until_success(self) -> None:
+        bus = InMemoryMessageBus(middlewares=[RetryMiddleware(attempts=3)])
+        handler = FlakyHandler(failures=2)
+        await bus.register_handler(handler)
+
+        assert await bus.dispatch(RegisterUser("a@example.com")) == "registered"
+
+    async def test_dispatch_when_retries_exhausted_then_raises_last_error(self) -> None:
+        bus = InMemoryMessageBus(middlewares=[RetryMiddleware(attempts=2)])
+        await bus.register_handler(FlakyHandler(failures=2))
+
+        with pytest.raises(ConnectionError):
+            await bus.dispatch(RegisterUser("a@example.com"))
+
+    async def test_dispatch_when_command_repeated_then_idempotency_returns_first_result(
+        self,
+    ) -> None:
+        bus = InMemoryMessageBus(middlewares=[IdempotencyMiddleware()])
+        handler = RegisterUserHandler(result="registered")
+        await bus.register_handler(handler)
+        command = RegisterUser("a@example.com")
+
+        assert await bus.dispatch(command) == await bus.dispatch(command) == "registered"
+        assert handler.handled == [command]
+
+    async def test_dispatch_when_transaction_middleware_then_commits_or_rolls_back(
+        self,
+    ) -> None:
+        log: list[str] = []
+        bus = InMemoryMessageBus(middlewares=[TransactionMiddleware(lambda: FakeUnitOfWork(log))])
+        await bus.register_handler(RegisterUserHandler())
+        await bus.register_handler(FailingHandler(RuntimeError("boom")), message_type=Command)
+
+        await bus.dispatch(RegisterUser("a@example.com"))
+        await bus.dispatch(UserRegistered("u-1"))
+
+        assert log == ["commit"]
+
+    async def test_dispatch_when_logging_middleware_then_logs_handling_and_failures(
+        self, caplog: pytest.LogCaptureFixture
+    ) -> None:
+        bus = InMemoryMessageBus(middlewares=[LoggingMiddleware(level=logging.INFO)])
+        await bus.register_handler(FailingHandler(RuntimeError("boom")), message_type=UserRenamed)
+
+        with caplog.at_level(logging.INFO):
+            await bus.dispatch(UserRenamed("u-1"))
+
+        assert [record.levelno for record in caplog.records] == [logging.INFO, logging.ERROR]
+
+    async def test_dispatch_many_when_no_middleware_applies_then_keeps_batching(self) -> None:
+        bus = InMemoryMessageBus(middlewares=[IdempotencyMiddleware()])
+        handler = BatchEventHandler()
+        await bus.register_handler(handler)
+        events = [UserRegistered("u-1"), UserRenamed("u-1")]
+
+        assert await bus.dispatch_many(events) == [[Ok(None)], [Ok(None)]]
+        assert handler.batches == [events]
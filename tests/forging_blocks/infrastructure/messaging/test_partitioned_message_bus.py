@@ -0,0 +1,250 @@
+import asyncio
+from typing import Any
+
+import pytest
+
+from forging_blocks.domain.messages.event import Event
+from forging_blocks.domain.messages.message import MessageMetadata
+from forging_blocks.foundation.result import Err, Ok
+from forging_blocks.infrastructure.messaging.errors import (
+    DispatchFailedError,
+    HandlerNotFoundError,
+)
+from forging_blocks.infrastructure.messaging.partitioned_message_bus import (
+    PartitionedMessageBus,
+    default_partition_key,
+)
+from tests.forging_blocks.infrastructure.messaging.fakes import (
+    AnyEventHandler,
+    BatchUserEventHandler,
+    FailingHandler,
+    GetUser,
+    GetUserHandler,
+    RecordingHandler,
+    RegisterUser,
+    RegisterUserHandler,
+    UserRegistered,
+    UserRenamed,
+)
+
+
+class AccountOpened(Event[str]):
+    def __init__(self, aggregate_id: str, metadata: MessageMetadata | None = None):
+        super().__init__(metadata)
+        self._aggregate_id = aggregate_id
+
+    @property
+    def aggregate_id(self) -> str:
+        return self._aggregate_id
+
+    @property
+    def value(self) -> str:
+        return self._aggregate_id
+
+    @property
+    def _payload(self) -> dict[str, Any]:
+        return {"aggregate_id": self._aggregate_id}
+
+
+class JitteryHandler(AnyEventHandler):
+    """Handler taking longer for earlier messages, so unordered handling would show."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self._delays = iter([0.02, 0.01, 0.0, 0.0])
+
+    async def handle(self, message: Event[Any]) -> None:
+        await asyncio.sleep(next(self._delays))
+        await super().handle(message)
+
+
+class BlockingHandler(AnyEventHandler):
+    """Handler blocking events of user ``u-1`` until an event of ``u-2`` is handled."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.released = asyncio.Event()
+
+    async def handle(self, message: Event[Any]) -> None:
+        if message.value == "u-1":
+            await asyncio.wait_for(self.released.wait(), 1)
+        else:
+            self.released.set()
+        await super().handle(message)
+
+
+class LookingUpRegisterUserHandler(RegisterUserHandler):
+    """Handler querying the bus it is registered on before registering the user."""
+
+    def __init__(self, bus: PartitionedMessageBus) -> None:
+        super().__init__()
+        self._bus = bus
+
+    async def handle(self, message: RegisterUser) -> Any:
+        existing = await self._bus.dispatch(GetUser(message.value))
+        [follow_up] = await self._bus.dispatch_many([GetUser(message.value)])
+        return (existing, follow_up)
+
+
+class OpeningAccountHandler(RegisterUserHandler):
+    """Handler raising an event on another lane than the command it handles."""
+
+    def __init__(self, bus: PartitionedMessageBus, account_id: str) -> None:
+        super().__init__()
+        self._bus = bus
+        self._account_id = account_id
+
+    async def handle(self, message: RegisterUser) -> Any:
+        return await self._bus.dispatch(AccountOpened(self._account_id))
+
+
+class LookingUpAccountOpenedHandler(RecordingHandler):
+    """Handler querying the bus from the lane of the event it handles."""
+
+    def __init__(self, bus: PartitionedMessageBus) -> None:
+        super().__init__()
+        self._bus = bus
+
+    async def handle(self, message: AccountOpened) -> Any:
+        return await self._bus.dispatch(GetUser("ada@example.com"))
+
+
+def by_user_id(message: Any) -> str:
+    return message.user_id  # type: ignore[no-any-return]
+
+
+class TestDefaultPartitionKey:
+    def test_default_partition_key_when_event_has_aggregate_id_then_returns_it(self) -> None:
+        assert default_partition_key(AccountOpened("acc-1")) == "acc-1"
+
+    def test_default_partition_key_when_no_aggregate_id_then_returns_correlation_id(
+        self,
+    ) -> None:
+        command = RegisterUser("ada@example.com")
+
+        assert default_partition_key(command) == command.metadata.correlation_id
+        assert default_partition_key(UserRegistered("u-1")) is not None
+
+
+class TestPartitionedMessageBus:
+    async def test_dispatch_when_same_key_then_handles_messages_in_order(self) -> None:
+        handler = JitteryHandler()
+        async with PartitionedMessageBus(lanes=4, key=by_user_id) as bus:
+            await bus.register_handler(handler)
+            events = [UserRegistered("u-1"), UserRenamed("u-1"), UserRenamed("u-1")]
+
+            results = await bus.dispatch_many(events)
+
+        assert handler.handled == events
+        assert results == [[Ok(None)]] * 3
+
+    async def test_dispatch_when_different_keys_then_handles_them_concurrently(self) -> None:
+        handler = BlockingHandler()
+        async with PartitionedMessageBus(lanes=2, key=lambda m: int(m.value[-1])) as bus:
+            await bus.register_handler(handler)
+            first, second = UserRegistered("u-1"), UserRegistered("u-2")
+            assert bus.partition(first) != bus.partition(second)
+
+            await bus.dispatch_many([first, second])
+
+        assert handler.handled == [second, first]
+
+    async def test_dispatch_when_command_then_returns_handler_result(self) -> None:
+        async with PartitionedMessageBus() as bus:
+            await bus.register_handler(RegisterUserHandler(result="registered"))
+
+            assert await bus.dispatch(RegisterUser("ada@example.com")) == "registered"
+
+    async def test_dispatch_when_handler_dispatches_to_own_lane_then_handles_it_inline(
+        self,
+    ) -> None:
+        async with PartitionedMessageBus(lanes=4) as bus:
+            await bus.register_handler(LookingUpRegisterUserHandler(bus))
+            await bus.register_handler(GetUserHandler(result="none"))
+
+            result = await asyncio.wait_for(bus.dispatch(RegisterUser("ada@example.com")), 1)
+
+        assert result == ("none", "none")
+
+    async def test_dispatch_when_dispatches_cycle_back_to_origin_lane_then_handles_them_inline(
+        self,
+    ) -> None:
+        async with PartitionedMessageBus(lanes=4) as bus:
+            command = RegisterUser("ada@example.com")
+            origin = bus.partition(command)
+            account_id = next(
+                f"acc-{n}" for n in range(100) if bus.partition(AccountOpened(f"acc-{n}")) != origin
+            )
+            await bus.register_handler(OpeningAccountHandler(bus, account_id))
+            await bus.register_handler(LookingUpAccountOpenedHandler(bus))
+            await bus.register_handler(GetUserHandler(result="none"))
+
+            result = await asyncio.wait_for(bus.dispatch(command), 1)
+
+        assert result == [Ok("none")]
+
+    async def test_dispatch_many_when_handler_supports_batches_then_calls_it_once_per_lane(
+        self,
+    ) -> None:
+        handler = BatchUserEventHandler()
+        async with PartitionedMessageBus(lanes=4, key=by_user_id) as bus:
+            await bus.register_handler(handler)
+            events = [UserRegistered("u-1"), UserRenamed("u-1")]
+
+            results = await bus.dispatch_many(events)
+
+        assert handler.batches == [events]
+        assert results == [[Ok(None)]] * 2
+
+    async def test_dispatch_many_when_command_fails_then_raises_with_every_result(self) -> None:
+        async with PartitionedMessageBus(lanes=4) as bus:
+            await bus.register_handler(
+                FailingHandler(RuntimeError("boom")), message_type=RegisterUser
+            )
+            await bus.register_handler(GetUserHandler(result="none"))
+
+            with pytest.raises(DispatchFailedError) as raised:
+                await bus.dispatch_many(
+                    [RegisterUser("ada@example.com"), GetUser("ada@example.com")]
+                )
+
+        failed, found = raised.value.results
+        assert isinstance(failed, Err)
+        assert found == "none"
+        assert raised.value.failed == (0,)
+
+    async def test_dispatch_many_when_command_has_no_handler_then_raises_before_queueing(
+        self,
+    ) -> None:
+        handler = AnyEventHandler()
+        async with PartitionedMessageBus(lanes=4) as bus:
+            await bus.register_handler(handler)
+
+            with pytest.raises(HandlerNotFoundError):
+                await bus.dispatch_many([UserRegistered("u-1"), RegisterUser("ada@example.com")])
+
+        assert handler.handled == []
+
+    async def test_dispatch_when_handler_missing_then_raises_to_caller(self) -> None:
+        async with PartitionedMessageBus() as bus:
+            with pytest.raises(HandlerNotFoundError):
+                await bus.dispatch(RegisterUser("ada@example.com"))
+
+            await bus.register_handler(RegisterUserHandler(result="ok"))
+            assert await bus.dispatch(RegisterUser("ada@example.com")) == "ok"
+
+    async def test_aclose_when_messages_queued_then_handles_them_first(self) -> None:
+        handler = AnyEventHandler()
+        bus = PartitionedMessageBus(lanes=1)
+        await bus.register_handler(handler)
+        pending = asyncio.ensure_future(bus.dispatch(UserRegistered("u-1")))
+        await asyncio.sleep(0)
+
+        await bus.aclose()
+
+        assert await pending == [Ok(None)]
+        assert len(handler.handled) == 1
+
+    def test_init_when_no_lanes_then_raises_value_error(self) -> None:
+        with pytest.raises(ValueError):
+            PartitionedMessageBus(lanes=0)
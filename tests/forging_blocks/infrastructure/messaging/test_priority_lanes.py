@@ -0,0 +1,70 @@
+from collections import Counter
+from typing import Any
+
+import pytest
+
+from forging_blocks.domain.messages.command import Command
+from forging_blocks.domain.messages.message import Message
+from forging_blocks.domain.messages.query import Query
+from forging_blocks.infrastructure.messaging.priority_lanes import PriorityLanes
+from tests.forging_blocks.infrastructure.messaging.fakes import (
+    GetUser,
+    RegisterUser,
+    UserRegistered,
+)
+
+
+def fill(lanes: PriorityLanes[Any], message: Message[Any], count: int) -> None:
+    for _ in range(count):
+        lanes.append(message, message.metadata.message_type)
+
+
+class TestPriorityLanes:
+    def test_pop_when_all_lanes_busy_then_serves_them_by_weight_interleaved(self) -> None:
+        lanes: PriorityLanes[str] = PriorityLanes()
+        fill(lanes, GetUser("a"), 20)
+        fill(lanes, RegisterUser("a"), 20)
+        fill(lanes, UserRegistered("u-1"), 20)
+
+        served = [lanes.pop() for _ in range(13)]
+
+        assert Counter(served) == {"GetUser": 8, "RegisterUser": 4, "UserRegistered": 1}
+        assert served[:3] == ["GetUser", "RegisterUser", "GetUser"]
+
+    def test_pop_when_strict_then_serves_highest_priority_lane_first(self) -> None:
+        lanes: PriorityLanes[str] = PriorityLanes(strict=True)
+        fill(lanes, UserRegistered("u-1"), 2)
+        fill(lanes, RegisterUser("a"), 1)
+        fill(lanes, GetUser("a"), 1)
+
+        assert [lanes.pop() for _ in range(4)] == [
+            "GetUser",
+            "RegisterUser",
+            "UserRegistered",
+            "UserRegistered",
+        ]
+
+    def test_append_when_message_class_has_no_lane_then_uses_lowest_priority_lane(
+        self,
+    ) -> None:
+        lanes: PriorityLanes[str] = PriorityLanes({Query: 2, Command: 1})  # type: ignore[type-abstract]
+        lanes.append(UserRegistered("u-1"), "event")
+
+        assert lanes.depths() == {Query: 0, Command: 1}
+
+    def test_evict_when_lanes_busy_then_removes_oldest_of_lowest_priority_lane(self) -> None:
+        lanes: PriorityLanes[str] = PriorityLanes()
+        lanes.append(GetUser("a"), "query")
+        lanes.append(UserRegistered("u-1"), "first event")
+        lanes.append(UserRegistered("u-2"), "second event")
+
+        assert lanes.evict() == "first event"
+        assert len(lanes) == 2
+
+    def test_pop_when_empty_then_raises_index_error(self) -> None:
+        with pytest.raises(IndexError):
+            PriorityLanes().pop()
+
+    def test_init_when_weight_below_one_then_raises_value_error(self) -> None:
+        with pytest.raises(ValueError):
+            PriorityLanes({Query: 0})  # type: ignore[type-abstract]
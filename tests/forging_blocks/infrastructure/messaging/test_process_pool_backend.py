@@ -0,0 +1,83 @@
+import multiprocessing
+import os
+from collections.abc import AsyncIterator
+
+import pytest
+
+from forging_blocks.infrastructure.messaging.errors import HandlerFailedError
+from forging_blocks.infrastructure.messaging.in_memory_message_bus import InMemoryMessageBus
+from forging_blocks.infrastructure.messaging.process_pool_backend import ProcessPoolBackend
+from forging_blocks.infrastructure.serialization.binary_fields import StrField
+from forging_blocks.infrastructure.serialization.binary_message_codec import (
+    BinaryMessageCodec,
+    MessageSchema,
+)
+from tests.forging_blocks.infrastructure.messaging.fakes import (
+    ErrorRaisingHandler,
+    ExplodingHandler,
+    ProcessInfoHandler,
+    RegisterUser,
+)
+
+
+@pytest.fixture
+async def backend() -> AsyncIterator[ProcessPoolBackend]:
+    async with ProcessPoolBackend(
+        max_workers=1, mp_context=multiprocessing.get_context("spawn")
+    ) as backend:
+        yield backend
+
+
+class TestProcessPoolBackend:
+    async def test_dispatch_when_handler_runs_in_pool_then_returns_result_from_worker(
+        self, backend: ProcessPoolBackend
+    ) -> None:
+        bus = InMemoryMessageBus()
+        await bus.register_handler(backend.handler(ProcessInfoHandler), message_type=RegisterUser)
+        command = RegisterUser("ada@example.com")
+
+        pid, email, correlation_id = await bus.dispatch(command)
+
+        assert pid != os.getpid()
+        assert email == "ada@example.com"
+        assert correlation_id == str(command.metadata.correlation_id)
+
+    async def test_submit_when_handler_raises_then_reraises_in_caller(
+        self, backend: ProcessPoolBackend
+    ) -> None:
+        with pytest.raises(ValueError, match="ada@example.com"):
+            await backend.submit(ExplodingHandler, RegisterUser("ada@example.com"))
+
+    async def test_submit_when_handler_raises_error_then_reraises_it_and_pool_keeps_working(
+        self, backend: ProcessPoolBackend
+    ) -> None:
+        with pytest.raises(HandlerFailedError) as raised:
+            await backend.submit(ErrorRaisingHandler, RegisterUser("ada@example.com"))
+
+        pid, _, _ = await backend.submit(ProcessInfoHandler, RegisterUser("ada@example.com"))
+
+        assert raised.value.context["handler"] == "ErrorRaisingHandler"
+        assert pid != os.getpid()
+
+    async def test_enter_when_started_then_every_worker_is_spawned(self) -> None:
+        before = set(multiprocessing.active_children())
+
+        async with ProcessPoolBackend(
+            max_workers=2, mp_context=multiprocessing.get_context("spawn")
+        ):
+            spawned = set(multiprocessing.active_children()) - before
+
+        assert len(spawned) == 2
+
+    async def test_submit_when_codec_given_then_ships_encoded_message(self) -> None:
+        codec = BinaryMessageCodec([MessageSchema(RegisterUser, {"email": StrField()})])
+        command = RegisterUser("ada@example.com")
+        async with ProcessPoolBackend(
+            max_workers=1, codec=codec, mp_context=multiprocessing.get_context("spawn")
+        ) as backend:
+            handler = backend.handler(ProcessInfoHandler)
+
+            _, email, correlation_id = await handler.handle(command)
+
+        assert email == "ada@example.com"
+        assert correlation_id == str(command.metadata.correlation_id)
@@ -0,0 +1,279 @@
+import asyncio
+from typing import Any
+
+import pytest
+
+from forging_blocks.domain.messages.event import Event
+from forging_blocks.domain.messages.message import Message, MessageMetadata
+from forging_blocks.foundation.result import Err, Ok
+from forging_blocks.infrastructure.messaging.errors import (
+    DispatchFailedError,
+    MessageDroppedError,
+    QueueFullError,
+)
+from forging_blocks.infrastructure.messaging.priority_lanes import PriorityLanes
+from forging_blocks.infrastructure.messaging.queued_message_bus import (
+    DispatchMode,
+    OverflowPolicy,
+    QueuedMessageBus,
+    Superseded,
+)
+from tests.forging_blocks.infrastructure.messaging.fakes import (
+    AnyEventHandler,
+    BatchUserEventHandler,
+    FailingHandler,
+    GetUser,
+    GetUserHandler,
+    RegisterUser,
+    RegisterUserHandler,
+    UserRegistered,
+)
+
+
+class GatedHandler(AnyEventHandler):
+    """Handler waiting for ``gate`` before recording each event."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.gate = asyncio.Event()
+
+    async def handle(self, message: Event[Any]) -> None:
+        await asyncio.wait_for(self.gate.wait(), 1)
+        await super().handle(message)
+
+
+class InventoryLevelChanged(Event[int]):
+    def __init__(self, aggregate_id: str, level: int, metadata: MessageMetadata | None = None):
+        super().__init__(metadata)
+        self._aggregate_id = aggregate_id
+        self._level = level
+
+    @property
+    def aggregate_id(self) -> str:
+        return self._aggregate_id
+
+    @property
+    def value(self) -> int:
+        return self._level
+
+    @property
+    def _payload(self) -> dict[str, Any]:
+        return {"aggregate_id": self._aggregate_id, "level": self._level}
+
+
+async def settle() -> None:
+    for _ in range(5):
+        await asyncio.sleep(0)
+
+
+class TestQueuedMessageBus:
+    async def test_dispatch_when_fire_and_forget_then_returns_before_handling(self) -> None:
+        handler = GatedHandler()
+        async with QueuedMessageBus() as bus:
+            await bus.register_handler(handler)
+
+            assert await bus.dispatch(UserRegistered("u-1")) is None
+            assert handler.handled == []
+
+            handler.gate.set()
+            await bus.join()
+
+        assert len(handler.handled) == 1
+
+    async def test_dispatch_when_awaiting_completion_then_returns_handler_result(self) -> None:
+        async with QueuedMessageBus(mode=DispatchMode.AWAIT_COMPLETION) as bus:
+            await bus.register_handler(RegisterUserHandler(result="registered"))
+            await bus.register_handler(AnyEventHandler())
+
+            results = await bus.dispatch_many([RegisterUser("a@example.com"), UserRegistered("u")])
+
+        assert results == ["registered", [Ok(None)]]
+
+    async def test_dispatch_when_saturated_and_rejecting_then_raises_queue_full(self) -> None:
+        handler = GatedHandler()
+        bus = QueuedMessageBus(workers=1, high_watermark=1, overflow=OverflowPolicy.REJECT)
+        await bus.register_handler(handler)
+        await bus.dispatch(UserRegistered("u-1"))
+        await settle()
+        await bus.dispatch(UserRegistered("u-2"))
+
+        assert bus.saturated
+        with pytest.raises(QueueFullError):
+            await bus.dispatch(UserRegistered("u-3"))
+
+        handler.gate.set()
+        await bus.aclose()
+        assert [event.value for event in handler.handled] == ["u-1", "u-2"]
+
+    async def test_dispatch_when_saturated_and_dropping_oldest_then_fails_dropped_caller(
+        self,
+    ) -> None:
+        handler = GatedHandler()
+        bus = QueuedMessageBus(
+            workers=1,
+            high_watermark=1,
+            overflow=OverflowPolicy.DROP_OLDEST,
+            mode=DispatchMode.AWAIT_COMPLETION,
+        )
+        await bus.register_handler(handler)
+        first = asyncio.ensure_future(bus.dispatch(UserRegistered("u-1")))
+        await settle()
+        dropped = asyncio.ensure_future(bus.dispatch(UserRegistered("u-2")))
+        await settle()
+        last = asyncio.ensure_future(bus.dispatch(UserRegistered("u-3")))
+        await settle()
+
+        handler.gate.set()
+
+        with pytest.raises(MessageDroppedError):
+            await dropped
+        assert await first == await last == [Ok(None)]
+        await bus.aclose()
+        assert [event.value for event in handler.handled] == ["u-1", "u-3"]
+
+    async def test_dispatch_when_saturated_and_blocking_then_waits_for_low_watermark(
+        self,
+    ) -> None:
+        handler = GatedHandler()
+        bus = QueuedMessageBus(workers=1, high_watermark=2, low_watermark=0)
+        await bus.register_handler(handler)
+        for user_id in ("u-1", "u-2", "u-3"):
+            await bus.dispatch(UserRegistered(user_id))
+            await settle()
+        assert bus.saturated and bus.depth == 2
+
+        blocked = asyncio.ensure_future(bus.dispatch(UserRegistered("u-4")))
+        await settle()
+        assert not blocked.done()
+
+        handler.gate.set()
+        await blocked
+        await bus.aclose()
+
+        assert not bus.saturated
+        assert len(handler.handled) == 4
+
+    async def test_dispatch_when_priority_lanes_then_handles_queued_query_before_events(
+        self,
+    ) -> None:
+        events, queries = GatedHandler(), GetUserHandler()
+        queries.handled = events.handled
+        bus = QueuedMessageBus(workers=1, lanes=PriorityLanes(strict=True))
+        await bus.register_handler(events)
+        await bus.register_handler(queries)
+        for user_id in ("u-1", "u-2", "u-3"):
+            await bus.dispatch(UserRegistered(user_id))
+        await settle()
+        await bus.dispatch(GetUser("ada@example.com"))
+
+        events.gate.set()
+        await bus.join()
+
+        handled = [message.value for message in events.handled]
+        assert handled == ["u-1", "ada@example.com", "u-2", "u-3"]
+        await bus.aclose()
+
+    async def test_dispatch_when_coalescing_then_delivers_newest_event_in_place_of_pending_one(
+        self,
+    ) -> None:
+        handler = GatedHandler()
+        bus = QueuedMessageBus(
+            workers=1, mode=DispatchMode.AWAIT_COMPLETION, coalesce=[InventoryLevelChanged]
+        )
+        await bus.register_handler(handler)
+        first, second = InventoryLevelChanged("sku-1", 10), InventoryLevelChanged("sku-1", 8)
+        other, newest = InventoryLevelChanged("sku-2", 3), InventoryLevelChanged("sku-1", 5)
+        pending = [asyncio.ensure_future(bus.dispatch(first))]
+        await settle()
+        pending += [asyncio.ensure_future(bus.dispatch(event)) for event in (second, other)]
+        await settle()
+
+        pending.append(asyncio.ensure_future(bus.dispatch(newest)))
+        await settle()
+
+        assert pending[1].result() == Superseded(second.message_id, newest.message_id)
+        handler.gate.set()
+        assert await asyncio.gather(pending[0], pending[2], pending[3]) == [[Ok(None)]] * 3
+        assert handler.handled == [first, newest, other]
+        assert bus.superseded == 1
+        await bus.aclose()
+
+    async def test_dispatch_when_event_has_no_aggregate_id_then_never_coalesces(self) -> None:
+        handler = GatedHandler()
+        bus = QueuedMessageBus(workers=1, coalesce=[UserRegistered])
+        await bus.register_handler(handler)
+        for _ in range(3):
+            await bus.dispatch(UserRegistered("u-1"))
+
+        handler.gate.set()
+        await bus.aclose()
+
+        assert len(handler.handled) == 3
+        assert bus.superseded == 0
+
+    async def test_dispatch_when_fire_and_forget_handler_fails_then_reports_error(self) -> None:
+        failures: list[tuple[Message[Any], Exception]] = []
+        error = RuntimeError("boom")
+        command = RegisterUser("a@example.com")
+        async with QueuedMessageBus(on_error=lambda m, e: failures.append((m, e))) as bus:
+            await bus.register_handler(FailingHandler(error), message_type=RegisterUser)
+
+            await bus.dispatch(command)
+
+        assert failures == [(command, error)]
+
+    async def test_dispatch_many_when_handler_supports_batches_then_calls_it_once_per_lane(
+        self,
+    ) -> None:
+        handler = BatchUserEventHandler()
+        events = [UserRegistered("u-1"), UserRegistered("u-2")]
+        async with QueuedMessageBus(workers=2, mode=DispatchMode.AWAIT_COMPLETION) as bus:
+            await bus.register_handler(handler)
+
+            results = await bus.dispatch_many(events)
+
+        assert handler.batches == [events]
+        assert results == [[Ok(None)]] * 2
+
+    async def test_dispatch_many_when_command_fails_then_raises_with_every_result(self) -> None:
+        events = AnyEventHandler()
+        async with QueuedMessageBus(
+            lanes=PriorityLanes(), mode=DispatchMode.AWAIT_COMPLETION
+        ) as bus:
+            await bus.register_handler(
+                FailingHandler(RuntimeError("boom")), message_type=RegisterUser
+            )
+            await bus.register_handler(events)
+
+            with pytest.raises(DispatchFailedError) as raised:
+                await bus.dispatch_many([RegisterUser("a@example.com"), UserRegistered("u-1")])
+
+        failed, delivered = raised.value.results
+        assert isinstance(failed, Err)
+        assert delivered == [Ok(None)]
+        assert raised.value.failed == (0,)
+
+    async def test_dispatch_many_when_fire_and_forget_commands_fail_then_reports_each(
+        self,
+    ) -> None:
+        failures: list[tuple[Message[Any], Exception]] = []
+        commands = [RegisterUser("a@example.com"), RegisterUser("b@example.com")]
+        async with QueuedMessageBus(on_error=lambda m, e: failures.append((m, e))) as bus:
+            await bus.register_handler(
+                FailingHandler(RuntimeError("boom")), message_type=RegisterUser
+            )
+
+            assert await bus.dispatch_many(commands) == [None, None]
+
+        assert [message for message, _ in failures] == commands
+        assert all(isinstance(error.__cause__, RuntimeError) for _, error in failures)
+
+    @pytest.mark.parametrize(
+        "options",
+        [{"workers": 0}, {"high_watermark": 0}, {"high_watermark": 2, "low_watermark": 3}],
+    )
+    def test_init_when_invalid_options_then_raises_value_error(
+        self, options: dict[str, int]
+    ) -> None:
+        with pytest.raises(ValueError):
+            QueuedMessageBus(**options)  # type: ignore[arg-type]
@@ -0,0 +1,236 @@
+import asyncio
+from typing import Any
+
+import pytest
+
+from forging_blocks.domain.messages.event import Event
+from forging_blocks.domain.messages.message import MessageMetadata
+from forging_blocks.foundation.result import Err, Ok
+from forging_blocks.infrastructure.messaging.errors import RateLimitExceededError
+from forging_blocks.infrastructure.messaging.priority_lanes import PriorityLanes
+from forging_blocks.infrastructure.messaging.queued_message_bus import (
+    DispatchMode,
+    QueuedMessageBus,
+)
+from forging_blocks.infrastructure.messaging.rate_limiting import (
+    RateLimit,
+    RateLimitedMessageBus,
+    ThrottlePolicy,
+    TokenBucket,
+)
+from tests.forging_blocks.infrastructure.messaging.fakes import (
+    AnyEventHandler,
+    RegisterUser,
+    RegisterUserHandler,
+    UserRegistered,
+)
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TenantImported(Event[str]):
+    def __init__(self, tenant_id: str, metadata: MessageMetadata | None = None) -> None:
+        super().__init__(metadata)
+        self._tenant_id = tenant_id
+
+    @property
+    def tenant_id(self) -> str:
+        return self._tenant_id
+
+    @property
+    def value(self) -> str:
+        return self._tenant_id
+
+    @property
+    def _payload(self) -> dict[str, Any]:
+        return {"tenant_id": self._tenant_id}
+
+
+class TestTokenBucket:
+    def test_reserve_when_burst_spent_then_returns_wait_until_refill(self) -> None:
+        clock = FakeClock()
+        bucket = TokenBucket(rate=10, burst=2, clock=clock)
+
+        waits = [bucket.reserve() for _ in range(4)]
+
+        assert waits == pytest.approx([0, 0, 0.1, 0.2])
+
+    def test_wait_time_when_time_passes_then_refills_up_to_burst(self) -> None:
+        clock = FakeClock()
+        bucket = TokenBucket(rate=10, burst=2, clock=clock)
+        bucket.reserve()
+        bucket.reserve()
+        assert bucket.wait_time() == pytest.approx(0.1)
+
+        clock.now = 60
+
+        assert (bucket.wait_time(), bucket.tokens) == (0, 2)
+
+
+class TestRateLimitedMessageBus:
+    async def test_dispatch_when_shedding_then_returns_err_over_limit(self) -> None:
+        clock = FakeClock()
+        bus = RateLimitedMessageBus(
+            limits={UserRegistered: RateLimit(rate=1, burst=2)},
+            policy=ThrottlePolicy.SHED,
+            clock=clock,
+        )
+        await bus.register_handler(AnyEventHandler())
+
+        results = [await bus.dispatch(UserRegistered("u")) for _ in range(3)]
+
+        assert results[:2] == [[Ok(None)], [Ok(None)]]
+        assert isinstance(results[2], Err)
+        assert isinstance(results[2].error, RateLimitExceededError)
+        assert results[2].error.context["limit"] == "UserRegistered"
+        stats = bus.stats()["UserRegistered"]
+        assert (stats.admitted, stats.shed) == (2, 1)
+
+    async def test_dispatch_when_limit_by_message_type_name_then_other_types_pass(
+        self,
+    ) -> None:
+        bus = RateLimitedMessageBus(
+            limits={"RegisterUser": RateLimit(rate=1, burst=1)},
+            policy=ThrottlePolicy.SHED,
+            clock=FakeClock(),
+        )
+        await bus.register_handler(RegisterUserHandler(result="ok"))
+        await bus.register_handler(AnyEventHandler())
+
+        commands = [await bus.dispatch(RegisterUser("a@example.com")) for _ in range(2)]
+        events = [await bus.dispatch(UserRegistered("u")) for _ in range(2)]
+
+        assert commands[0] == "ok" and isinstance(commands[1], Err)
+        assert events == [[Ok(None)], [Ok(None)]]
+
+    async def test_dispatch_when_tenant_over_limit_then_only_that_tenant_is_shed(self) -> None:
+        bus = RateLimitedMessageBus(
+            tenant_limit=RateLimit(rate=1, burst=1),
+            policy=ThrottlePolicy.SHED,
+            clock=FakeClock(),
+        )
+        await bus.register_handler(AnyEventHandler(), message_type=TenantImported)
+
+        noisy = [await bus.dispatch(TenantImported("acme")) for _ in range(2)]
+        quiet = await bus.dispatch(TenantImported("globex"))
+
+        assert noisy[0] == [Ok(None)] and isinstance(noisy[1], Err)
+        assert noisy[1].error.context["limit"] == "tenant:acme"
+        assert quiet == [Ok(None)]
+
+    async def test_dispatch_when_delaying_then_waits_for_token(self) -> None:
+        bus = RateLimitedMessageBus(limits={UserRegistered: RateLimit(rate=200, burst=1)})
+        handler = AnyEventHandler()
+        await bus.register_handler(handler)
+
+        await bus.dispatch_many([UserRegistered("u-1"), UserRegistered("u-2")])
+        await bus.dispatch(UserRegistered("u-3"))
+
+        stats = bus.stats()["UserRegistered"]
+        assert (stats.admitted, stats.delayed) == (1, 2)
+        assert stats.delay_seconds > 0
+        assert len(handler.handled) == 3
+
+    async def test_dispatch_when_delay_exceeds_max_delay_then_sheds(self) -> None:
+        bus = RateLimitedMessageBus(
+            limits={UserRegistered: RateLimit(rate=1, burst=1)},
+            max_delay=0.5,
+            clock=FakeClock(),
+        )
+        await bus.register_handler(AnyEventHandler())
+
+        await bus.dispatch(UserRegistered("u-1"))
+        outcome = await bus.dispatch(UserRegistered("u-2"))
+
+        assert isinstance(outcome, Err)
+        assert outcome.error.context["retry_in"] == pytest.approx(1.0)
+
+    async def test_dispatch_when_downgrading_then_queues_in_lowest_lane(self) -> None:
+        handler = AnyEventHandler()
+        gate = asyncio.Event()
+
+        class GatedRegisterUserHandler(RegisterUserHandler):
+            async def handle(self, message: RegisterUser) -> Any:
+                await gate.wait()
+                handler.handled.append(message)
+
+        queued = QueuedMessageBus(workers=1, lanes=PriorityLanes(strict=True))
+        bus = RateLimitedMessageBus(
+            queued,
+            limits={RegisterUser: RateLimit(rate=1, burst=1)},
+            policy=ThrottlePolicy.DOWNGRADE,
+            clock=FakeClock(),
+        )
+        await bus.register_handler(GatedRegisterUserHandler())
+        await bus.register_handler(handler)
+        first, downgraded = RegisterUser("a@example.com"), RegisterUser("b@example.com")
+
+        await bus.dispatch(first)
+        await asyncio.sleep(0)
+        event = UserRegistered("u-1")
+        await bus.dispatch(event)
+        await bus.dispatch(downgraded)
+        gate.set()
+        await queued.aclose()
+
+        assert handler.handled == [first, event, downgraded]
+        assert bus.stats()["RegisterUser"].downgraded == 1
+
+    async def test_dispatch_many_when_downgrading_then_queues_messages_together(self) -> None:
+        running = 0
+        peak = 0
+
+        class SlowRegisterUserHandler(RegisterUserHandler):
+            async def handle(self, message: RegisterUser) -> Any:
+                nonlocal running, peak
+                running += 1
+                peak = max(peak, running)
+                await asyncio.sleep(0.01)
+                running -= 1
+                return message.value
+
+        queued = QueuedMessageBus(
+            workers=3, lanes=PriorityLanes(), mode=DispatchMode.AWAIT_COMPLETION
+        )
+        bus = RateLimitedMessageBus(
+            queued,
+            limits={RegisterUser: RateLimit(rate=1, burst=1)},
+            policy=ThrottlePolicy.DOWNGRADE,
+            clock=FakeClock(),
+        )
+        await bus.register_handler(SlowRegisterUserHandler())
+        emails = ["a@example.com", "b@example.com", "c@example.com"]
+
+        results = await bus.dispatch_many([RegisterUser(email) for email in emails])
+        await queued.aclose()
+
+        assert results == emails
+        assert peak == 2
+        assert bus.stats()["RegisterUser"].downgraded == 2
+
+    async def test_dispatch_when_more_tenants_than_max_tenants_then_drops_least_recent(
+        self,
+    ) -> None:
+        bus = RateLimitedMessageBus(
+            tenant_limit=RateLimit(rate=1, burst=1),
+            policy=ThrottlePolicy.SHED,
+            clock=FakeClock(),
+            max_tenants=1,
+        )
+        await bus.register_handler(AnyEventHandler(), message_type=TenantImported)
+        await bus.dispatch(TenantImported("acme"))
+        assert isinstance(await bus.dispatch(TenantImported("acme")), Err)
+
+        await bus.dispatch(TenantImported("globex"))
+
+        assert await bus.dispatch(TenantImported("acme")) == [Ok(None)]
+
+    def test_init_when_downgrading_without_queue_then_raises_value_error(self) -> None:
+        with pytest.raises(ValueError):
+            RateLimitedMessageBus(policy=ThrottlePolicy.DOWNGRADE)
@@ -0,0 +1,200 @@
+import asyncio
+from typing import Any
+
+import pytest
+
+from forging_blocks.domain.messages.event import Event
+from forging_blocks.foundation.result import Err
+from forging_blocks.infrastructure.messaging.errors import CircuitOpenError, ConcurrencyLimitError
+from forging_blocks.infrastructure.messaging.in_memory_message_bus import InMemoryMessageBus
+from forging_blocks.infrastructure.messaging.resilience import (
+    AdaptiveConcurrencyLimit,
+    CircuitBreaker,
+    CircuitBreakerMiddleware,
+    CircuitState,
+)
+from tests.forging_blocks.infrastructure.messaging.fakes import (
+    AnyEventHandler,
+    FailingHandler,
+    RegisterUser,
+    UserRegistered,
+)
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class BlockedHandler(AnyEventHandler):
+    def __init__(self) -> None:
+        super().__init__()
+        self.gate = asyncio.Event()
+
+    async def handle(self, message: Event[Any]) -> None:
+        await asyncio.wait_for(self.gate.wait(), 1)
+        await super().handle(message)
+
+
+class TestCircuitBreaker:
+    def test_record_when_failure_rate_reached_then_opens(self) -> None:
+        breaker = CircuitBreaker(failure_rate=0.5, window=4, minimum_calls=4)
+        for failed in (False, True, False):
+            breaker.record(0.0, failed)
+        assert breaker.state is CircuitState.CLOSED
+
+        breaker.record(0.0, failed=True)
+
+        assert breaker.state is CircuitState.OPEN
+        assert not breaker.allow()
+
+    def test_record_when_calls_are_slow_then_counts_them_as_bad(self) -> None:
+        breaker = CircuitBreaker(slow_call_duration=1.0, window=2, minimum_calls=2)
+
+        breaker.record(1.5, failed=False)
+        breaker.record(2.0, failed=False)
+
+        assert breaker.state is CircuitState.OPEN
+
+    def test_allow_when_open_duration_passed_then_lets_one_probe_through(self) -> None:
+        clock = FakeClock()
+        breaker = CircuitBreaker(window=1, minimum_calls=1, open_duration=10, clock=clock)
+        breaker.record(0.0, failed=True)
+        clock.now = 4
+        assert breaker.retry_in == 6
+
+        clock.now = 10
+
+        assert breaker.state is CircuitState.HALF_OPEN
+        assert breaker.allow() is not None
+        assert breaker.allow() is None
+
+    @pytest.mark.parametrize(("failed", "state"), [(False, "closed"), (True, "open")])
+    def test_record_when_probe_finishes_then_closes_or_reopens(
+        self, failed: bool, state: str
+    ) -> None:
+        clock = FakeClock()
+        breaker = CircuitBreaker(window=1, minimum_calls=1, open_duration=1, clock=clock)
+        breaker.record(0.0, failed=True)
+        clock.now = 1
+        probe = breaker.allow()
+
+        breaker.record(0.0, failed, probe)
+
+        assert breaker.state is CircuitState(state)
+
+    def test_record_when_earlier_call_ends_during_probe_then_leaves_state_to_probe(
+        self,
+    ) -> None:
+        clock = FakeClock()
+        breaker = CircuitBreaker(window=4, minimum_calls=1, open_duration=1, clock=clock)
+        earlier = breaker.allow()
+        breaker.record(0.0, failed=True)
+        clock.now = 1
+        probe = breaker.allow()
+
+        breaker.record(5.0, failed=False, permit=earlier)
+
+        assert breaker.state is CircuitState.HALF_OPEN
+        assert breaker.allow() is None
+        breaker.record(0.0, failed=False, permit=probe)
+        assert breaker.state is CircuitState.CLOSED
+
+
+class TestAdaptiveConcurrencyLimit:
+    def test_release_when_calls_are_fast_then_grows_limit_additively(self) -> None:
+        limiter = AdaptiveConcurrencyLimit(initial=2, latency_target=0.1)
+        for _ in range(5):
+            assert limiter.try_acquire()
+            limiter.release(0.01)
+
+        assert limiter.limit == 3
+
+    def test_release_when_call_is_slow_then_shrinks_limit_multiplicatively(self) -> None:
+        limiter = AdaptiveConcurrencyLimit(initial=10, latency_target=0.1, backoff=0.5)
+        limiter.try_acquire()
+
+        limiter.release(0.5)
+
+        assert (limiter.limit, limiter.in_flight) == (5, 0)
+
+    def test_try_acquire_when_limit_reached_then_rejects(self) -> None:
+        limiter = AdaptiveConcurrencyLimit(initial=1)
+
+        assert [limiter.try_acquire(), limiter.try_acquire()] == [True, False]
+
+    def test_release_when_failures_persist_then_stops_at_minimum(self) -> None:
+        limiter = AdaptiveConcurrencyLimit(initial=4, minimum=2, backoff=0.5)
+        for _ in range(5):
+            limiter.try_acquire()
+            limiter.release(0.0, failed=True)
+
+        assert limiter.limit == 2
+
+
+class TestCircuitBreakerMiddleware:
+    async def test_dispatch_when_circuit_open_then_returns_err_without_calling(self) -> None:
+        health = CircuitBreakerMiddleware(breaker=lambda: CircuitBreaker(window=2, minimum_calls=2))
+        handler = FailingHandler(ConnectionError("search index down"))
+        bus = InMemoryMessageBus(middlewares=[health])
+        await bus.register_handler(handler, message_type=UserRegistered)
+        for _ in range(2):
+            await bus.dispatch(UserRegistered("u-1"))
+
+        [outcome] = await bus.dispatch(UserRegistered("u-2"))
+
+        assert isinstance(outcome, Err)
+        assert isinstance(outcome.error, CircuitOpenError)
+        assert outcome.error.context["handler"] == "FailingHandler"
+        [observed] = health.health()
+        assert (observed.state, observed.calls, observed.failed, observed.rejected) == (
+            CircuitState.OPEN,
+            2,
+            2,
+            1,
+        )
+
+    async def test_dispatch_when_one_handler_fails_then_only_its_circuit_opens(self) -> None:
+        health = CircuitBreakerMiddleware(breaker=lambda: CircuitBreaker(window=1, minimum_calls=1))
+        failing, healthy = FailingHandler(ConnectionError("down")), AnyEventHandler()
+        bus = InMemoryMessageBus(middlewares=[health])
+        await bus.register_handler(failing, message_type=UserRegistered)
+        await bus.register_handler(healthy)
+
+        await bus.dispatch(UserRegistered("u-1"))
+        await bus.dispatch(UserRegistered("u-2"))
+
+        assert health.breaker(failing).state is CircuitState.OPEN
+        assert health.breaker(healthy).state is CircuitState.CLOSED
+        assert len(healthy.handled) == 2
+
+    async def test_dispatch_when_concurrency_limit_reached_then_rejects_extra_calls(
+        self,
+    ) -> None:
+        health = CircuitBreakerMiddleware(limiter=lambda: AdaptiveConcurrencyLimit(initial=1))
+        handler = BlockedHandler()
+        bus = InMemoryMessageBus(middlewares=[health])
+        await bus.register_handler(handler)
+        first = asyncio.ensure_future(bus.dispatch(UserRegistered("u-1")))
+        await asyncio.sleep(0)
+
+        [rejected] = await bus.dispatch(UserRegistered("u-2"))
+        handler.gate.set()
+        [handled] = await first
+
+        assert isinstance(rejected, Err)
+        assert isinstance(rejected.error, ConcurrencyLimitError)
+        assert handled.is_ok
+
+    async def test_dispatch_when_command_rejected_then_raises_circuit_open(self) -> None:
+        health = CircuitBreakerMiddleware(breaker=lambda: CircuitBreaker(window=1, minimum_calls=1))
+        bus = InMemoryMessageBus(middlewares=[health])
+        await bus.register_handler(FailingHandler(ConnectionError("down")), RegisterUser)
+        with pytest.raises(ConnectionError):
+            await bus.dispatch(RegisterUser("a@example.com"))
+
+        with pytest.raises(CircuitOpenError):
+            await bus.dispatch(RegisterUser("a@example.com"))
@@ -0,0 +1,151 @@
+from typing import Any
+from uuid import uuid4
+
+import pytest
+
+from forging_blocks.domain.messages.event import Event
+from forging_blocks.foundation.result import Err, Ok
+from forging_blocks.infrastructure.messaging.errors import RetriesExhaustedError
+from forging_blocks.infrastructure.messaging.in_memory_message_bus import InMemoryMessageBus
+from forging_blocks.infrastructure.messaging.retry import (
+    DeadLetter,
+    ExponentialBackoff,
+    InMemoryDeadLetterStore,
+    RetryScheduled,
+    ScheduledRetryMiddleware,
+)
+from forging_blocks.infrastructure.messaging.timing_wheel import TimingWheel
+from tests.forging_blocks.infrastructure.messaging.fakes import AnyEventHandler, UserRegistered
+
+
+class FlakyEventHandler(AnyEventHandler):
+    def __init__(self, failures: int) -> None:
+        super().__init__()
+        self.failures = failures
+
+    async def handle(self, message: Event[Any]) -> None:
+        if self.failures:
+            self.failures -= 1
+            raise ConnectionError("projection store unavailable")
+        await super().handle(message)
+
+
+def retrying(max_attempts: int) -> ScheduledRetryMiddleware:
+    return ScheduledRetryMiddleware(
+        wheel=TimingWheel(tick=0.001),
+        backoff=ExponentialBackoff(base=0.002, max_delay=0.01),
+        max_attempts=max_attempts,
+    )
+
+
+class TestExponentialBackoff:
+    @pytest.mark.parametrize(("attempt", "ceiling"), [(1, 0.1), (2, 0.2), (4, 0.8), (30, 5.0)])
+    def test_delay_when_jitter_is_maximal_then_grows_up_to_cap(
+        self, attempt: int, ceiling: float
+    ) -> None:
+        backoff = ExponentialBackoff(base=0.1, factor=2, max_delay=5, random=lambda: 1.0)
+
+        assert backoff.delay(attempt) == pytest.approx(ceiling)
+
+    def test_delay_when_jitter_is_minimal_then_returns_zero(self) -> None:
+        assert ExponentialBackoff(random=lambda: 0.0).delay(3) == 0.0
+
+
+class TestScheduledRetryMiddleware:
+    async def test_call_when_handler_recovers_then_retry_handles_event(self) -> None:
+        handler = FlakyEventHandler(failures=2)
+        retry = retrying(max_attempts=3)
+        bus = InMemoryMessageBus(middlewares=[retry])
+        await bus.register_handler(handler)
+        event = UserRegistered("u-1")
+
+        results = await bus.dispatch(event)
+        await retry.join()
+
+        scheduled = results[0].value
+        assert isinstance(scheduled, RetryScheduled)
+        assert (scheduled.message_id, scheduled.attempt) == (event.message_id, 1)
+        assert handler.handled == [event]
+        assert len(retry.dead_letters) == 0
+
+    async def test_call_when_retries_exhausted_then_adds_dead_letter(self) -> None:
+        handler = FlakyEventHandler(failures=5)
+        retry = retrying(max_attempts=3)
+        bus = InMemoryMessageBus(middlewares=[retry])
+        await bus.register_handler(handler)
+        event = UserRegistered("u-1")
+
+        await bus.dispatch(event)
+        await retry.join()
+
+        [letter] = retry.dead_letters
+        assert (letter.message, letter.attempts) == (event, 3)
+        assert isinstance(letter.error, RetriesExhaustedError)
+        assert letter.error.context["exception_type"] == "ConnectionError"
+        assert letter.error.context["message_id"] == str(event.message_id)
+        assert isinstance(letter.error.__cause__, ConnectionError)
+        assert handler.handled == []
+
+    async def test_call_when_single_attempt_then_dead_letters_and_raises(self) -> None:
+        retry = retrying(max_attempts=1)
+        bus = InMemoryMessageBus(middlewares=[retry])
+        await bus.register_handler(FlakyEventHandler(failures=1))
+
+        [outcome] = await bus.dispatch(UserRegistered("u-1"))
+
+        assert isinstance(outcome, Err)
+        assert len(retry.dead_letters) == 1
+        assert retry.pending == 0
+
+    async def test_replay_when_handler_recovered_then_handles_and_removes_letter(self) -> None:
+        handler = FlakyEventHandler(failures=2)
+        retry = retrying(max_attempts=2)
+        bus = InMemoryMessageBus(middlewares=[retry])
+        await bus.register_handler(handler)
+        await bus.dispatch(UserRegistered("u-1"))
+        await retry.join()
+        [letter] = retry.dead_letters
+
+        assert await retry.dead_letters.replay(letter.letter_id) is None
+
+        assert len(handler.handled) == 1
+        assert retry.dead_letters.get(letter.letter_id) is None
+
+    async def test_replay_when_handler_still_failing_then_raises_and_keeps_letter(
+        self,
+    ) -> None:
+        retry = retrying(max_attempts=1)
+        bus = InMemoryMessageBus(middlewares=[retry])
+        await bus.register_handler(FlakyEventHandler(failures=2))
+        await bus.dispatch(UserRegistered("u-1"))
+        [letter] = retry.dead_letters
+
+        with pytest.raises(ConnectionError):
+            await retry.dead_letters.replay(letter.letter_id)
+
+        assert list(retry.dead_letters) == [letter]
+
+    async def test_call_when_handler_succeeds_then_returns_its_result(self) -> None:
+        retry = retrying(max_attempts=3)
+        bus = InMemoryMessageBus(middlewares=[retry])
+        await bus.register_handler(AnyEventHandler())
+
+        assert await bus.dispatch(UserRegistered("u-1")) == [Ok(None)]
+        assert retry.pending == 0
+
+
+class TestInMemoryDeadLetterStore:
+    def test_remove_when_letter_unknown_then_raises_key_error(self) -> None:
+        with pytest.raises(KeyError):
+            InMemoryDeadLetterStore().remove(uuid4())
+
+    async def test_replay_when_added_without_replay_then_raises_value_error(self) -> None:
+        store = InMemoryDeadLetterStore()
+        message = UserRegistered("u-1")
+        letter = DeadLetter(message, RetriesExhaustedError.from_exception(message, 1, OSError()), 1)
+        store.add(letter)
+
+        with pytest.raises(ValueError):
+            await store.replay(letter.letter_id)
+
+        assert store.get(letter.letter_id) == letter
@@ -0,0 +1,78 @@
+import asyncio
+
+import pytest
+
+from forging_blocks.infrastructure.messaging.timing_wheel import TimingWheel
+
+
+class TestTimingWheel:
+    def test_advance_when_deadline_reached_then_fires_callback_once(self) -> None:
+        wheel = TimingWheel(tick=1, slots=4, levels=2)
+        fired: list[int] = []
+        wheel.schedule(3, lambda: fired.append(wheel.now))
+
+        wheel.advance(2)
+        assert fired == []
+        wheel.advance(5)
+
+        assert fired == [3]
+        assert len(wheel) == 0
+
+    def test_advance_when_timers_span_several_levels_then_fires_each_on_time(self) -> None:
+        wheel = TimingWheel(tick=1, slots=4, levels=3)
+        fired: list[tuple[int, int]] = []
+        for delay in (1, 4, 5, 17, 63):
+            wheel.schedule(delay, lambda delay=delay: fired.append((delay, wheel.now)))
+
+        wheel.advance(70)
+
+        assert fired == [(1, 1), (4, 4), (5, 5), (17, 17), (63, 63)]
+
+    def test_advance_when_delay_beyond_top_level_then_fires_on_time(self) -> None:
+        wheel = TimingWheel(tick=1, slots=4, levels=2)
+        fired: list[int] = []
+        wheel.advance(3)
+        wheel.schedule(100, lambda: fired.append(wheel.now))
+
+        wheel.advance(200)
+
+        assert fired == [103]
+
+    def test_advance_when_timer_cancelled_then_skips_callback(self) -> None:
+        wheel = TimingWheel(tick=1, slots=4)
+        fired: list[str] = []
+        wheel.schedule(2, lambda: fired.append("cancelled")).cancel()
+        wheel.schedule(2, lambda: fired.append("kept"))
+
+        wheel.advance(2)
+
+        assert fired == ["kept"]
+        assert len(wheel) == 0
+
+    def test_schedule_when_delay_is_fractional_then_rounds_up_to_a_tick(self) -> None:
+        wheel = TimingWheel(tick=0.5, slots=8)
+        fired: list[int] = []
+        wheel.schedule(0, lambda: fired.append(wheel.now))
+        wheel.schedule(1.2, lambda: fired.append(wheel.now))
+
+        wheel.advance(3)
+
+        assert fired == [1, 3]
+
+    async def test_schedule_when_loop_running_then_driver_fires_timers(self) -> None:
+        wheel = TimingWheel(tick=0.001)
+        fired = asyncio.Event()
+
+        wheel.schedule(0.005, fired.set)
+
+        await asyncio.wait_for(fired.wait(), 1)
+        await wheel.aclose()
+
+    @pytest.mark.parametrize(
+        "options", [{"tick": 0}, {"slots": 1}, {"levels": 0}], ids=["tick", "slots", "levels"]
+    )
+    def test_init_when_invalid_options_then_raises_value_error(
+        self, options: dict[str, float]
+    ) -> None:
+        with pytest.raises(ValueError):
+            TimingWheel(**options)  # type: ignore[arg-type]
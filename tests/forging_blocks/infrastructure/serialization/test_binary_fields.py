@@ -0,0 +1,73 @@
+from datetime import datetime, timezone
+from typing import Any
+from uuid import uuid4
+
+import pytest
+
+from forging_blocks.domain.aggregate_root import AggregateVersion
+from forging_blocks.infrastructure.serialization.binary_fields import (
+    BoolField,
+    BytesField,
+    DateTimeField,
+    FieldCodec,
+    FloatField,
+    IntField,
+    ListField,
+    OptionalField,
+    StrField,
+    UuidField,
+    ValueObjectField,
+    from_epoch_microseconds,
+    to_epoch_microseconds,
+)
+
+
+def round_trip(codec: FieldCodec[Any], value: Any) -> Any:
+    buffer = bytearray(b"\xff")
+    codec.encode(value, buffer)
+    decoded, offset = codec.decode(memoryview(buffer), 1)
+    assert offset == len(buffer)
+    return decoded
+
+
+class TestFieldCodecs:
+    @pytest.mark.parametrize(
+        ("codec", "value"),
+        [
+            (BoolField(), True),
+            (IntField(), -(2**63)),
+            (FloatField(), 12.5),
+            (StrField(), "héllo"),
+            (StrField(), ""),
+            (BytesField(), b"\x00\x01\x02"),
+            (UuidField(), uuid4()),
+            (DateTimeField(), datetime(2025, 6, 11, 19, 36, 6, 123456, tzinfo=timezone.utc)),
+            (OptionalField(StrField()), None),
+            (OptionalField(StrField()), "present"),
+            (ListField(IntField()), [3, 1, 2]),
+            (ListField(StrField()), []),
+        ],
+    )
+    def test_decode_when_value_encoded_then_round_trips(
+        self, codec: FieldCodec[Any], value: Any
+    ) -> None:
+        assert round_trip(codec, value) == value
+
+    def test_decode_when_value_object_encoded_then_rebuilds_value_object(self) -> None:
+        decoded = round_trip(ValueObjectField(AggregateVersion, IntField()), AggregateVersion(7))
+
+        assert decoded == AggregateVersion(7)
+        assert isinstance(decoded, AggregateVersion)
+
+    def test_encode_when_int_then_uses_eight_bytes(self) -> None:
+        buffer = bytearray()
+
+        IntField().encode(1, buffer)
+
+        assert bytes(buffer) == b"\x01" + b"\x00" * 7
+
+    def test_epoch_microseconds_when_converted_then_round_trips(self) -> None:
+        value = datetime(1969, 12, 31, 23, 59, 59, 999999, tzinfo=timezone.utc)
+
+        assert to_epoch_microseconds(value) == -1
+        assert from_epoch_microseconds(-1) == value
@@ -0,0 +1,160 @@
+from datetime import timedelta
+from typing import Any
+from uuid import UUID, uuid4
+
+import pytest
+
+from forging_blocks.domain.messages.event import Event
+from forging_blocks.domain.messages.message import MessageMetadata
+from forging_blocks.infrastructure.serialization.binary_fields import (
+    FloatField,
+    ListField,
+    StrField,
+    UuidField,
+)
+from forging_blocks.infrastructure.serialization.binary_message_codec import (
+    BinaryMessageCodec,
+    MessageSchema,
+    MessageSchemaNotFoundError,
+    UnsupportedFormatVersionError,
+)
+
+
+class OrderCreated(Event[dict[str, Any]]):
+    def __init__(
+        self,
+        order_id: UUID,
+        total: float,
+        items: list[str],
+        metadata: MessageMetadata | None = None,
+    ):
+        super().__init__(metadata)
+        self._order_id = order_id
+        self._total = total
+        self._items = items
+
+    @property
+    def value(self) -> dict[str, Any]:
+        return self._payload
+
+    @property
+    def _payload(self) -> dict[str, Any]:
+        return {"order_id": self._order_id, "total": self._total, "items": self._items}
+
+
+class OrderShipped(Event[str]):
+    def __init__(self, carrier: str, metadata: MessageMetadata | None = None):
+        super().__init__(metadata)
+        self._carrier = carrier
+
+    @property
+    def value(self) -> str:
+        return self._carrier
+
+    @property
+    def _payload(self) -> dict[str, Any]:
+        return {"carrier": self._carrier}
+
+
+ORDER_CREATED_SCHEMA = MessageSchema(
+    OrderCreated,
+    {"order_id": UuidField(), "total": FloatField(), "items": ListField(StrField())},
+)
+ORDER_SHIPPED_SCHEMA = MessageSchema(OrderShipped, {"carrier": StrField()})
+
+
+@pytest.fixture
+def codec() -> BinaryMessageCodec:
+    return BinaryMessageCodec([ORDER_CREATED_SCHEMA, ORDER_SHIPPED_SCHEMA])
+
+
+class TestMessageSchema:
+    def test_message_type_when_not_given_then_defaults_to_class_name(self) -> None:
+        assert ORDER_CREATED_SCHEMA.message_type == "OrderCreated"
+        assert ORDER_CREATED_SCHEMA.field_names == ("order_id", "total", "items")
+
+    def test_message_type_when_given_then_uses_it(self) -> None:
+        schema = MessageSchema(OrderShipped, {"carrier": StrField()}, message_type="Shipped")
+
+        assert schema.message_type == "Shipped"
+
+
+class TestBinaryMessageCodec:
+    def test_decode_when_message_encoded_then_round_trips_payload_and_metadata(
+        self, codec: BinaryMessageCodec
+    ) -> None:
+        message = OrderCreated(uuid4(), 12.5, ["book", "pen"])
+
+        decoded = codec.decode(codec.encode(message))
+
+        assert isinstance(decoded, OrderCreated)
+        assert decoded == message
+        assert decoded.payload == message.payload
+        assert decoded.metadata == message.metadata
+
+    def test_decode_when_message_has_deadline_then_round_trips_it(
+        self, codec: BinaryMessageCodec
+    ) -> None:
+        message = OrderShipped("post", MessageMetadata("OrderShipped", ttl=timedelta(seconds=5)))
+
+        decoded = codec.decode(codec.encode(message))
+
+        assert decoded.metadata.deadline == message.metadata.deadline is not None
+        assert codec.decode(codec.encode(OrderShipped("post"))).metadata.deadline is None
+
+    def test_encode_when_called_twice_then_reuses_cached_frame(
+        self, codec: BinaryMessageCodec
+    ) -> None:
+        message = OrderShipped("post")
+
+        assert codec.encode(message) is codec.encode(message)
+
+    def test_decode_when_memoryview_given_then_decodes(self, codec: BinaryMessageCodec) -> None:
+        message = OrderShipped("post")
+
+        decoded = codec.decode(memoryview(codec.encode(message)))
+
+        assert decoded.payload == {"carrier": "post"}
+
+    def test_decode_from_when_frames_concatenated_then_returns_next_offset(
+        self, codec: BinaryMessageCodec
+    ) -> None:
+        first = OrderShipped("post")
+        second = OrderCreated(uuid4(), 3.0, [])
+        buffer = bytearray()
+        codec.encode_into(first, buffer)
+        first_size = len(buffer)
+        codec.encode_into(second, buffer)
+
+        decoded, offset = codec.decode_from(memoryview(buffer), 0)
+
+        assert decoded == first
+        assert offset == first_size
+        assert list(codec.iter_decode(buffer)) == [first, second]
+
+    def test_encode_when_schema_not_registered_then_raises(self) -> None:
+        codec = BinaryMessageCodec([ORDER_SHIPPED_SCHEMA])
+
+        with pytest.raises(MessageSchemaNotFoundError):
+            codec.encode(OrderCreated(uuid4(), 1.0, []))
+
+    def test_decode_when_schema_not_registered_then_raises(self, codec: BinaryMessageCodec) -> None:
+        data = codec.encode(OrderShipped("post"))
+
+        with pytest.raises(MessageSchemaNotFoundError):
+            BinaryMessageCodec([ORDER_CREATED_SCHEMA]).decode(data)
+
+    def test_decode_when_format_version_unknown_then_raises(
+        self, codec: BinaryMessageCodec
+    ) -> None:
+        data = bytearray(codec.encode(OrderShipped("post")))
+        data[0] = 99
+
+        with pytest.raises(UnsupportedFormatVersionError):
+            codec.decode(data)
+
+    def test_register_when_schema_added_then_encodes_new_type(self) -> None:
+        codec = BinaryMessageCodec()
+        codec.register(ORDER_SHIPPED_SCHEMA)
+
+        assert codec.schema_for("OrderShipped") is ORDER_SHIPPED_SCHEMA
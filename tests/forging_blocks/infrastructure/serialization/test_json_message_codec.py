@@ -0,0 +1,68 @@
+import io
+import json
+from typing import Any
+
+import pytest
+
+from forging_blocks.domain.messages.event import Event
+from forging_blocks.domain.messages.message import MessageMetadata
+from forging_blocks.infrastructure.serialization.json_message_codec import JsonMessageCodec
+from forging_blocks.infrastructure.serialization.message_registry import (
+    MessageRegistry,
+    MessageTypeNotRegisteredError,
+)
+
+
+class PriceChanged(Event[float]):
+    def __init__(self, sku: str, price: float, metadata: MessageMetadata | None = None):
+        super().__init__(metadata)
+        self._sku = sku
+        self._price = price
+
+    @property
+    def value(self) -> float:
+        return self._price
+
+    @property
+    def _payload(self) -> dict[str, Any]:
+        return {"sku": self._sku, "price": self._price}
+
+
+@pytest.fixture
+def codec() -> JsonMessageCodec:
+    return JsonMessageCodec(MessageRegistry([PriceChanged]))
+
+
+class TestJsonMessageCodec:
+    def test_encode_when_called_then_writes_to_dict_as_json(self, codec: JsonMessageCodec) -> None:
+        event = PriceChanged("sku-1", 9.5)
+
+        assert json.loads(codec.encode(event)) == event.to_dict()
+
+    def test_decode_when_bytes_or_str_then_rebuilds_message(self, codec: JsonMessageCodec) -> None:
+        event = PriceChanged("sku-1", 9.5)
+        data = codec.encode(event)
+
+        from_bytes = codec.decode(data)
+        from_str = codec.decode(data.decode("utf-8"))
+
+        assert from_bytes == event == from_str
+        assert from_bytes.payload == {"sku": "sku-1", "price": 9.5}
+
+    def test_iter_decode_when_ndjson_stream_then_yields_messages_in_order(
+        self, codec: JsonMessageCodec
+    ) -> None:
+        events = [PriceChanged(f"sku-{index}", float(index)) for index in range(3)]
+        archive = io.BytesIO(b"".join(codec.encode_lines(events)) + b"\n")
+
+        decoded = list(codec.iter_decode(archive))
+
+        assert decoded == events
+        assert [event.payload["sku"] for event in decoded] == ["sku-0", "sku-1", "sku-2"]
+
+    def test_iter_decode_when_type_not_registered_then_raises(self) -> None:
+        data = JsonMessageCodec(MessageRegistry([PriceChanged])).encode(PriceChanged("a", 1.0))
+        codec = JsonMessageCodec(MessageRegistry())
+
+        with pytest.raises(MessageTypeNotRegisteredError):
+            list(codec.iter_decode([data]))
@@ -0,0 +1,74 @@
+from typing import Any
+
+import pytest
+
+from forging_blocks.domain.messages.command import Command
+from forging_blocks.domain.messages.event import Event
+from forging_blocks.domain.messages.message import MessageMetadata
+from forging_blocks.infrastructure.serialization.message_registry import (
+    MessageRegistry,
+    MessageTypeNotRegisteredError,
+)
+
+
+class UserRegistered(Event[str]):
+    def __init__(self, email: str, metadata: MessageMetadata | None = None):
+        super().__init__(metadata)
+        self._email = email
+
+    @property
+    def value(self) -> str:
+        return self._email
+
+    @property
+    def _payload(self) -> dict[str, Any]:
+        return {"email": self._email}
+
+
+class RegisterUser(Command[str]):
+    def __init__(self, email: str, metadata: MessageMetadata | None = None):
+        super().__init__(metadata)
+        self._email = email
+
+    @property
+    def value(self) -> str:
+        return self._email
+
+    @property
+    def _payload(self) -> dict[str, Any]:
+        return {"email": self._email}
+
+
+class TestMessageRegistry:
+    def test_register_when_used_as_decorator_then_returns_class(self) -> None:
+        registry = MessageRegistry()
+
+        registered = registry.register(UserRegistered)
+
+        assert registered is UserRegistered
+        assert "UserRegistered" in registry
+        assert len(registry) == 1
+
+    def test_register_when_message_type_given_then_uses_it(self) -> None:
+        registry = MessageRegistry()
+
+        registry.register(UserRegistered, message_type="users.registered")
+
+        assert registry.message_class_for("users.registered") is UserRegistered
+        assert "UserRegistered" not in registry
+
+    def test_from_dict_when_type_registered_then_rebuilds_message(self) -> None:
+        registry = MessageRegistry([UserRegistered, RegisterUser])
+        event = UserRegistered("ada@example.com")
+
+        rebuilt = registry.from_dict(event.to_dict())
+
+        assert isinstance(rebuilt, UserRegistered)
+        assert rebuilt == event
+        assert rebuilt.metadata.causation_id == event.metadata.causation_id
+
+    def test_from_dict_when_type_not_registered_then_raises(self) -> None:
+        registry = MessageRegistry([RegisterUser])
+
+        with pytest.raises(MessageTypeNotRegisteredError):
+            registry.from_dict(UserRegistered("ada@example.com").to_dict())